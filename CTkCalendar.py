@@ -1,13 +1,28 @@
 import customtkinter as ctk
 
-from typing import Any, Union, Tuple
+from typing import Any, Union, Tuple, TYPE_CHECKING
 
 # --- Imports de fechas ---
 import datetime
-from babel.dates import get_day_names, get_month_names
+import calendar
+from locale_data import get_locale_data
 from calendar_view import CalendarView
+from canvas_view import CanvasCalendarView
 from selection_manager import SelectionManager
 from event_manager import EventManager
+from event_store import EventStore
+from ingestion import EventIngestor
+from widget_pool import WidgetPool
+from tooltip import TooltipManager
+from event_list_popup import EventListPopup
+from timeline_view import TimelineView
+from year_view import YearView
+from instrumentation import Instrumentation
+
+if TYPE_CHECKING:
+    # Funciones opcionales: se importan al usarlas para no cargar asyncio ni sqlite3 al arrancar
+    from event_provider import EventProvider
+    from sqlite_storage import SQLiteStorage
 
 # --- Constantes ---
 DEFAULT_BTN: dict = {
@@ -42,6 +57,13 @@ class CTkCalendar(ctk.CTkFrame):
         day_number_font: Union[tuple, ctk.CTkFont, None] = None,
         # Lenguaje
         locale: str = 'en',
+        # Modo de renderizado: "widgets" (un CTkFrame por celda) o "canvas" (todo el mes en un tk.Canvas)
+        render_mode: str = 'widgets',
+        # Precarga de meses vecinos (solo modo widgets): cuántos meses a cada lado y máximo de cuadrículas fuera de pantalla
+        prefetch_months: int = 0,
+        max_prefetch_buffers: Union[int, None] = None,
+        # Modelo de eventos; pasar el mismo EventStore a varios calendarios hace que compartan eventos y tags
+        event_store: Union[EventStore, None] = None,
         
         **kwargs
     ):
@@ -51,18 +73,19 @@ class CTkCalendar(ctk.CTkFrame):
         )
         self.pack_propagate(False)
         self.grid_propagate(False)
+        if render_mode not in ('widgets', 'canvas'):
+            raise ValueError("render_mode debe ser 'widgets' o 'canvas'.")
+        self.render_mode = render_mode
         # --- Variables ---
         self.locale = locale
         self.current_date = datetime.date.today()
         self.current_month = self.current_date.month
-        self.current_month_name = get_month_names('wide', locale=locale)[self.current_date.month]
+        self.locale_data = get_locale_data(locale)  # caché de proceso: babel solo se importa la primera vez
+        self.current_month_name = self.locale_data.month_names[self.current_date.month]
         self.current_year = self.current_date.year
-        self.days_name_abbr = get_day_names('abbreviated', locale=locale)
-        l=[]
-        for i in range(len(self.days_name_abbr)):
-            l.append(self.days_name_abbr[i])
+        # La cuadrícula empieza en domingo
+        l = list(self.locale_data.day_names_abbr)
         self.days_name_abbr = l[-1:] + l[:-1]
-        self.events: dict[datetime.date, list[dict]] = {}
 
         # --- Grid ---
         self.grid_rowconfigure(0, weight=0)  # header
@@ -72,9 +95,24 @@ class CTkCalendar(ctk.CTkFrame):
         self.fg_color = fg_color
 
         # --- Clases auxiliares ---
-        self.event_manager = EventManager(self)
+        self.metrics = Instrumentation()  # desactivada hasta enable_instrumentation()
+        self.tooltip_manager = TooltipManager(self)
+        self.event_list_popup = EventListPopup(self)
+        self.widget_pool = WidgetPool(self)
+        self.event_manager = EventManager(self, store=event_store)
+        self.event_store = self.event_manager.store
+        self.ingestor = None  # cola de carga desde hilos, ver start_ingestion()
+        self.event_provider = None  # carga de eventos bajo demanda, ver set_event_provider()
+        self.storage = None  # almacenamiento persistente conectado, ver attach_storage()
         self.selection_manager = SelectionManager(self)
-        self.calendar_view = CalendarView(self)
+        self._event_click_callbacks: list = []  # ver on_event_click()
+        self.view_mode = 'month'  # "month", "week", "day" o "year", ver set_view()
+        self.timeline_view = None  # se crea la primera vez que se pide la vista de semana o de día
+        self.year_view = None  # mapa de calor del año, se crea la primera vez que se pide
+        if render_mode == 'canvas':
+            self.calendar_view = CanvasCalendarView(self)
+        else:
+            self.calendar_view = CalendarView(self, prefetch_months=prefetch_months, max_prefetch_buffers=max_prefetch_buffers)
 
         # --- Header ---
         self.header_color = header_color
@@ -91,7 +129,10 @@ class CTkCalendar(ctk.CTkFrame):
         self.days_label_text_color = days_label_text_color
         self.selected_day_border_color = selected_day_border_color
         self.day_number_font = day_number_font
-        self._days_frame()
+        if self.render_mode == 'canvas':
+            self._days_canvas()
+        else:
+            self._days_frame()
 
         # --- Configurar altura y evitar flicking ---
         self.update_idletasks()
@@ -143,20 +184,27 @@ class CTkCalendar(ctk.CTkFrame):
         """Función que retorna el frame de los días, compuesto por los nombres abreviados de los días junto con los 42 frames donde
         irán las fechas, llama a _fill_calendar para rellenar las celdas.
         """
-        self.days_frame = ctk.CTkFrame(master=self, fg_color=self.fg_color, corner_radius=0)
-        self.days_frame.grid(row=1, column=0, sticky='nsew')
+        self.days_frame, self.day_frames, self.day_nums = self._build_days_grid()
+
+
+    def _build_days_grid(self):
+        """Construye un frame de días (nombres + 42 celdas) y retorna (days_frame, day_frames, day_nums).
+        También lo usa CalendarView para crear las cuadrículas de los meses precargados.
+        """
+        days_frame = ctk.CTkFrame(master=self, fg_color=self.fg_color, corner_radius=0)
+        days_frame.grid(row=1, column=0, sticky='nsew')
 
-        self.day_nums = []
-        self.day_frames = []
+        day_nums = []
+        day_frames = []
 
         # --- Configurar columnas con uniformidad ---
         for j in range(7):
             # El parámetro 'uniform' garantiza que todas las columnas tengan exactamente el mismo ancho relativo
-            self.days_frame.columnconfigure(index=j, weight=1, uniform="col")
+            days_frame.columnconfigure(index=j, weight=1, uniform="col")
 
         # --- Day Names ---
         for j in range(7):
-            day_name = ctk.CTkLabel(master=self.days_frame, text=self.days_name_abbr[j].title(), font=self.days_font, text_color=self.days_label_text_color,
+            day_name = ctk.CTkLabel(master=days_frame, text=self.days_name_abbr[j].title(), font=self.days_font, text_color=self.days_label_text_color,
                                     height=0, width=0)
             # Fila 0 para los nombres de los días
             day_name.grid(row=0, column=j, sticky='ew', padx=1 if j == 0 else (0, 1), pady=2)
@@ -164,14 +212,14 @@ class CTkCalendar(ctk.CTkFrame):
         # --- Configurar 6 filas para los días (filas 1 a 6) ---
         # uniform="row" fuerza que todas tengan igual altura incluso si un mes usa solo 5 filas
         for i in range(1, 7):
-            self.days_frame.rowconfigure(index=i, weight=1, uniform="row")
+            days_frame.rowconfigure(index=i, weight=1, uniform="row")
 
             for j in range(7):
                 padx = 1 if j == 0 else (0, 1)
                 pady = (0, 1)
 
                 # Celda de día
-                day_frame = ctk.CTkFrame(master=self.days_frame, corner_radius=0, fg_color=self.days_fg_color, cursor='hand2', border_width=0,
+                day_frame = ctk.CTkFrame(master=days_frame, corner_radius=0, fg_color=self.days_fg_color, cursor='hand2', border_width=0,
                                          border_color=self.selected_day_border_color)
                 day_frame.grid(row=i, column=j, padx=padx, pady=pady, sticky='nsew')
                 day_frame.columnconfigure(index=0, weight=1)
@@ -182,8 +230,8 @@ class CTkCalendar(ctk.CTkFrame):
                 day_number.grid(row=0, column=0, sticky='ew', padx=10, pady=(3, 0))
 
                 # Bindings
-                day_frame.bind('<Button-1>', self.selection_manager.handle_click)
-                day_number.bind('<Button-1>', self.selection_manager.handle_click)
+                self.selection_manager.bind_cell(day_frame)
+                self.selection_manager.bind_cell(day_number)
 
                 # Atributos personalizados
                 day_frame.date = None
@@ -192,19 +240,113 @@ class CTkCalendar(ctk.CTkFrame):
                 day_number.is_selected = False
 
                 # Guardar referencias
-                self.day_nums.append(day_number)
-                self.day_frames.append(day_frame)
+                day_nums.append(day_number)
+                day_frames.append(day_frame)
+
+        if self.metrics.enabled:
+            self.metrics.count("widgets_created", 1 + 7 + 2 * 42)
+        return days_frame, day_frames, day_nums
+
+
+    def _days_canvas(self):
+        """Versión ligera de _days_frame: el mes entero se dibuja en un único tk.Canvas y las celdas son objetos
+        CanvasCell (sin widgets), que se guardan en day_frames/day_nums para que el resto de clases no distinga el modo.
+        """
+        self.days_frame = ctk.CTkFrame(master=self, fg_color=self.fg_color, corner_radius=0)
+        self.days_frame.grid(row=1, column=0, sticky='nsew')
+
+        cells = self.calendar_view.build(self.days_frame)
+        self.day_frames = cells
+        self.day_nums = cells
 
 
     # --------------------------------------------------
     # --------------- [FUNCIONAMIENTO] -----------------
     # --------------------------------------------------
     def _change_month(self, delta):
-        self.calendar_view.change_month(delta)
+        if self.view_mode != 'month':
+            self.active_view.shift(delta)
+        else:
+            self.calendar_view.change_month(delta)
 
 
     def _change_year(self, delta):
-        self.calendar_view.change_year(delta)
+        if self.view_mode != 'month':
+            self.active_view.shift_years(delta)
+        else:
+            self.calendar_view.change_year(delta)
+
+
+    @property
+    def active_view(self) -> Union[TimelineView, YearView, None]:
+        """Vista mostrada en lugar de la cuadrícula del mes (línea de tiempo o año), o None en la vista de mes."""
+        if self.view_mode == 'year':
+            return self.year_view
+        if self.view_mode in ('week', 'day'):
+            return self.timeline_view
+        return None
+
+
+    def set_view(self, mode: str, date_obj: Union[datetime.date, None] = None):
+        """
+        Cambia entre la cuadrícula del mes ("month"), la línea de tiempo de la semana ("week") o del día ("day")
+        con los eventos con hora, y el mapa de calor del año ("year"). Fuera de la vista de mes las flechas del
+        header avanzan semanas, días o años. `date_obj` indica qué mostrar; por defecto, la fecha de la vista actual.
+        """
+        if mode not in ('month', 'week', 'day', 'year'):
+            raise ValueError("mode debe ser 'month', 'week', 'day' o 'year'.")
+        if date_obj is not None and not isinstance(date_obj, datetime.date):
+            raise TypeError("date_obj debe ser datetime.date")
+
+        current = self.active_view
+        if current is None:
+            date_obj = date_obj or self.current_date
+            if mode != 'month':
+                self.days_frame.grid_remove()
+        else:
+            date_obj = date_obj or current.date
+            current.hide()
+        self.view_mode = mode
+
+        if mode == 'month':
+            if current is not None:
+                self.days_frame.grid()
+            self.goto(date_obj)
+        elif mode == 'year':
+            if self.year_view is None:
+                self.year_view = YearView(self)
+            self.year_view.show(date_obj)
+        else:
+            if self.timeline_view is None:
+                self.timeline_view = TimelineView(self)
+            self.timeline_view.show(mode, date_obj)
+
+
+    def goto(self, date_obj: datetime.date):
+        """
+        Muestra directamente el mes de `date_obj` (sin pasar por los meses intermedios). En la vista de semana,
+        día o año se queda en esa vista y muestra la semana, el día o el año de `date_obj`.
+        """
+        if not isinstance(date_obj, datetime.date):
+            raise TypeError("date_obj debe ser datetime.date")
+        view = self.active_view
+        if view is not None:
+            view.set_date(date_obj)
+        else:
+            self.calendar_view.goto(date_obj)
+
+
+    def set_month(self, year: int, month: int):
+        """
+        Muestra directamente el mes indicado, conservando el día actual (el de la vista mostrada) si existe en ese mes.
+        Como `goto`, en la vista de semana, día o año se queda en esa vista.
+        """
+        if not isinstance(year, int) or not isinstance(month, int) or not 1 <= month <= 12:
+            raise ValueError("year debe ser un entero y month un entero entre 1 y 12.")
+        view = self.active_view
+        current = view.date if view is not None else self.current_date
+        day = min(current.day, calendar.monthrange(year, month)[1])
+        self.goto(datetime.date(year, month, day))
 
 
     # --- Visuales ---
@@ -221,3 +363,156 @@ class CTkCalendar(ctk.CTkFrame):
         self.days_frame.grid_propagate(True)
         self.update_idletasks()
 
+
+    # --------------------------------------------------
+    # ------------------ [SELECCIÓN] -------------------
+    # --------------------------------------------------
+    def get_selection(self) -> list:
+        """Rangos de fechas seleccionados [(inicio, fin), ...] (clic, arrastre, shift-clic o ctrl-clic)."""
+        return self.selection_manager.get_selection()
+
+
+    def on_selection_change(self, callback):
+        """Registra `callback(rangos)`, llamado cada vez que cambia la selección. Retorna el callback."""
+        return self.selection_manager.subscribe(callback)
+
+
+    def on_event_click(self, callback):
+        """
+        Registra `callback(evento, fecha)`, llamado al pulsar un evento en cualquier vista; `evento` es el dict
+        del evento (como en `get_events`). Retorna el callback.
+        """
+        self._event_click_callbacks.append(callback)
+        return callback
+
+
+    def remove_event_click(self, callback):
+        if callback in self._event_click_callbacks:
+            self._event_click_callbacks.remove(callback)
+
+
+    def _event_clicked(self, ev, date_obj: datetime.date):
+        """Avisa a los callbacks de `on_event_click` de que se pulsó el registro `ev` en la fecha `date_obj`."""
+        if not self._event_click_callbacks:
+            return
+        data = ev.to_dict()
+        for callback in list(self._event_click_callbacks):
+            callback(data, date_obj)
+
+
+    # --------------------------------------------------
+    # -------------- [INSTRUMENTACIÓN] -----------------
+    # --------------------------------------------------
+    def enable_instrumentation(self, callback=None):
+        """
+        Activa contadores (widgets creados/destruidos, celdas repintadas, llamadas a configure, tooltips mostrados)
+        e histogramas de tiempos (fill_calendar, render_events_in_frame, render_visible_date, navegación).
+        `callback(kind, name, value)` recibe además cada medida en el momento.
+        """
+        self.metrics.enable(callback)
+
+
+    def disable_instrumentation(self):
+        """Desactiva la instrumentación conservando lo medido hasta ahora."""
+        self.metrics.disable()
+
+
+    def get_metrics(self) -> dict:
+        """Retorna {"counters": {...}, "histograms": {nombre: {count, total_ms, mean_ms, max_ms, buckets}}}."""
+        return self.metrics.snapshot()
+
+
+    def reset_metrics(self):
+        self.metrics.reset()
+
+
+    # --------------------------------------------------
+    # ---------------- [CARGA EN HILOS] ----------------
+    # --------------------------------------------------
+    def start_ingestion(self, **options) -> EventIngestor:
+        """
+        Crea (una vez) y arranca la cola thread-safe de carga de eventos y la retorna; los hilos de trabajo
+        encolan en ella y el calendario la vacía en porciones de tiempo acotadas. Llamar desde el hilo de Tk.
+        Las opciones (max_pending, slice_ms, interval_ms, idle_interval_ms, on_done, on_error) van a `EventIngestor`.
+        """
+        if self.ingestor is None:
+            self.ingestor = EventIngestor(self, **options)
+        elif options:
+            raise ValueError("La cola de carga ya existe; las opciones solo se aceptan la primera vez.")
+        self.ingestor.start()
+        return self.ingestor
+
+
+    def stop_ingestion(self, drain: bool = False):
+        """Detiene la cola de carga; con `drain=True` aplica antes todo lo pendiente."""
+        if self.ingestor is not None:
+            self.ingestor.stop(drain)
+
+
+    # --------------------------------------------------
+    # -------------- [PROVEEDOR DE EVENTOS] ------------
+    # --------------------------------------------------
+    def set_event_provider(self, provider, **options) -> Union["EventProvider", None]:
+        """
+        Registra `provider(start, end)` (normal o async) para cargar bajo demanda los eventos de los meses que se
+        muestran, en segundo plano y con caché LRU por mes. Con `provider=None` se quita el actual y sus eventos.
+        Las opciones (cache_months, prefetch_months, max_workers, on_error) van a `EventProvider`.
+        """
+        if self.event_provider is not None:
+            self.event_provider.close()
+            self.event_provider.clear()
+            self.event_provider = None
+        if provider is not None:
+            from event_provider import EventProvider
+            self.event_provider = EventProvider(self, provider, **options)
+            self.calendar_view.request_events()
+        return self.event_provider
+
+
+    def attach_storage(self, storage: Union["SQLiteStorage", None], **options):
+        """
+        Conecta un `SQLiteStorage`: carga sus tags y lo usa como proveedor de eventos, de modo que solo se leen
+        los meses que se muestran. Las escrituras hechas en el storage (desde el hilo de Tk) recargan los meses
+        afectados; mientras está conectado, editar o borrar con `event_manager` un evento cargado escribe en el storage
+        y añadir eventos por `event_manager` lanza ValueError (se añaden con `storage.add_event`).
+        Con `storage=None` se desconecta. Las opciones van a `set_event_provider`.
+        """
+        if self.storage is not None:
+            self.storage.unsubscribe(self._on_storage_change)
+            self.storage = None
+            self.set_event_provider(None)
+        if storage is None:
+            return
+        with self.event_store.batch():
+            for name, info in storage.get_tags().items():
+                self.event_store.add_tag(name, color=info["color"], desc=info["desc"], visible=info["visible"])
+        self.storage = storage
+        storage.subscribe(self._on_storage_change)
+        self.set_event_provider(storage.load_window, **options)
+
+
+    def _on_storage_change(self, dates):
+        if self.event_provider is not None:
+            self.event_provider.invalidate_dates(dates)
+
+
+    def destroy(self):
+        if self.storage is not None:
+            self.storage.unsubscribe(self._on_storage_change)
+        if self.event_provider is not None:
+            self.event_provider.close()
+        if self.ingestor is not None:
+            self.ingestor.stop()
+        self.calendar_view.close()
+        self.tooltip_manager.hide()
+        if self.metrics.enabled:
+            pending = [self]
+            destroyed = 0
+            while pending:
+                widget = pending.pop()
+                destroyed += 1
+                pending.extend(widget.winfo_children())
+            self.metrics.count("widgets_destroyed", destroyed)
+        self.event_manager.close()
+        super().destroy()
+
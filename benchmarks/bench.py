@@ -0,0 +1,229 @@
+"""
+Benchmarks de CTkCalendar y EventManager.
+
+Necesita un display; en un Linux sin escritorio se ejecuta con Xvfb:
+
+    xvfb-run -a python benchmarks/bench.py --output resultados.json
+    xvfb-run -a python benchmarks/bench.py --quick
+    python benchmarks/bench.py --compare base.json nuevo.json
+
+Los resultados se guardan en JSON (tiempos en milisegundos, más metadatos del commit y del entorno)
+para poder comparar entre commits con `--compare`.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import customtkinter as ctk
+from CTkCalendar import CTkCalendar
+
+TAGS = ("trabajo", "personal", "salud", "ocio")
+TODAY = datetime.date.today()
+
+
+# --------------------------------------------------
+# ------------------ [UTILIDADES] ------------------
+# --------------------------------------------------
+def measure(fn, repeat: int) -> dict:
+    """Ejecuta `fn` `repeat` veces y retorna mediana, mínimo y máximo en milisegundos."""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples), "max_ms": max(samples), "repeat": repeat}
+
+
+def count_widgets(widget) -> int:
+    """Cuenta recursivamente los widgets de Tk que cuelgan de `widget` (incluido)."""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def make_events(n: int, span_days: int, seed: int = 0) -> list[tuple]:
+    """Genera `n` eventos (fecha, name, desc, tag) repartidos en `span_days` días centrados en hoy."""
+    rnd = random.Random(seed)
+    first = TODAY - datetime.timedelta(days=span_days // 2)
+    return [
+        (first + datetime.timedelta(days=rnd.randrange(span_days)), f"Evento {i}", f"Descripción {i}", TAGS[i % len(TAGS)])
+        for i in range(n)
+    ]
+
+
+def new_calendar(root, render_mode: str = "widgets", **kwargs) -> CTkCalendar:
+    cal = CTkCalendar(root, width=800, height=600, render_mode=render_mode, **kwargs)
+    cal.pack(fill="both", expand=True)
+    for tag in TAGS:
+        cal.event_manager.add_tag(tag, color="#3A7FF6")
+    root.update()
+    return cal
+
+
+def navigate(cal: CTkCalendar, delta: int):
+    """Cambia de mes y pinta en el acto (sin esperar al after() con el que se agrupan las navegaciones)."""
+    view = cal.calendar_view
+    view.change_month(delta)
+    if view._render_job is not None:
+        cal.after_cancel(view._render_job)
+        view._render_target()
+    cal.update_idletasks()
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# --------------------------------------------------
+# ------------------ [BENCHMARKS] ------------------
+# --------------------------------------------------
+def bench_construction(root, results: dict, repeat: int):
+    for mode in ("widgets", "canvas"):
+        def build():
+            cal = new_calendar(root, mode)
+            cal.destroy()
+        results[f"construction[mode={mode}]"] = measure(build, repeat)
+
+
+def bench_navigation(root, results: dict, repeat: int, event_counts):
+    for mode in ("widgets", "canvas"):
+        for n in event_counts:
+            cal = new_calendar(root, mode)
+            # Eventos concentrados en los meses visitados para que la navegación los pinte
+            cal.event_manager.add_events(make_events(n, 90))
+            root.update()
+
+            results[f"fill_calendar[mode={mode},events={n}]"] = measure(cal.calendar_view.fill_calendar, repeat)
+
+            before = count_widgets(cal)
+            created = cal.widget_pool.created
+            step = iter([1, -1] * repeat)
+            entry = measure(lambda: navigate(cal, next(step)), repeat)
+            entry["widgets_before"] = before
+            entry["widgets_after"] = count_widgets(cal)
+            entry["pool_created"] = cal.widget_pool.created - created
+            results[f"change_month[mode={mode},events={n}]"] = entry
+            cal.destroy()
+
+
+def bench_ranges(root, results: dict, calls: int):
+    cal = new_calendar(root)
+    em = cal.event_manager
+    start = TODAY + datetime.timedelta(days=400)  # fuera del mes visible: mide el modelo, no el pintado
+
+    t0 = time.perf_counter()
+    for i in range(calls):
+        day = start + datetime.timedelta(days=i)
+        em.add_event_range(day, day + datetime.timedelta(days=30), f"Rango {i}", "", TAGS[i % len(TAGS)])
+    elapsed = time.perf_counter() - t0
+    results["add_event_range"] = {"calls": calls, "total_ms": elapsed * 1000, "ops_per_s": calls / elapsed}
+
+    t0 = time.perf_counter()
+    for i in range(calls):
+        day = start + datetime.timedelta(days=i)
+        em.add_recurring_event(day, day + datetime.timedelta(days=365), 7, f"Semanal {i}", "", TAGS[i % len(TAGS)])
+    elapsed = time.perf_counter() - t0
+    results["add_recurring_event"] = {"calls": calls, "total_ms": elapsed * 1000, "ops_per_s": calls / elapsed}
+    cal.destroy()
+
+
+def bench_queries(root, results: dict, repeat: int, sizes):
+    for n in sizes:
+        cal = new_calendar(root)
+        em = cal.event_manager
+        t0 = time.perf_counter()
+        em.add_events(make_events(n, 3650))
+        elapsed = time.perf_counter() - t0
+        results[f"add_events[n={n}]"] = {"total_ms": elapsed * 1000, "ops_per_s": n / elapsed}
+
+        results[f"get_upcoming_events[n={n}]"] = measure(lambda: em.get_upcoming_events(30, TODAY), repeat)
+        month_start = TODAY.replace(day=1)
+        month_end = month_start + datetime.timedelta(days=30)
+        results[f"get_events_by_tag[n={n},window=month]"] = measure(lambda: em.get_events_by_tag("salud", month_start, month_end), repeat)
+        results[f"get_events_by_tag[n={n},window=all]"] = measure(lambda: em.get_events_by_tag("salud"), repeat)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "eventos.json")
+            entry = measure(lambda: em.export_events(path), max(1, repeat // 5))
+            entry["bytes"] = os.path.getsize(path)
+            results[f"export_events[n={n}]"] = entry
+        cal.destroy()
+
+# --------------------------------------------------
+# ------------------ [COMPARACIÓN] -----------------
+# --------------------------------------------------
+def compare(old_path: str, new_path: str, threshold: float):
+    """Imprime el cociente nuevo/base de cada benchmark común y marca las regresiones."""
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)["results"]
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)["results"]
+
+    regressions = 0
+    for name in sorted(old.keys() & new.keys()):
+        key = "median_ms" if "median_ms" in old[name] else "total_ms"
+        if not old[name].get(key):
+            continue
+        ratio = new[name][key] / old[name][key]
+        mark = "  <-- regresión" if ratio > 1 + threshold else ""
+        regressions += bool(mark)
+        print(f"{name:55} {old[name][key]:10.3f} -> {new[name][key]:10.3f} ms  x{ratio:.2f}{mark}")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", "-o", default="benchmark_results.json", help="archivo JSON de salida")
+    parser.add_argument("--quick", action="store_true", help="tamaños pequeños (hasta 10^4 eventos)")
+    parser.add_argument("--repeat", type=int, default=20, help="repeticiones por medición")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NUEVO"), help="compara dos archivos de resultados")
+    parser.add_argument("--threshold", type=float, default=0.10, help="margen antes de marcar una regresión (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare(*args.compare, args.threshold)
+
+    sizes = [10 ** 3, 10 ** 4] if args.quick else [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+    event_counts = [0, 100] if args.quick else [0, 100, 10_000]
+
+    root = ctk.CTk()
+    root.geometry("900x700")
+    results: dict = {}
+    try:
+        bench_construction(root, results, args.repeat)
+        bench_navigation(root, results, args.repeat, event_counts)
+        bench_ranges(root, results, 200 if args.quick else 1000)
+        bench_queries(root, results, args.repeat, sizes)
+    finally:
+        root.destroy()
+
+    data = {
+        "meta": {
+            "commit": git_commit(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "customtkinter": ctk.__version__,
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
+    print(f"{len(results)} resultados guardados en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,75 +1,263 @@
-import customtkinter as ctk
 import datetime
 import calendar
 from datetime import timedelta
-from babel.dates import get_month_names
-from dateutil.relativedelta import relativedelta
+
+
+def add_months(date_obj: datetime.date, months: int) -> datetime.date:
+    """Suma meses a una fecha ajustando el día al último del mes si no existe (como relativedelta)."""
+    year, month = divmod(date_obj.year * 12 + date_obj.month - 1 + months, 12)
+    day = min(date_obj.day, calendar.monthrange(year, month + 1)[1])
+    return datetime.date(year, month + 1, day)
+
+
+class MonthBuffer:
+    """Cuadrícula de 42 celdas (frame de días + celdas + números) junto con el último estado pintado en ella."""
+
+    def __init__(self, days_frame, day_frames, day_nums):
+        self.days_frame = days_frame
+        self.day_frames = day_frames
+        self.day_nums = day_nums
+        self.cell_states: list[tuple | None] = [None] * 42  # último estado pintado de cada celda: (fecha, en_mes, hoy)
+        self.date_to_cell: dict = {}  # fecha visible -> celda
+        self.month: tuple[int, int] | None = None  # (año, mes) pintado
+
 
 class CalendarView:
-    def __init__(self, calendar):
+    def __init__(self, calendar, prefetch_months: int = 0, max_prefetch_buffers: int | None = None):
         self.calendar = calendar
+        self.active: MonthBuffer | None = None  # cuadrícula en pantalla
+        self.buffers: list[MonthBuffer] = []  # cuadrículas fuera de pantalla con meses precargados
+        self.prefetch_months = prefetch_months  # meses a cada lado que se preparan en segundo plano
+        # Límite de cuadrículas fuera de pantalla (cada una son 84 widgets más sus filas de eventos)
+        self.max_prefetch_buffers = 2 * prefetch_months if max_prefetch_buffers is None else max_prefetch_buffers
+        self._prefetch_job = None
+        self._render_job = None  # after() pendiente que pintará el mes objetivo
+        self._navigation_started = None  # instante de la primera navegación aún sin pintar (instrumentación)
+
+    @property
+    def cell_states(self) -> list[tuple | None]:
+        return self.active.cell_states if self.active else [None] * 42
+
+    @property
+    def date_to_cell(self) -> dict:
+        return self.active.date_to_cell if self.active else {}
 
     def fill_calendar(self):
-        """Rellena los 42 días visibles en el calendario."""
-        self.calendar.days_frame.grid_remove()
-        self.calendar.update_idletasks()
-
-        for frame in self.calendar.day_frames:
-            for child in frame.winfo_children():
-                if isinstance(child, ctk.CTkLabel):
-                    continue
-                child.destroy()
-            if hasattr(frame, "events_container") and frame.events_container is not None:
-                frame.events_container.destroy()
-                frame.events_container = None
-
-        first_day_weekday, num_days = calendar.monthrange(self.calendar.current_year, self.calendar.current_month)
-        first_day = datetime.date(self.calendar.current_year, self.calendar.current_month, 1)
-        last_day_month = datetime.date(self.calendar.current_year, self.calendar.current_month, num_days)
+        """
+        Rellena los 42 días visibles en el calendario.
 
-        days_to_subtract = (first_day_weekday + 1) % 7
-        start_date = first_day - timedelta(days=days_to_subtract)
+        Compara con el último estado pintado de cada celda y solo llama a `configure` en las que cambian;
+        los eventos se difieren igual mediante su firma en `render_events_in_frame`.
+        """
+        started = self.calendar.metrics.start()
+        if self.active is None:
+            self.active = MonthBuffer(self.calendar.days_frame, self.calendar.day_frames, self.calendar.day_nums)
+        self.fill_buffer(self.active, self.calendar.current_year, self.calendar.current_month)
+        self.request_events()
+        self.schedule_prefetch()
+        self.calendar.metrics.stop("fill_calendar", started)
+
+    def fill_buffer(self, buffer: MonthBuffer, year: int, month: int):
+        """Pinta el mes indicado en una cuadrícula, esté en pantalla o no."""
+        start_date, first_day, last_day_month = self.month_grid(year, month)
         current_date = start_date
 
-        for i, label in enumerate(self.calendar.day_nums):
-            frame = self.calendar.day_frames[i]
-            label.configure(text=current_date.day)
-            frame.date = label.date = current_date
+        today = datetime.date.today()
+        buffer.date_to_cell = {}
+        buffer.month = (year, month)
+        configures = 0
 
-            is_today = (current_date == datetime.date.today())
-            if current_date < first_day or current_date > last_day_month:
-                frame.configure(fg_color=self.calendar.disabled_days_fg_color, cursor='arrow')
-                label.configure(cursor='arrow')
-            else:
-                color = self.calendar.today_fg_color if is_today else 'white'
-                frame.configure(fg_color=color, cursor='hand2')
-                label.configure(cursor='hand2')
+        for i, label in enumerate(buffer.day_nums):
+            frame = buffer.day_frames[i]
+            buffer.date_to_cell[current_date] = frame
+
+            in_month = first_day <= current_date <= last_day_month
+            state = (current_date, in_month, current_date == today)
+            previous = buffer.cell_states[i]
+            if previous != state:
+                if previous is None or previous[0].day != current_date.day:
+                    label.configure(text=current_date.day)
+                    configures += 1
+                frame.date = label.date = current_date
+                frame.in_month = in_month
 
-            self.calendar.event_manager.render_events_in_frame(frame)
+                if previous is None or previous[1:] != state[1:]:
+                    if not in_month:
+                        frame.configure(fg_color=self.calendar.disabled_days_fg_color, cursor='arrow')
+                        label.configure(cursor='arrow')
+                    else:
+                        color = self.calendar.today_fg_color if state[2] else 'white'
+                        frame.configure(fg_color=color, cursor='hand2')
+                        label.configure(cursor='hand2')
+                    configures += 2
+                buffer.cell_states[i] = state
+
+            self.calendar.selection_manager.sync_cell(frame)
+            self.render_events(frame)
             current_date += timedelta(days=1)
 
-        self.calendar.days_frame.grid()
-        self.calendar.update_idletasks()
+        if self.calendar.metrics.enabled:
+            self.calendar.metrics.count("configure_calls", configures)
+
+    def month_grid(self, year: int | None = None, month: int | None = None) -> tuple[datetime.date, datetime.date, datetime.date]:
+        """Retorna (primera fecha visible, primer día del mes, último día del mes) de la cuadrícula de 42 días."""
+        year = self.calendar.current_year if year is None else year
+        month = self.calendar.current_month if month is None else month
+        first_day_weekday, num_days = calendar.monthrange(year, month)
+        first_day = datetime.date(year, month, 1)
+        last_day_month = datetime.date(year, month, num_days)
+
+        # La cuadrícula empieza en domingo
+        days_to_subtract = (first_day_weekday + 1) % 7
+        return first_day - timedelta(days=days_to_subtract), first_day, last_day_month
+
+    def request_events(self):
+        """Si hay un proveedor de eventos, le pide la ventana de 42 días del mes mostrado."""
+        provider = self.calendar.event_provider
+        if provider is not None:
+            start_date = self.month_grid()[0]
+            provider.show(start_date, start_date + timedelta(days=41))
+
+    def render_events(self, frame):
+        """Pinta los eventos de una celda visible."""
+        self.calendar.event_manager.render_events_in_frame(frame)
 
+    # --------------------------------------------------
+    # ----------------- [NAVEGACIÓN] -------------------
+    # --------------------------------------------------
     def change_month(self, delta_month: int):
-        self.calendar.update_idletasks()
-        self.calendar._suspend_redraw()
-        self.calendar.current_date += relativedelta(months=delta_month)
-        self.calendar.current_month = self.calendar.current_date.month
-        self.calendar.current_year = self.calendar.current_date.year
-        self.calendar.current_month_name = get_month_names('wide', locale=self.calendar.locale)[self.calendar.current_month]
-        self.calendar.month_label.configure(text=self.calendar.current_month_name.title())
-        self.calendar.year_label.configure(text=str(self.calendar.current_year))
-        self.calendar.after(35, self.fill_calendar)
+        self.goto(add_months(self.calendar.current_date, delta_month))
 
 
     def change_year(self, delta_year: int):
-        self.calendar.update_idletasks()
-        self.calendar._suspend_redraw()
-        self.calendar.current_date += relativedelta(years=delta_year)
+        self.goto(add_months(self.calendar.current_date, 12 * delta_year))
+
+
+    def goto(self, date_obj: datetime.date):
+        """
+        Cambia el mes mostrado al de `date_obj`. El header se actualiza al momento, pero el pintado se agrupa:
+        si llegan varias navegaciones seguidas se cancela el after() pendiente y solo se pinta el mes final.
+        Si no hay ninguna pendiente y el mes está precargado, se intercambia la cuadrícula sin esperar.
+        """
+        metrics = self.calendar.metrics
+        started = metrics.start()
+        if started is not None and self._navigation_started is None:
+            self._navigation_started = started  # inicio de la ráfaga, para medir la latencia hasta el pintado
+        pending = self._render_job is not None
+        if pending:
+            self.calendar.after_cancel(self._render_job)
+            self._render_job = None
+
+        prepared = None if pending else self._take_buffer(date_obj.year, date_obj.month)
+        if prepared is None and not pending:
+            self.calendar.update_idletasks()
+            self.calendar._suspend_redraw()
+
+        self.calendar.current_date = date_obj
         self.calendar.current_month = self.calendar.current_date.month
         self.calendar.current_year = self.calendar.current_date.year
-        self.calendar.current_month_name = get_month_names('wide', locale=self.calendar.locale)[self.calendar.current_month]
-        self.calendar.year_label.configure(text=str(self.calendar.current_year))
+        self.calendar.current_month_name = self.calendar.locale_data.month_names[self.calendar.current_month]
         self.calendar.month_label.configure(text=self.calendar.current_month_name.title())
-        self.calendar.after(35, self.fill_calendar)
+        self.calendar.year_label.configure(text=str(self.calendar.current_year))
+
+        if prepared is not None:
+            self._swap(prepared)
+            self.fill_calendar()  # solo corrige lo que cambió desde que se precargó
+            self._navigation_done()
+        else:
+            self._render_job = self.calendar.after(35, self._render_target)
+        metrics.stop("navigation", started)
+
+
+    def _render_target(self):
+        """Pinta el mes objetivo de la última navegación, usando su cuadrícula precargada si existe."""
+        self._render_job = None
+        prepared = self._take_buffer(self.calendar.current_year, self.calendar.current_month)
+        if prepared is not None:
+            self._swap(prepared)
+        self.fill_calendar()
+        self._navigation_done()
+
+
+    def close(self):
+        """Cancela el pintado y la precarga pendientes (al destruir el calendario, antes de que lleguen a ejecutarse)."""
+        for job in (self._render_job, self._prefetch_job):
+            if job is not None:
+                self.calendar.after_cancel(job)
+        self._render_job = self._prefetch_job = None
+
+
+    def _navigation_done(self):
+        """Registra el tiempo desde la primera navegación de la ráfaga hasta que el mes quedó pintado."""
+        self.calendar.metrics.stop("navigation_latency", self._navigation_started)
+        self._navigation_started = None
+
+    # --------------------------------------------------
+    # ----------------- [PRECARGA] ---------------------
+    # --------------------------------------------------
+    def schedule_prefetch(self):
+        """Programa en tiempo ocioso la preparación de los meses vecinos."""
+        if self.prefetch_months <= 0 or self.max_prefetch_buffers <= 0 or self._prefetch_job is not None:
+            return
+        self._prefetch_job = self.calendar.after_idle(self._prefetch_step)
+
+
+    def _wanted_months(self) -> list[tuple[int, int]]:
+        """Meses a precargar ordenados por cercanía: +1, -1, +2, -2, ..."""
+        months = []
+        for distance in range(1, self.prefetch_months + 1):
+            for sign in (1, -1):
+                date_obj = add_months(self.calendar.current_date, sign * distance)
+                months.append((date_obj.year, date_obj.month))
+        return months
+
+
+    def _prefetch_step(self):
+        """Prepara un mes vecino por llamada y se vuelve a programar hasta completar la precarga."""
+        self._prefetch_job = None
+        wanted = self._wanted_months()
+        prepared = {buffer.month for buffer in self.buffers}
+        for year, month in wanted:
+            if (year, month) in prepared:
+                continue
+            # Se reutiliza la cuadrícula de un mes que ya no interesa o se crea una si no se llegó al límite
+            spare = [buffer for buffer in self.buffers if buffer.month not in wanted]
+            if spare:
+                buffer = spare[0]
+            elif len(self.buffers) < self.max_prefetch_buffers:
+                buffer = self._new_buffer()
+            else:
+                return
+            self.fill_buffer(buffer, year, month)
+            self._prefetch_job = self.calendar.after_idle(self._prefetch_step)
+            return
+
+
+    def _new_buffer(self) -> MonthBuffer:
+        """Crea una cuadrícula fuera de pantalla."""
+        days_frame, day_frames, day_nums = self.calendar._build_days_grid()
+        days_frame.grid_remove()
+        buffer = MonthBuffer(days_frame, day_frames, day_nums)
+        self.buffers.append(buffer)
+        return buffer
+
+
+    def _take_buffer(self, year: int, month: int) -> MonthBuffer | None:
+        """Saca de la lista de precargadas la cuadrícula del mes indicado, si existe."""
+        for buffer in self.buffers:
+            if buffer.month == (year, month):
+                self.buffers.remove(buffer)
+                return buffer
+        return None
+
+
+    def _swap(self, buffer: MonthBuffer):
+        """Pone en pantalla una cuadrícula precargada y deja la actual como precargada."""
+        previous = self.active
+        previous.days_frame.grid_remove()
+        buffer.days_frame.grid()
+        self.active = buffer
+        self.calendar.days_frame = buffer.days_frame
+        self.calendar.day_frames = buffer.day_frames
+        self.calendar.day_nums = buffer.day_nums
+        self.buffers.append(previous)
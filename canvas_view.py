@@ -0,0 +1,351 @@
+import datetime
+import tkinter as tk
+import tkinter.font as tkfont
+import customtkinter as ctk
+from datetime import timedelta
+from calendar_view import CalendarView, MonthBuffer
+
+
+class CanvasCell:
+    """
+    Celda ligera del modo canvas. Imita lo que SelectionManager y EventManager usan de un CTkFrame
+    (`date`, `is_selected`, `configure(border_width=...)`), pero solo guarda ids de items del canvas.
+    """
+
+    def __init__(self, view, index: int):
+        self.view = view
+        self.index = index
+        self.date = None
+        self.in_month = False
+        self.is_selected = False
+        self.border_width = 0
+        self.rect = self.number = self.border = None  # ids de items del canvas
+        self.chips: list[tuple[int, int]] = []  # (rectángulo, texto) reutilizados entre meses
+        self.chip_events: list = []  # eventos pintados, en el mismo orden que los chips
+        self.more = 0  # eventos ocultos tras el chip "+N más" (que va justo después de chip_events)
+        self.events_signature = None
+
+    def configure(self, **kwargs):
+        if "border_width" in kwargs:
+            self.border_width = kwargs["border_width"]
+            self.view.draw_border(self)
+
+
+class CanvasCalendarView(CalendarView):
+    """
+    Vista del mes dibujada sobre un único tk.Canvas (render_mode="canvas").
+
+    Celdas, números, día actual, borde de selección y chips de eventos son items del canvas que se crean una
+    vez y se reconfiguran; los clics y el hover se resuelven por coordenadas.
+    """
+
+    HEADER_HEIGHT = 24
+    NUMBER_HEIGHT = 22
+    CHIP_HEIGHT = 18
+    CHIP_GAP = 2
+    MIN_CELL_WIDTH = 60
+    MIN_CELL_HEIGHT = 60
+
+    def __init__(self, calendar):
+        super().__init__(calendar)
+        self.canvas = None
+        self.cells: list[CanvasCell] = []
+        self.day_names: list[int] = []
+        self.cell_width = self.MIN_CELL_WIDTH
+        self.cell_height = self.MIN_CELL_HEIGHT
+        self.cursor = None
+        self.hover_chip = None  # (celda, índice de chip) bajo el puntero
+
+    # --------------------------------------------------
+    # ---------------- [CONSTRUCCIÓN] ------------------
+    # --------------------------------------------------
+    def build(self, master) -> list[CanvasCell]:
+        """Crea el canvas con sus 42 celdas y retorna las celdas."""
+        cal = self.calendar
+        self.number_font = self._font(cal.day_number_font)
+        self.names_font = self._font(cal.days_font)
+        self.chip_font = ctk.CTkFont(size=11)
+
+        label_theme = ctk.ThemeManager.theme["CTkLabel"]
+        frame_theme = ctk.ThemeManager.theme["CTkFrame"]
+        self.text_color = self._color(cal.days_label_text_color or label_theme["text_color"])
+        self.border_color = self._color(cal.selected_day_border_color or frame_theme["border_color"])
+        background = master.cget("fg_color")
+        if background == "transparent":
+            background = frame_theme["fg_color"]
+
+        self.canvas = tk.Canvas(master=master, highlightthickness=0, borderwidth=0, bg=self._color(background),
+                                width=7 * self.MIN_CELL_WIDTH, height=self.HEADER_HEIGHT + 6 * self.MIN_CELL_HEIGHT)
+        self.canvas.pack(fill="both", expand=True)
+
+        for j in range(7):
+            self.day_names.append(self.canvas.create_text(0, 0, text=cal.days_name_abbr[j].title(), font=self.names_font, fill=self.text_color))
+
+        for i in range(42):
+            cell = CanvasCell(self, i)
+            cell.rect = self.canvas.create_rectangle(0, 0, 0, 0, outline="", fill=self._color(cal.days_fg_color))
+            cell.number = self.canvas.create_text(0, 0, anchor="n", text="", font=self.number_font, fill=self.text_color)
+            cell.border = self.canvas.create_rectangle(0, 0, 0, 0, outline=self.border_color, width=3, state="hidden")
+            self.cells.append(cell)
+
+        self.active = MonthBuffer(None, self.cells, self.cells)
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Shift-Button-1>", lambda event: self._on_press(event, "extend"))
+        self.canvas.bind("<Control-Button-1>", lambda event: self._on_press(event, "toggle"))
+        self.canvas.bind("<B1-Motion>", self._on_drag)
+        self.canvas.bind("<ButtonRelease-1>", lambda event: self.calendar.selection_manager.release())
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", self._on_leave)
+        return self.cells
+
+
+    def _font(self, font):
+        """Convierte la fuente de CTkCalendar (tupla, CTkFont o None) en una tkinter Font medible."""
+        if font is None:
+            return ctk.CTkFont()
+        if isinstance(font, tkfont.Font):
+            return font
+        return tkfont.Font(root=self.calendar, font=font)
+
+
+    def _color(self, color) -> str:
+        """Resuelve colores de CustomTkinter (str o tupla claro/oscuro) a un color de Tk."""
+        return self.calendar._apply_appearance_mode(color)
+
+    # --------------------------------------------------
+    # ------------------ [GEOMETRÍA] -------------------
+    # --------------------------------------------------
+    def _on_resize(self, event):
+        self.cell_width = max(event.width / 7, 1)
+        self.cell_height = max((event.height - self.HEADER_HEIGHT) / 6, 1)
+        self._layout()
+        # Cambia cuántos chips caben: se repintan los eventos de todas las celdas
+        for cell in self.cells:
+            cell.events_signature = None
+            self.render_events(cell)
+
+
+    def cell_bbox(self, index: int) -> tuple[float, float, float, float]:
+        """Rectángulo (x0, y0, x1, y1) de la celda, con 1px de separación como en el modo widgets."""
+        row, col = divmod(index, 7)
+        x0 = col * self.cell_width + 1
+        y0 = self.HEADER_HEIGHT + row * self.cell_height
+        return x0, y0, (col + 1) * self.cell_width - 1, y0 + self.cell_height - 1
+
+
+    def _layout(self):
+        """Recoloca todos los items según el tamaño actual del canvas."""
+        for j, item in enumerate(self.day_names):
+            self.canvas.coords(item, (j + 0.5) * self.cell_width, self.HEADER_HEIGHT / 2)
+        for cell in self.cells:
+            x0, y0, x1, y1 = self.cell_bbox(cell.index)
+            self.canvas.coords(cell.rect, x0, y0, x1, y1)
+            self.canvas.coords(cell.number, (x0 + x1) / 2, y0 + 3)
+            self.canvas.coords(cell.border, x0 + 1, y0 + 1, x1 - 1, y1 - 1)
+
+
+    def _chips_fit(self) -> int:
+        """Cuántos chips de evento caben en una celda con el tamaño actual."""
+        available = self.cell_height - self.NUMBER_HEIGHT - 3
+        return max(0, int(available // (self.CHIP_HEIGHT + self.CHIP_GAP)))
+
+
+    def _chip_bbox(self, cell: CanvasCell, k: int) -> tuple[float, float, float, float]:
+        x0, y0, x1, _ = self.cell_bbox(cell.index)
+        top = y0 + self.NUMBER_HEIGHT + k * (self.CHIP_HEIGHT + self.CHIP_GAP)
+        return x0 + 3, top, x1 - 4, top + self.CHIP_HEIGHT
+
+
+    def _cell_at(self, x: float, y: float) -> CanvasCell | None:
+        """Hit-testing: celda bajo las coordenadas del canvas."""
+        if y < self.HEADER_HEIGHT:
+            return None
+        col = int(x // self.cell_width)
+        row = int((y - self.HEADER_HEIGHT) // self.cell_height)
+        if 0 <= col < 7 and 0 <= row < 6:
+            return self.cells[row * 7 + col]
+        return None
+
+
+    def _chip_at(self, cell: CanvasCell, y: float) -> int | None:
+        """Hit-testing: índice del chip de `cell` bajo la coordenada y."""
+        _, y0, _, _ = self.cell_bbox(cell.index)
+        offset = y - y0 - self.NUMBER_HEIGHT
+        if offset < 0:
+            return None
+        k, rest = divmod(offset, self.CHIP_HEIGHT + self.CHIP_GAP)
+        k = int(k)
+        if k < len(cell.chip_events) + bool(cell.more) and rest <= self.CHIP_HEIGHT:
+            return k
+        return None
+
+    # --------------------------------------------------
+    # ------------------- [PINTADO] --------------------
+    # --------------------------------------------------
+    def fill_calendar(self):
+        """Rellena las 42 celdas del canvas, reconfigurando solo los items cuyas celdas cambian."""
+        metrics = self.calendar.metrics
+        started = metrics.start()
+        configures = 0
+        buffer = self.active
+        start_date, first_day, last_day_month = self.month_grid()
+        current_date = start_date
+        today = datetime.date.today()
+        buffer.date_to_cell = {}
+        buffer.month = (self.calendar.current_year, self.calendar.current_month)
+
+        for i, cell in enumerate(self.cells):
+            buffer.date_to_cell[current_date] = cell
+
+            in_month = first_day <= current_date <= last_day_month
+            state = (current_date, in_month, current_date == today)
+            previous = buffer.cell_states[i]
+            if previous != state:
+                if previous is None or previous[0].day != current_date.day:
+                    self.canvas.itemconfigure(cell.number, text=str(current_date.day))
+                    configures += 1
+                cell.date = current_date
+                cell.in_month = in_month
+
+                if previous is None or previous[1:] != state[1:]:
+                    if not in_month:
+                        color = self.calendar.disabled_days_fg_color
+                    else:
+                        color = self.calendar.today_fg_color if state[2] else 'white'
+                    self.canvas.itemconfigure(cell.rect, fill=self._color(color))
+                    configures += 1
+                buffer.cell_states[i] = state
+
+            self.calendar.selection_manager.sync_cell(cell)
+            self.render_events(cell)
+            current_date += timedelta(days=1)
+
+        self.request_events()
+        if started is not None:
+            metrics.count("configure_calls", configures)
+            metrics.stop("fill_calendar", started)
+
+
+    def render_events(self, cell: CanvasCell):
+        """
+        Pinta como chips los eventos visibles de la celda que caben y, si sobran, un chip "+N más";
+        no toca el canvas si la firma no cambió.
+        """
+        metrics = self.calendar.metrics
+        started = metrics.start()
+        em = self.calendar.event_manager
+        date_obj = cell.date
+        if not date_obj or not cell.in_month:
+            events, more = [], 0
+        else:
+            events, more = em.split_overflow(em.visible_events(date_obj), self._chips_fit())
+
+        signature = (em.event_signature(events), more)
+        if cell.events_signature == signature:
+            cell.chip_events = events  # mismos chips, pero los clics deben llevar a los registros actuales
+            if started is not None:
+                metrics.count("cells_unchanged")
+                metrics.stop("render_events_in_frame", started)
+            return
+        cell.events_signature = signature
+
+        while len(cell.chips) < len(events) + bool(more):
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, outline="", state="hidden")
+            text = self.canvas.create_text(0, 0, anchor="w", font=self.chip_font, state="hidden")
+            cell.chips.append((rect, text))
+            if started is not None:
+                metrics.count("canvas_items_created", 2)
+
+        for k, ev in enumerate(events):
+            rect, text = cell.chips[k]
+            color = em.tags.get(ev.tag, {"color": "gray"})["color"]
+            x0, y0, x1, y1 = self._chip_bbox(cell, k)
+            self.canvas.coords(rect, x0, y0, x1, y1)
+            self.canvas.coords(text, x0 + 4, (y0 + y1) / 2)
+            self.canvas.itemconfigure(rect, fill=color, state="normal")
+            self.canvas.itemconfigure(text, text=self._fit_text(em.event_label(ev), x1 - x0 - 8), fill="white" if color != "white" else "black", state="normal")
+        if more:
+            rect, text = cell.chips[len(events)]
+            x0, y0, x1, y1 = self._chip_bbox(cell, len(events))
+            self.canvas.coords(text, x0 + 4, (y0 + y1) / 2)
+            self.canvas.itemconfigure(rect, state="hidden")
+            self.canvas.itemconfigure(text, text=self.calendar.widget_pool.MORE_TEXT.format(more), fill=self.text_color, state="normal")
+        for rect, text in cell.chips[len(events) + bool(more):]:
+            self.canvas.itemconfigure(rect, state="hidden")
+            self.canvas.itemconfigure(text, state="hidden")
+        cell.chip_events = events
+        cell.more = more
+        self.canvas.tag_raise(cell.border)
+        if started is not None:
+            metrics.count("cells_rendered")
+            metrics.count("configure_calls", 2 * (len(events) + bool(more)))
+            metrics.stop("render_events_in_frame", started)
+
+
+    def _fit_text(self, text: str, width: float) -> str:
+        """Recorta el texto con '…' para que no se salga del chip (el canvas no recorta)."""
+        measured = self.chip_font.measure(text)
+        if measured <= width:
+            return text
+        chars = max(0, int(len(text) * width / measured) - 1)
+        return text[:chars] + "…"
+
+
+    def draw_border(self, cell: CanvasCell):
+        """Muestra u oculta el borde de selección de la celda."""
+        self.canvas.itemconfigure(cell.border, state="normal" if cell.border_width else "hidden")
+        self.canvas.tag_raise(cell.border)
+
+    # --------------------------------------------------
+    # ------------------- [EVENTOS] --------------------
+    # --------------------------------------------------
+    def _on_click(self, event):
+        cell = self._cell_at(event.x, event.y)
+        if cell is None:
+            return
+        k = self._chip_at(cell, event.y)
+        if k is not None and k == len(cell.chip_events):
+            self.calendar.event_list_popup.open(cell.date)
+            return
+        if k is not None:
+            self.calendar._event_clicked(cell.chip_events[k], cell.date)
+            return
+        self.calendar.selection_manager.press(cell.date)
+
+
+    def _on_press(self, event, mode: str):
+        cell = self._cell_at(event.x, event.y)
+        if cell is not None:
+            self.calendar.selection_manager.press(cell.date, mode)
+
+
+    def _on_drag(self, event):
+        cell = self._cell_at(event.x, event.y)
+        self.calendar.selection_manager.drag(cell.date if cell is not None else None)
+
+
+    def _on_motion(self, event):
+        cell = self._cell_at(event.x, event.y)
+        in_month = cell is not None and cell.in_month
+        cursor = 'hand2' if in_month else 'arrow'
+        if cursor != self.cursor:
+            self.canvas.configure(cursor=cursor)
+            self.cursor = cursor
+
+        tooltips = self.calendar.tooltip_manager
+        k = self._chip_at(cell, event.y) if cell is not None else None
+        hover = (cell, k) if k is not None and k < len(cell.chip_events) else None
+        if hover == self.hover_chip:
+            tooltips.move(event)
+            return
+        self.hover_chip = hover
+        tooltips.hide()
+        if hover is not None:
+            ev, date_obj = cell.chip_events[k], cell.date
+            tooltips.schedule(self.canvas, lambda: self.calendar.event_manager.tooltip_text(ev, date_obj))
+
+
+    def _on_leave(self, event):
+        self.hover_chip = None
+        self.calendar.tooltip_manager.hide()
@@ -0,0 +1,41 @@
+import sys
+
+
+class Event:
+    """
+    Registro compacto de un evento con id estable.
+
+    Usa `__slots__` (sin `__dict__` por instancia) y guarda el tag internado, de modo que todos los eventos
+    de un mismo tag comparten el mismo objeto string. `recurring=True` indica que es la plantilla de una
+    regla de recurrencia; en ese caso `id` es el id de la regla. `start`/`end` (datetime.time) son la hora
+    de inicio y fin de los eventos con hora; en los de todo el día valen None.
+    """
+
+    __slots__ = ("id", "name", "desc", "tag", "recurring", "start", "end")
+
+    def __init__(self, event_id: int, name: str, desc: str, tag: str, recurring: bool = False, start=None, end=None):
+        self.id = event_id
+        self.name = name
+        self.desc = desc
+        self.tag = sys.intern(tag)
+        self.recurring = recurring
+        self.start = start
+        self.end = end
+
+
+    def to_dict(self) -> dict:
+        """
+        Retorna el evento como dict (el formato público de los getters). En las ocurrencias de una regla `id` es el
+        de la regla, igual que `rule`: los métodos por id lo tratan como la serie entera (ver `series=True`).
+        """
+        data = {"id": self.id, "name": self.name, "desc": self.desc, "tag": self.tag}
+        if self.recurring:
+            data["rule"] = self.id
+        if self.start is not None:
+            data["start"] = self.start.isoformat(timespec="minutes")
+            data["end"] = self.end.isoformat(timespec="minutes")
+        return data
+
+
+    def __repr__(self) -> str:
+        return f"Event(id={self.id}, name={self.name!r}, tag={self.tag!r})"
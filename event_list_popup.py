@@ -0,0 +1,144 @@
+import datetime
+import customtkinter as ctk
+
+
+class EventListPopup:
+    """
+    Ventana con la lista completa de eventos de un día (se abre desde el chip "+N más" de una celda).
+
+    La lista está virtualizada: hay un número fijo de filas (`VISIBLE_ROWS`) que se crean una sola vez y,
+    al desplazarse, solo se les cambia el evento que muestran. Abrir un día con miles de eventos cuesta lo
+    mismo que abrir uno con diez. La ventana es única por calendario y se oculta en lugar de destruirse.
+    """
+
+    VISIBLE_ROWS = 10
+    ROW_HEIGHT = 24
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self.window = None
+        self.title_label = None
+        self.scrollbar = None
+        self.rows: list[ctk.CTkButton] = []
+        self.events: list = []  # eventos visibles del día abierto
+        self.date = None
+        self.first = 0  # índice del evento mostrado en la primera fila
+        self.visible = False
+
+    # --------------------------------------------------
+    # ------------------ [VENTANA] ---------------------
+    # --------------------------------------------------
+    def _build(self):
+        """Construye (una sola vez) la ventana con sus filas fijas y la barra de desplazamiento."""
+        self.window = window = ctk.CTkToplevel(self.calendar)
+        window.withdraw()
+        window.resizable(False, False)
+        window.protocol("WM_DELETE_WINDOW", self.close)
+        window.bind("<Escape>", lambda event: self.close())
+
+        self.title_label = ctk.CTkLabel(master=window, text="", font=ctk.CTkFont(weight="bold"))
+        self.title_label.grid(row=0, column=0, columnspan=2, sticky="w", padx=10, pady=(8, 4))
+
+        body = ctk.CTkFrame(master=window, fg_color="transparent", width=220, height=self.VISIBLE_ROWS * self.ROW_HEIGHT)
+        body.grid(row=1, column=0, sticky="nsew", padx=(10, 0), pady=(0, 10))
+        body.grid_propagate(False)
+        body.grid_columnconfigure(0, weight=1)
+
+        self.scrollbar = ctk.CTkScrollbar(master=window, command=self._scroll)
+        self.scrollbar.grid(row=1, column=1, sticky="ns", padx=(2, 6), pady=(0, 10))
+
+        event_manager = self.calendar.event_manager
+        for k in range(self.VISIBLE_ROWS):
+            btn = ctk.CTkButton(master=body, text="", corner_radius=4, height=self.ROW_HEIGHT - 4, anchor="w")
+            btn.configure(command=lambda b=btn: self.calendar._event_clicked(*b.event_ref))
+            self.calendar.tooltip_manager.attach(btn, lambda b=btn: event_manager.tooltip_text(*b.event_ref))
+            btn.event_state = None
+            btn.event_ref = None
+            btn.grid(row=k, column=0, sticky="ew", pady=2)
+            self.rows.append(btn)
+
+        for widget in [body, *self.rows]:
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", self._on_wheel)
+            widget.bind("<Button-5>", self._on_wheel)
+
+
+    def open(self, date_obj: datetime.date):
+        """Muestra junto al puntero la lista de eventos visibles de `date_obj`."""
+        if self.window is None:
+            self._build()
+        self.date = date_obj
+        self.first = 0
+        self.events = self.calendar.event_manager.visible_events(date_obj)
+
+        month_name = self.calendar.locale_data.month_names[date_obj.month]
+        self.title_label.configure(text=f"{date_obj.day} {month_name.title()} {date_obj.year}")
+        self._fill()
+
+        x, y = self.calendar.winfo_pointerxy()
+        self.window.geometry(f"+{x + 8}+{y + 8}")
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_set()
+        self.visible = True
+
+
+    def close(self):
+        """Oculta la ventana sin destruirla."""
+        if self.visible:
+            self.calendar.tooltip_manager.hide()
+            self.window.withdraw()
+            self.visible = False
+
+
+    def refresh(self):
+        """Vuelve a leer los eventos del día abierto (tras un cambio que lo afecta)."""
+        if not self.visible:
+            return
+        self.events = self.calendar.event_manager.visible_events(self.date)
+        self.first = min(self.first, max(0, len(self.events) - self.VISIBLE_ROWS))
+        self._fill()
+
+    # --------------------------------------------------
+    # ------------------ [FILAS] -----------------------
+    # --------------------------------------------------
+    def _fill(self):
+        """Asigna a cada fila fija el evento que le toca según el desplazamiento actual."""
+        configure = self.calendar.event_manager.configure_event_button
+        total = len(self.events)
+        for k, btn in enumerate(self.rows):
+            index = self.first + k
+            if index < total:
+                configure(btn, self.events[index], self.date)
+                btn.grid()
+            else:
+                btn.grid_remove()
+
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + self.VISIBLE_ROWS) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
+    def _scroll(self, *args):
+        """Callback de la barra de desplazamiento ("moveto", fracción) o ("scroll", n, "units"|"pages")."""
+        total = len(self.events)
+        if args[0] == "moveto":
+            first = int(float(args[1]) * total)
+        else:
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.VISIBLE_ROWS
+            first = self.first + step
+
+        first = max(0, min(first, total - self.VISIBLE_ROWS))
+        if first != self.first:
+            self.first = first
+            self._fill()
+
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self._scroll("scroll", -1, "units")
+        else:
+            self._scroll("scroll", 1, "units")
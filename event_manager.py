@@ -1,315 +1,346 @@
 import customtkinter as ctk
 import datetime
-from tooltip import ToolTip
-import json
+from event import Event
+from event_store import EventStore, Change
 
 
 class EventManager:
-    def __init__(self, calendar):
-        self.calendar = calendar  # referencia al CalendarView o CTkCalendar
-        self.events: dict[datetime.date, list[dict]] = {}
-        self.tags: dict[str, dict] = {}  # {tag_name: {"color": str, "desc": str, "visible": bool}}
+    """
+    Adaptador entre un `EventStore` y la vista de un CTkCalendar.
+
+    Se suscribe al store indicando qué fechas muestra (`displayed_ranges`), así que con varios calendarios
+    sobre el mismo store cada cambio solo llega a los que tienen la fecha en pantalla, y repinta solo las celdas
+    afectadas. Si el store es solo suyo, `hide_tag` / `show_tag` / `toggle_tag` cambian la visibilidad del tag en el
+    store, como siempre; si lo comparte con otros calendarios, ocultan solo en este (`store.hide_tag` oculta en todos)
+    y las consultas de eventos visibles del adaptador (`get_upcoming_events`, `get_events_between(visible_only=True)`,
+    contadores) respetan ese filtro propio. Con un storage conectado las ediciones de eventos cargados van al storage
+    (ver [ALMACENAMIENTO]). El resto de la API (get_events, batch, tags, ...) se delega en el store, así que
+    `calendar.event_manager` se usa igual que antes aunque el modelo viva fuera de Tk.
+    """
+
+    def __init__(self, calendar, store: EventStore | None = None):
+        self.calendar = calendar  # referencia al CTkCalendar
+        self.store = store if store is not None else EventStore()
+        self.hidden: set[str] = set()  # tags ocultos solo en este calendario
+        self.store.subscribe(self._on_change, window=self.displayed_ranges)
+
+
+    def __getattr__(self, name):
+        # Solo se llama si el atributo no existe en el adaptador: API del modelo
+        if name == "store":
+            raise AttributeError(name)
+        return getattr(self.store, name)
+
+
+    def close(self):
+        """Deja de escuchar al store (al destruir el calendario, para no repintar widgets destruidos)."""
+        self.store.unsubscribe(self._on_change)
+
+
+    def displayed_ranges(self) -> list[tuple[datetime.date, datetime.date]]:
+        """Rangos de fechas en pantalla: la cuadrícula del mes, la lista de eventos abierta y la vista de semana/día/año."""
+        ranges = []
+        cells = self.calendar.calendar_view.date_to_cell
+        if cells:
+            ranges.append((next(iter(cells)), next(reversed(cells))))
+        popup = self.calendar.event_list_popup
+        if popup.visible:
+            ranges.append((popup.date, popup.date))
+        view = self.calendar.active_view
+        if view is not None:
+            ranges.append(view.displayed_range())
+        return ranges
 
     # --------------------------------------------------
-    # ----------------- [GESTIÓN DE TAGS] --------------
+    # --------------- [FILTRO DE TAGS] -----------------
     # --------------------------------------------------
-    def add_tag(self, tag_name: str, color: str = "#3A7FF6", desc: str = "", visible: bool = True):
-        """Crea un nuevo tag con color, descripción y visibilidad inicial."""
-        if not isinstance(tag_name, str) or not tag_name:
-            raise ValueError("El nombre del tag debe ser un string no vacío.")
-        if not isinstance(color, str) or not color:
-            raise ValueError("El color debe ser un string válido (hex o nombre).")
-        self.tags[tag_name] = {"color": color, "desc": desc, "visible": visible}
-
-
-    def update_tag(self, tag_name: str, *, color: str | None = None, desc: str | None = None):
-        """Modifica color o descripción de un tag existente."""
-        if tag_name not in self.tags:
-            raise KeyError(f"El tag '{tag_name}' no existe.")
-        if color:
-            self.tags[tag_name]["color"] = color
-        if desc is not None:
-            self.tags[tag_name]["desc"] = desc
-
-        # Re-renderizar todos los eventos asociados al tag
-        for date_obj, evs in self.events.items():
-            if any(ev.get("tag") == tag_name for ev in evs):
-                self.render_visible_date(date_obj)
-
-
-    def remove_tag(self, tag_name: str, remove_events: bool = False):
-        """Elimina un tag. Si remove_events=True, elimina también los eventos asociados."""
-        if tag_name not in self.tags:
-            return False
+    def hidden_tags(self) -> set[str]:
+        """Tags que no se muestran en este calendario: los ocultos en el store más los de su propio filtro."""
+        return self.store.hidden_tags() | self.hidden
 
-        del self.tags[tag_name]
 
-        if remove_events:
-            for date_obj in list(self.events.keys()):
-                filtered = [ev for ev in self.events[date_obj] if ev.get("tag") != tag_name]
-                if filtered:
-                    self.events[date_obj] = filtered
-                else:
-                    del self.events[date_obj]
-                self.render_visible_date(date_obj)
+    def is_tag_visible(self, tag_name: str) -> bool:
+        return tag_name not in self.hidden and self.store.tags.get(tag_name, {}).get("visible", True)
 
-        return True
 
-
-    # --------------------------------------------------
-    # ---------------- [OCULTAR / MOSTRAR] -------------
-    # --------------------------------------------------
     def hide_tag(self, tag_name: str):
-        """Oculta todos los eventos del tag indicado."""
-        if tag_name not in self.tags:
-            raise KeyError(f"El tag '{tag_name}' no existe.")
-        self.tags[tag_name]["visible"] = False
-        self._rerender_tag(tag_name)
+        """Oculta el tag en este calendario (en el store si ningún otro calendario lo comparte)."""
+        if self.is_only_view():
+            self.store.hide_tag(tag_name)
+        else:
+            self._set_tag_hidden(tag_name, True)
 
 
     def show_tag(self, tag_name: str):
-        """Muestra todos los eventos del tag indicado."""
-        if tag_name not in self.tags:
-            raise KeyError(f"El tag '{tag_name}' no existe.")
-        self.tags[tag_name]["visible"] = True
-        self._rerender_tag(tag_name)
+        """
+        Vuelve a mostrar el tag en este calendario. Si ningún otro calendario comparte el store también se muestra
+        en el store; si no, un tag oculto con `store.hide_tag` sigue oculto hasta `store.show_tag`.
+        """
+        if self.is_only_view():
+            self.hidden.discard(tag_name)
+            self.store.show_tag(tag_name)
+        else:
+            self._set_tag_hidden(tag_name, False)
 
 
     def toggle_tag(self, tag_name: str):
-        """Alterna la visibilidad del tag (oculto/visible)."""
-        if tag_name not in self.tags:
-            raise KeyError(f"El tag '{tag_name}' no existe.")
-        current = self.tags[tag_name].get("visible", True)
-        self.tags[tag_name]["visible"] = not current
-        self._rerender_tag(tag_name)
+        """Oculta el tag si este calendario lo muestra y lo muestra si no."""
+        if self.is_tag_visible(tag_name):
+            self.hide_tag(tag_name)
+        else:
+            self.show_tag(tag_name)
 
 
-    def _rerender_tag(self, tag_name: str):
-        """Re-renderiza todas las fechas que contengan eventos del tag indicado."""
-        for date_obj, evs in self.events.items():
-            if any(ev.get("tag") == tag_name for ev in evs):
-                self.render_visible_date(date_obj)
+    def is_only_view(self) -> bool:
+        """True si ningún otro calendario está suscrito al store."""
+        return not any(isinstance(owner, EventManager) and owner is not self
+                       for owner in (getattr(callback, "__self__", None) for callback in self.store.subscribers()))
 
 
+    def _set_tag_hidden(self, tag_name: str, hidden: bool):
+        if tag_name not in self.store.tags:
+            raise KeyError(f"El tag '{tag_name}' no existe.")
+        if hidden == (tag_name in self.hidden):
+            return
+        if hidden:
+            self.hidden.add(tag_name)
+        else:
+            self.hidden.discard(tag_name)
+        # Solo cambia lo que pinta este calendario: se repinta sin notificar a los demás observadores del store
+        self._on_change(self.store.tag_change(tag_name))
+
     # --------------------------------------------------
-    # ------------------ [INSERCIÓN] -------------------
+    # ----------------- [ALMACENAMIENTO] ---------------
     # --------------------------------------------------
-    def add_event(self, date_obj: datetime.date, name: str, desc: str, tag: str):
-        """Añade un evento ligado a un tag (el color se toma del tag)."""
-        if not isinstance(date_obj, datetime.date):
-            raise TypeError("date_obj debe ser datetime.date")
-        if not isinstance(name, str) or not name:
-            raise ValueError("name debe ser un string no vacío")
-        if tag not in self.tags:
-            raise ValueError(f"El tag '{tag}' no existe. Debe crearse antes de usarlo.")
+    # Con un SQLiteStorage conectado (`CTkCalendar.attach_storage`) el store solo tiene una copia de los meses en
+    # pantalla: editar o borrar un evento cargado se hace en el storage (que recarga el mes) y añadir eventos o reglas
+    # se rechaza, porque el id que se retornaría no sería el del evento una vez cargado.
+    def _source_id(self, event_id: int):
+        """Id en el storage del evento `event_id` si se cargó de él, o None (sin storage o evento solo en memoria)."""
+        provider = getattr(self.calendar, "event_provider", None)
+        if getattr(self.calendar, "storage", None) is None or provider is None:
+            return None
+        return provider.source_id(event_id)
 
-        ev = {"name": name, "desc": desc, "tag": tag}
-        self.events.setdefault(date_obj, []).append(ev)
-        self.render_visible_date(date_obj)
 
+    def _reject_with_storage(self, method: str):
+        if getattr(self.calendar, "storage", None) is not None:
+            raise ValueError(f"{method} no está disponible con un storage conectado: los eventos se añaden en "
+                             "calendar.storage (add_event / add_events) y el storage no guarda reglas de recurrencia.")
 
-    def add_event_range(self, start_date: datetime.date, end_date: datetime.date, name: str, desc: str, tag: str):
-        """Añade el mismo evento a todas las fechas en el rango [start_date, end_date]."""
-        if not isinstance(start_date, datetime.date) or not isinstance(end_date, datetime.date):
-            raise TypeError("start_date y end_date deben ser datetime.date")
-        if end_date < start_date:
-            raise ValueError("end_date no puede ser anterior a start_date")
 
-        if tag not in self.tags:
-            raise ValueError(f"El tag '{tag}' no existe.")
+    def add_event(self, *args, **kwargs) -> int:
+        self._reject_with_storage("add_event")
+        return self.store.add_event(*args, **kwargs)
 
-        current_date = start_date
-        while current_date <= end_date:
-            self.add_event(current_date, name, desc, tag)
-            current_date += datetime.timedelta(days=1)
 
+    def add_events(self, events) -> list[int]:
+        self._reject_with_storage("add_events")
+        return self.store.add_events(events)
 
-    def add_recurring_event(self, start_date: datetime.date, end_date: datetime.date, interval_days: int, name: str, desc: str, tag: str):
-        """
-        Crea un evento recurrente cada `interval_days` días entre start_date y end_date (inclusive).
 
-        Ejemplo:
-            add_recurring_event(2025-11-01, 2025-11-15, 3, "Ir al gimnasio", "", "salud")
-            → creará eventos el 1, 4, 7, 10, 13, 15
-        """
-        if not all(isinstance(d, datetime.date) for d in (start_date, end_date)):
-            raise TypeError("start_date y end_date deben ser datetime.date")
-        if end_date < start_date:
-            raise ValueError("end_date no puede ser anterior a start_date")
-        if not isinstance(interval_days, int) or interval_days < 1:
-            raise ValueError("interval_days debe ser un entero positivo")
-        if tag not in self.tags:
-            raise ValueError(f"El tag '{tag}' no existe.")
+    def add_event_range(self, *args, **kwargs) -> int:
+        self._reject_with_storage("add_event_range")
+        return self.store.add_event_range(*args, **kwargs)
 
-        current_date = start_date
-        while current_date <= end_date:
-            self.add_event(current_date, name, desc, tag)
-            current_date += datetime.timedelta(days=interval_days)
 
+    def add_recurring_event(self, *args, **kwargs) -> int:
+        self._reject_with_storage("add_recurring_event")
+        return self.store.add_recurring_event(*args, **kwargs)
 
-    # --------------------------------------------------
-    # ----------------- [ELIMINACIÓN] ------------------
-    # --------------------------------------------------
-    def remove_event(self, date_obj: datetime.date, name: str) -> bool:
-        """Elimina un evento por nombre de una fecha específica."""
-        if date_obj not in self.events:
-            return False
 
-        before = len(self.events[date_obj])
-        self.events[date_obj] = [ev for ev in self.events[date_obj] if ev["name"] != name]
-        after = len(self.events[date_obj])
+    def add_recurrence(self, *args, **kwargs) -> int:
+        self._reject_with_storage("add_recurrence")
+        return self.store.add_recurrence(*args, **kwargs)
 
-        if not self.events[date_obj]:
-            del self.events[date_obj]
 
-        self.render_visible_date(date_obj)
-        return after < before
+    def remove_event_by_id(self, event_id: int, series: bool = False) -> bool:
+        source = self._source_id(event_id)
+        if source is None:
+            return self.store.remove_event_by_id(event_id, series)
+        return self.calendar.storage.remove_event(source)
 
 
-    def clear_day(self, date_obj: datetime.date) -> bool:
-        """
-        Elimina todos los eventos de una fecha específica.
-        Retorna True si había eventos y fueron eliminados, False si no había nada.
-        """
-        if not isinstance(date_obj, datetime.date):
-            raise TypeError("date_obj debe ser datetime.date")
+    def update_event(self, event_id: int, *, name: str | None = None, desc: str | None = None, tag: str | None = None,
+                     start: datetime.time | None = None, end: datetime.time | None = None, series: bool = False):
+        source = self._source_id(event_id)
+        if source is None:
+            return self.store.update_event(event_id, name=name, desc=desc, tag=tag, start=start, end=end, series=series)
+        self.calendar.storage.update_event(source, name=name, desc=desc, tag=tag, start=start, end=end)
+
 
-        if date_obj not in self.events:
-            return False
+    def move_event(self, event_id: int, new_date: datetime.date):
+        source = self._source_id(event_id)
+        if source is None:
+            return self.store.move_event(event_id, new_date)
+        if not isinstance(new_date, datetime.date):
+            raise TypeError("new_date debe ser datetime.date")
+        self.calendar.storage.update_event(source, date_obj=new_date)
 
-        del self.events[date_obj]
-        self.render_visible_date(date_obj)
-        return True
 
+    def remove_event(self, date_obj: datetime.date, name: str) -> bool:
+        removed = self._remove_stored(date_obj, lambda ev: ev.name == name)
+        return self.store.remove_event(date_obj, name) or removed
+
+
+    def clear_day(self, date_obj: datetime.date) -> bool:
+        removed = self._remove_stored(date_obj, lambda ev: True)
+        return self.store.clear_day(date_obj) or removed
+
+
+    def _remove_stored(self, date_obj: datetime.date, matches) -> bool:
+        """Borra del storage los eventos cargados de la fecha que cumplen `matches`; retorna si había alguno."""
+        sources = [self._source_id(ev.id) for ev in self.store.events.get(date_obj, {}).values() if matches(ev)]
+        sources = [source for source in sources if source is not None]
+        for source in sources:
+            self.calendar.storage.remove_event(source)
+        return bool(sources)
 
     # --------------------------------------------------
-    # ------------------ [CONSULTAS] -------------------
+    # ------------------- [CONSULTAS] ------------------
     # --------------------------------------------------
-    def get_events(self, date_obj: datetime.date) -> list[dict]:
-        """Retorna una lista de los eventos para la fecha indicada."""
-        return self.events.get(date_obj, []).copy()
+    def visible_events(self, date_obj: datetime.date) -> list[Event]:
+        """Eventos de la fecha que se muestran en este calendario."""
+        return self.store.visible_events(date_obj, self.hidden_tags() if self.hidden else None)
 
 
-    def get_events_by_tag(self, tag: str) -> dict[datetime.date, list[dict]]:
-        """Retorna un dict con todas las fechas que tienen eventos del tag indicado."""
-        tagged = {}
-        for date_obj, evs in self.events.items():
-            matches = [ev for ev in evs if ev.get("tag") == tag]
-            if matches:
-                tagged[date_obj] = matches
-        return tagged
+    def day_layout(self, date_obj: datetime.date) -> list[tuple[Event, int, int]]:
+        return self.store.day_layout(date_obj, hidden=self.hidden_tags())
 
 
-    def get_upcoming_events(self, days_ahead: int = 7, from_date: datetime.date | None = None) -> list[tuple[datetime.date, dict]]:
-        """
-        Retorna una lista con los eventos que ocurren dentro de los próximos `days_ahead` días.
-        
-        Parámetros:
-            days_ahead (int): cantidad de días hacia adelante desde `from_date` (por defecto, hoy).
-            from_date (datetime.date | None): fecha base desde la cual buscar. Si no se pasa, se usa hoy.
-        
-        Retorna:
-            list[tuple[datetime.date, dict]]: lista de tuplas (fecha, evento), ordenadas cronológicamente.
-        """
-        if not isinstance(days_ahead, int) or days_ahead < 1:
-            raise ValueError("days_ahead debe ser un entero positivo.")
-        
-        if from_date is None:
-            from_date = datetime.date.today()
-        elif not isinstance(from_date, datetime.date):
-            raise TypeError("from_date debe ser un objeto datetime.date.")
-        
-        end_date = from_date + datetime.timedelta(days=days_ahead)
-        upcoming = []
-
-        for date_obj, evs in self.events.items():
-            if from_date <= date_obj <= end_date:
-                # Filtrar eventos visibles (por tags activos)
-                for ev in evs:
-                    tag_info = self.tags.get(ev.get("tag"))
-                    if not tag_info or tag_info.get("visible", True):
-                        upcoming.append((date_obj, ev))
-
-        # Ordenar cronológicamente
-        upcoming.sort(key=lambda x: x[0])
-        return upcoming
-    
-
-    def export_events(self, filepath: str) -> None:
-        """
-        Exporta todos los eventos y tags a un archivo JSON.
-        Incluye nombre, descripción, tag, y color del tag.
-        """
-        data = {
-            "tags": self.tags,
-            "events": {
-                date_obj.isoformat(): evs
-                for date_obj, evs in self.events.items()
-            }
-        }
+    def day_counts(self, start: datetime.date, end: datetime.date) -> dict[datetime.date, int]:
+        return self.store.day_counts(start, end, self.hidden_tags())
+
+
+    def month_counts(self, year: int) -> dict[int, int]:
+        return self.store.month_counts(year, self.hidden_tags())
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+
+    def get_events_between(self, start: datetime.date, end: datetime.date, visible_only: bool = False,
+                           as_dict: bool = True) -> list[tuple[datetime.date, dict]]:
+        """Como `EventStore.get_events_between`; con `visible_only=True` también omite los tags ocultos en este calendario."""
+        return self.store.get_events_between(start, end, visible_only, as_dict, hidden=self.hidden_tags())
+
+
+    def get_upcoming_events(self, days_ahead: int = 7, from_date: datetime.date | None = None,
+                            as_dict: bool = True) -> list[tuple[datetime.date, dict]]:
+        """Eventos de los próximos `days_ahead` días que se muestran en este calendario."""
+        return self.store.get_upcoming_events(days_ahead, from_date, as_dict, hidden=self.hidden_tags())
 
     # --------------------------------------------------
     # ----------------- [RENDERIZADO] ------------------
     # --------------------------------------------------
+    def _on_change(self, change: Change):
+        """Repinta las celdas visibles afectadas por un cambio del store."""
+        popup = self.calendar.event_list_popup
+        if popup.visible and change.touches(popup.date):
+            popup.refresh()
+        view = self.calendar.active_view
+        if view is not None:
+            view.on_change(change)
+
+        cells = self.calendar.calendar_view.date_to_cell
+        if not cells:
+            return
+        if len(change.dates) == 1 and not change.rules:
+            self.render_visible_date(next(iter(change.dates)))
+            return
+
+        visible = list(cells)
+        render = self.calendar.calendar_view.render_events
+        for date_obj in change.dates_between(visible[0], visible[-1]):
+            frame = cells.get(date_obj)
+            if frame is not None:
+                render(frame)
+
+
     def render_visible_date(self, date_obj: datetime.date):
         """Busca el frame visible que corresponde a date_obj y lo renderiza."""
-        for frame in self.calendar.day_frames:
-            if getattr(frame, "date", None) == date_obj:
-                self.render_events_in_frame(frame)
-                break
+        started = self.calendar.metrics.start()
+        frame = self.calendar.calendar_view.date_to_cell.get(date_obj)
+        if frame is not None:
+            self.calendar.calendar_view.render_events(frame)
+        self.calendar.metrics.stop("render_visible_date", started)
 
 
-    def render_events_in_frame(self, frame: ctk.CTkFrame):
-        """Renderiza los eventos dentro de un frame específico."""
-        date_obj = getattr(frame, "date", None)
-        if not date_obj or date_obj.month != self.calendar.current_month or date_obj.year != self.calendar.current_year:
-            return
+    def split_overflow(self, events: list[Event], fit: int) -> tuple[list[Event], int]:
+        """
+        Reparte los eventos de una celda en los que se pintan y cuántos quedan ocultos tras "+N más".
+        Si no caben todos, el último hueco se reserva para el chip de desbordamiento.
+        """
+        if len(events) <= fit:
+            return events, 0
+        shown = events[:max(fit - 1, 0)]
+        return shown, len(events) - len(shown)
+
+
+    def configure_event_button(self, btn: ctk.CTkButton, ev: Event, date_obj: datetime.date):
+        """Muestra `ev` en un botón reutilizable, reconfigurándolo solo si cambió lo que muestra."""
+        color = self.tags.get(ev.tag, {"color": "gray"})["color"]
+        state = (ev.name, color, ev.start)
+        if btn.event_state != state:
+            btn.configure(
+                text=self.event_label(ev),
+                fg_color=color,
+                hover_color=color,
+                text_color="white" if color != "white" else "black",
+            )
+            btn.event_state = state
+            if self.calendar.metrics.enabled:
+                self.calendar.metrics.count("configure_calls")
+        btn.event_ref = (ev, date_obj)
 
-        events = self.events.get(date_obj, [])
-        container = getattr(frame, "events_container", None)
-        if container:
-            container.destroy()
-            frame.events_container = None
 
-        if not events:
+    def render_events_in_frame(self, frame: ctk.CTkFrame):
+        """
+        Renderiza los eventos dentro de un frame específico reutilizando los widgets del pool.
+        Solo se crean las filas que caben en la celda; el resto se resume en un chip "+N más", así que
+        el coste por celda no depende de cuántos eventos tenga el día.
+        Si la firma de lo que se mostraría coincide con la última pintada no toca ningún widget.
+        """
+        metrics = self.calendar.metrics
+        started = metrics.start()
+        pool = self.calendar.widget_pool
+        date_obj = getattr(frame, "date", None)
+        if not date_obj or not getattr(frame, "in_month", False):
+            visible_events = []
+        else:
+            # Filtrar eventos visibles según su tag
+            visible_events = self.visible_events(date_obj)
+
+        shown, more = self.split_overflow(visible_events, pool.MAX_ROWS)
+        signature = (self.event_signature(shown), more)
+        if getattr(frame, "events_signature", None) == signature:
+            # Se ve igual, pero pueden ser otros registros u otra fecha (p. ej. la misma regla en otro mes):
+            # los clics y tooltips deben apuntar a los actuales
+            for btn, ev in zip(getattr(frame, "event_rows", ()), shown):
+                btn.event_ref = (ev, date_obj)
+            if started is not None:
+                metrics.count("cells_unchanged")
+                metrics.stop("render_events_in_frame", started)
             return
+        frame.events_signature = signature
 
-        # Filtrar eventos visibles según su tag
-        visible_events = [ev for ev in events if self.tags.get(ev["tag"], {}).get("visible", True)]
         if not visible_events:
-            return
+            pool.release(frame)
+        else:
+            rows = pool.get_rows(frame, len(shown), more)
+            for btn, ev in zip(rows, shown):
+                self.configure_event_button(btn, ev, date_obj)
 
-        ev_container = ctk.CTkScrollableFrame(master=frame, corner_radius=6, height=0, fg_color="transparent")
-        ev_container._scrollbar.grid_forget()
-        ev_container.grid(row=1, column=0, sticky="nsew", padx=(3, 4), pady=(0, 3))
-        frame.events_container = ev_container
+        if started is not None:
+            metrics.count("cells_rendered")
+            metrics.stop("render_events_in_frame", started)
 
-        inner = ev_container._parent_frame
-        inner.grid_propagate(False)
 
-        event_height = 22
-        target_height = min(len(visible_events) * event_height, 3 * event_height + 8)
-        ev_container.configure(height=target_height)
-        frame.grid_propagate(False)
+    @staticmethod
+    def event_label(ev: Event) -> str:
+        """Texto corto de un evento en una celda: el nombre, precedido de la hora si la tiene."""
+        return f"{ev.start:%H:%M} {ev.name}" if ev.start is not None else ev.name
 
-        for ev in visible_events:
-            tag_info = self.tags.get(ev["tag"], {"color": "gray"})
-            color = tag_info["color"]
-
-            btn = ctk.CTkButton(
-                master=ev_container,
-                text=ev["name"],
-                fg_color=color,
-                hover_color=color,
-                text_color="white" if color != "white" else "black",
-                corner_radius=4,
-                height=20,
-                anchor="w",
-                command=lambda e=ev, d=date_obj: print(e, d)
-            )
-            btn.pack(fill="x", pady=1, padx=(0, 5))
-            ToolTip(btn, text=f"{ev['name']}\n{ev['desc']}\n[{ev['tag']}]")
 
+    def tooltip_text(self, ev: Event, date_obj: datetime.date) -> str:
+        """Texto del tooltip de un evento; se construye solo cuando el tooltip se muestra."""
+        if ev.start is not None:
+            return f"{ev.name}\n{ev.start:%H:%M}–{ev.end:%H:%M}\n{ev.desc}\n[{ev.tag}]"
+        return f"{ev.name}\n{ev.desc}\n[{ev.tag}]"
@@ -0,0 +1,225 @@
+import calendar
+import datetime
+import inspect
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+def month_bounds(year: int, month: int) -> tuple[datetime.date, datetime.date]:
+    """Primer y último día del mes."""
+    return datetime.date(year, month, 1), datetime.date(year, month, calendar.monthrange(year, month)[1])
+
+
+def months_between(start: datetime.date, end: datetime.date) -> list[tuple[int, int]]:
+    """Meses (año, mes) que se solapan con [start, end], en orden."""
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+class EventProvider:
+    """
+    Carga bajo demanda los eventos de los meses visibles desde un proveedor externo.
+
+    `provider(start, end)` (función normal o `async def`) retorna los eventos de [start, end] como tuplas
+    (fecha, name, desc, tag) o dicts con esas claves, igual que `add_events`. Se ejecuta en un pool de hilos
+    (o en un bucle asyncio propio si es asíncrono), así que no debe tocar widgets. Los resultados se piden
+    por mes, se insertan en el store del calendario desde el hilo de Tk y se guardan en una caché LRU de
+    `cache_months` meses: al expulsar un mes sus eventos se quitan del store. Además de los meses visibles se
+    precargan `prefetch_months` meses a cada lado, y las peticiones de meses que dejan de interesar al navegar
+    se cancelan (si terminan igualmente, su resultado se descarta).
+
+    Ejemplo:
+        def desde_bd(start, end):
+            return [(fila.fecha, fila.titulo, "", "trabajo") for fila in bd.consulta(start, end)]
+        calendar.set_event_provider(desde_bd, cache_months=12)
+    """
+
+    POLL_MS = 20  # cada cuánto se revisan las peticiones en curso desde el hilo de Tk
+
+    def __init__(self, calendar, provider, cache_months: int = 12, prefetch_months: int = 1, max_workers: int = 2,
+                 on_error=None):
+        if not callable(provider):
+            raise TypeError("provider debe ser una función (start, end) -> eventos.")
+        if cache_months < 3:
+            raise ValueError("cache_months debe ser al menos 3 (los meses de la cuadrícula visible).")
+        self.calendar = calendar
+        self.provider = provider
+        self.is_async = inspect.iscoroutinefunction(provider)
+        self.cache_months = cache_months
+        self.prefetch_months = prefetch_months
+        self.on_error = on_error  # on_error((año, mes), excepción), en el hilo de Tk
+        self.errors: list[tuple[tuple[int, int], Exception]] = []  # errores si no hay on_error
+        self.cache: OrderedDict[tuple[int, int], list[int]] = OrderedDict()  # {(año, mes): ids insertados}, LRU
+        self.source_ids: dict[int, object] = {}  # {id en el store: "id" del dict del proveedor}, si lo trae
+        self.pending: dict = {}  # {(año, mes): Future}
+        self.visible: list[tuple[int, int]] = []  # meses de la cuadrícula visible (no se expulsan)
+        self.wanted: set[tuple[int, int]] = set()  # visibles más precargados
+        self._executor = None if self.is_async else ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ctkcalendar-provider")
+        self._loop = None
+        self._poll_job = None
+
+    # --------------------------------------------------
+    # ------------------ [PETICIONES] ------------------
+    # --------------------------------------------------
+    def show(self, start: datetime.date, end: datetime.date):
+        """Llamado al pintar la ventana [start, end]: pide los meses que falten y cancela los que ya no interesan."""
+        self.visible = months_between(start, end)
+        current = (self.calendar.current_year, self.calendar.current_month)
+        neighbours = []
+        for distance in range(1, self.prefetch_months + 1):
+            for sign in (1, -1):
+                index = current[0] * 12 + current[1] - 1 + sign * distance
+                neighbours.append((index // 12, index % 12 + 1))
+        self.wanted = set(self.visible) | set(neighbours)
+
+        for month, future in list(self.pending.items()):
+            if month not in self.wanted:
+                future.cancel()
+                del self.pending[month]
+
+        for month in self.visible + neighbours:
+            if month in self.cache:
+                self.cache.move_to_end(month)
+            elif month not in self.pending:
+                self.pending[month] = self._submit(*month_bounds(*month))
+        self._schedule_poll()
+
+
+    def _submit(self, start: datetime.date, end: datetime.date):
+        """Lanza la llamada al proveedor fuera del hilo de Tk y retorna su Future."""
+        if not self.is_async:
+            return self._executor.submit(self.provider, start, end)
+        import asyncio  # solo para proveedores async: no se carga si el proveedor es una función normal
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, name="ctkcalendar-provider-loop", daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(self.provider(start, end), self._loop)
+
+
+    def _schedule_poll(self):
+        if self.pending and self._poll_job is None:
+            self._poll_job = self.calendar.after(self.POLL_MS, self._poll)
+
+
+    def _poll(self):
+        """Recoge desde el hilo de Tk las peticiones terminadas."""
+        self._poll_job = None
+        for month, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[month]
+            if future.cancelled():
+                continue
+            exc = future.exception()
+            if exc is not None:
+                self._report(month, exc)
+            elif month in self.wanted:
+                self._store_month(month, future.result())
+        self._schedule_poll()
+
+
+    def _report(self, month: tuple[int, int], exc: Exception):
+        if self.on_error is not None:
+            self.on_error(month, exc)
+        else:
+            self.errors.append((month, exc))
+
+    # --------------------------------------------------
+    # -------------------- [CACHÉ] ---------------------
+    # --------------------------------------------------
+    def _store_month(self, month: tuple[int, int], events):
+        """Inserta en el store los eventos del mes (ignorando los que caen fuera) y aplica la política LRU."""
+        store = self.calendar.event_store
+        first, last = month_bounds(*month)
+        ids = []
+        with store.batch():
+            for ev in events or ():
+                try:
+                    if isinstance(ev, dict):
+                        date_obj, args = ev.get("date"), (ev.get("name"), ev.get("desc", ""), ev.get("tag"), ev.get("start"), ev.get("end"))
+                    else:
+                        date_obj, args = ev[0], ev[1:]
+                    if isinstance(date_obj, datetime.date) and first <= date_obj <= last:
+                        event_id = store.add_event(date_obj, *args)
+                        ids.append(event_id)
+                        if isinstance(ev, dict) and ev.get("id") is not None:
+                            self.source_ids[event_id] = ev["id"]
+                except (TypeError, ValueError, IndexError) as exc:
+                    self._report(month, exc)
+        self.cache[month] = ids
+        self._evict()
+
+
+    def _evict(self):
+        """Expulsa los meses menos usados por encima de `cache_months`, sin tocar los visibles."""
+        while len(self.cache) > self.cache_months:
+            victim = next((month for month in self.cache if month not in self.visible), None)
+            if victim is None:
+                return
+            self._drop(victim)
+
+
+    def _drop(self, month: tuple[int, int]):
+        """Quita del store y de la caché los eventos cargados para un mes."""
+        store = self.calendar.event_store
+        with store.batch():
+            for event_id in self.cache.pop(month):
+                store.remove_event_by_id(event_id)
+                self.source_ids.pop(event_id, None)
+
+
+    def source_id(self, event_id: int):
+        """Id en el origen (el "id" del dict que retornó el proveedor) de un evento cargado, o None."""
+        return self.source_ids.get(event_id)
+
+
+    def clear(self):
+        """Quita del store todos los eventos cargados por el proveedor y vacía la caché."""
+        for month in list(self.cache):
+            self._drop(month)
+
+
+    def invalidate(self, year: int | None = None, month: int | None = None):
+        """Descarta de la caché un mes (o todos) y vuelve a pedir lo visible."""
+        months = [(year, month)] if year is not None else list(self.cache)
+        for key in months:
+            if key in self.cache:
+                self._drop(key)
+        if self.visible:
+            start, _ = month_bounds(*self.visible[0])
+            _, end = month_bounds(*self.visible[-1])
+            self.show(start, end)
+
+
+    def invalidate_dates(self, dates):
+        """Vuelve a pedir los meses cacheados o en curso que contienen alguna de las fechas (tras escribir en el origen)."""
+        months = {(date_obj.year, date_obj.month) for date_obj in dates}
+        for month in months:
+            if month in self.cache:
+                self._drop(month)
+            future = self.pending.pop(month, None)
+            if future is not None:
+                future.cancel()
+        if self.visible and months & self.wanted:
+            start, _ = month_bounds(*self.visible[0])
+            _, end = month_bounds(*self.visible[-1])
+            self.show(start, end)
+
+
+    def close(self):
+        """Cancela las peticiones en curso y libera el pool de hilos o el bucle asyncio."""
+        if self._poll_job is not None:
+            self.calendar.after_cancel(self._poll_job)
+            self._poll_job = None
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
@@ -0,0 +1,1133 @@
+import datetime
+import sys
+import calendar
+import heapq
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right, insort
+from recurrence import RecurrenceRule
+from event import Event
+from intervals import DayIntervals, layout_intervals, to_minutes
+import json
+import os
+import re
+import unicodedata
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class Change:
+    """
+    Cambio notificado por `EventStore` a sus observadores.
+
+    `dates` son las fechas de eventos guardados que cambiaron y `rules` las reglas de recurrencia afectadas
+    (añadidas, editadas o eliminadas). Las reglas pueden ser abiertas, así que no se expanden aquí: cada
+    observador pide solo las fechas de la ventana que muestra con `dates_between`.
+    """
+
+    __slots__ = ("dates", "rules")
+
+    def __init__(self, dates=(), rules=()):
+        self.dates: set[datetime.date] = set(dates)
+        self.rules: list[RecurrenceRule] = list(rules)
+
+
+    def dates_between(self, start: datetime.date, end: datetime.date) -> set[datetime.date]:
+        """Fechas afectadas dentro de [start, end], expandiendo las reglas solo en esa ventana."""
+        dates = {date_obj for date_obj in self.dates if start <= date_obj <= end}
+        for rule in self.rules:
+            dates.update(rule.occurrences(start, end))
+        return dates
+
+
+    def intersects(self, ranges) -> bool:
+        """Indica si el cambio afecta a alguna fecha de los rangos [start, end] dados."""
+        for start, end in ranges:
+            if any(start <= date_obj <= end for date_obj in self.dates):
+                return True
+            if any(next(rule.occurrences(start, end), None) is not None for rule in self.rules):
+                return True
+        return False
+
+
+    def touches(self, date_obj: datetime.date) -> bool:
+        """Indica si el cambio afecta a una fecha concreta."""
+        return date_obj in self.dates or any(rule.occurs_on(date_obj) for rule in self.rules)
+
+
+    def __repr__(self) -> str:
+        return f"Change(dates={len(self.dates)}, rules={len(self.rules)})"
+
+
+class EventStore:
+    """
+    Modelo de eventos sin dependencias de Tk: tags, eventos, reglas de recurrencia, índices y consultas.
+
+    No sabe nada de la vista. Cada modificación se notifica a los observadores suscritos con `subscribe`
+    mediante un `Change`; varios calendarios pueden compartir un mismo store, y también puede usarse
+    solo (procesos de trabajo, scripts, pruebas) sin customtkinter ni display.
+
+    Ejemplo:
+        store = EventStore()
+        store.add_tag("trabajo", color="#3A7FF6")
+        store.subscribe(lambda change: print(change.dates))
+        store.add_event(date(2025, 11, 3), "Reunión", "", "trabajo")
+    """
+
+    RULE_CACHE_MONTHS = 24  # meses expandidos que se guardan en caché
+
+    def __init__(self):
+        self.events: dict[datetime.date, dict[int, Event]] = {}  # {fecha: {event_id: Event}} en orden de inserción
+        self.tags: dict[str, dict] = {}  # {tag_name: {"color": str, "desc": str, "visible": bool}}
+        self._dates: list[datetime.date] = []  # fechas con eventos, siempre ordenadas (índice para rangos)
+        self._tag_dates: dict[str, dict[datetime.date, int]] = {}  # {tag_name: {fecha: nº de eventos}} (índice invertido)
+        self._month_counts: dict[tuple[int, int], dict[str, int]] = {}  # {(año, mes): {tag_name: nº de eventos}}
+        self._batch_depth = 0  # >0 mientras haya un batch() abierto
+        self._dirty_dates: set[datetime.date] = set()  # fechas pendientes de notificar al cerrar el batch
+        self._dirty_rules: list[RecurrenceRule] = []  # reglas pendientes de notificar al cerrar el batch
+        self._observers: list[tuple] = []  # (callback, window) suscritos con subscribe()
+        self.rules: dict[int, dict] = {}  # {rule_id: {"rule": RecurrenceRule, "event": Event}}
+        self._by_id: dict[int, tuple[datetime.date, Event]] = {}  # {event_id: (fecha, Event)}
+        self._next_id = 1  # ids compartidos por eventos y reglas, nunca se reutilizan
+        self._rule_cache: dict[tuple[int, int], dict[datetime.date, list[dict]]] = {}  # {(año, mes): {fecha: [eventos]}}
+        self._text_index: dict[str, dict[int, int]] = {}  # {token: {event_id: peso}} (índice invertido de name y desc)
+        self._tokens: list[str] = []  # tokens del índice, ordenados (búsqueda por prefijo)
+        self._day_intervals: dict[datetime.date, DayIntervals] = {}  # índice por día de los eventos con hora
+
+    # --------------------------------------------------
+    # ----------------- [GESTIÓN DE TAGS] --------------
+    # --------------------------------------------------
+    def add_tag(self, tag_name: str, color: str = "#3A7FF6", desc: str = "", visible: bool = True):
+        """Crea un nuevo tag con color, descripción y visibilidad inicial."""
+        if not isinstance(tag_name, str) or not tag_name:
+            raise ValueError("El nombre del tag debe ser un string no vacío.")
+        if not isinstance(color, str) or not color:
+            raise ValueError("El color debe ser un string válido (hex o nombre).")
+        self.tags[tag_name] = {"color": color, "desc": desc, "visible": visible}
+
+
+    def update_tag(self, tag_name: str, *, color: str | None = None, desc: str | None = None):
+        """Modifica color o descripción de un tag existente."""
+        if tag_name not in self.tags:
+            raise KeyError(f"El tag '{tag_name}' no existe.")
+        if color:
+            self.tags[tag_name]["color"] = color
+        if desc is not None:
+            self.tags[tag_name]["desc"] = desc
+
+        # Re-renderizar las fechas visibles con eventos del tag
+        self._notify_tag(tag_name)
+
+
+    def remove_tag(self, tag_name: str, remove_events: bool = False):
+        """Elimina un tag. Si remove_events=True, elimina también los eventos asociados."""
+        if tag_name not in self.tags:
+            return False
+
+        del self.tags[tag_name]
+
+        if remove_events:
+            tag_dates = dict(self._tag_dates.get(tag_name, {}))
+            for date_obj in tag_dates:
+                for ev in [ev for ev in self.events[date_obj].values() if ev.tag == tag_name]:
+                    self._discard(date_obj, ev)
+
+            rule_ids = [rule_id for rule_id, entry in self.rules.items() if entry["event"].tag == tag_name]
+            removed_rules = [self.rules.pop(rule_id)["rule"] for rule_id in rule_ids]
+            if rule_ids:
+                self._rule_cache.clear()
+            self._notify(tag_dates, removed_rules)
+
+        return True
+
+
+    # --------------------------------------------------
+    # ---------------- [OCULTAR / MOSTRAR] -------------
+    # --------------------------------------------------
+    def hide_tag(self, tag_name: str):
+        """Oculta todos los eventos del tag indicado."""
+        if tag_name not in self.tags:
+            raise KeyError(f"El tag '{tag_name}' no existe.")
+        self.tags[tag_name]["visible"] = False
+        self._notify_tag(tag_name)
+
+
+    def show_tag(self, tag_name: str):
+        """Muestra todos los eventos del tag indicado."""
+        if tag_name not in self.tags:
+            raise KeyError(f"El tag '{tag_name}' no existe.")
+        self.tags[tag_name]["visible"] = True
+        self._notify_tag(tag_name)
+
+
+    def toggle_tag(self, tag_name: str):
+        """Alterna la visibilidad del tag (oculto/visible)."""
+        if tag_name not in self.tags:
+            raise KeyError(f"El tag '{tag_name}' no existe.")
+        current = self.tags[tag_name].get("visible", True)
+        self.tags[tag_name]["visible"] = not current
+        self._notify_tag(tag_name)
+
+
+    def _notify_tag(self, tag_name: str):
+        """Notifica las fechas con eventos del tag y las reglas del tag."""
+        change = self.tag_change(tag_name)
+        self._notify(change.dates, change.rules)
+
+
+    def tag_change(self, tag_name: str) -> Change:
+        """Cambio que cubre todo lo que pinta un tag (sus fechas con eventos y sus reglas), p. ej. al ocultarlo."""
+        rules = [entry["rule"] for entry in self.rules.values() if entry["event"].tag == tag_name]
+        return Change(self._tag_dates.get(tag_name, {}), rules)
+
+
+    # --------------------------------------------------
+    # ------------------ [INSERCIÓN] -------------------
+    # --------------------------------------------------
+    def add_event(self, date_obj: datetime.date, name: str, desc: str, tag: str,
+                  start: datetime.time | None = None, end: datetime.time | None = None) -> int:
+        """
+        Añade un evento ligado a un tag (el color se toma del tag) y retorna su id estable.
+        Con `start` y `end` (datetime.time, fin posterior al inicio dentro del mismo día) el evento tiene hora;
+        sin ellos es de todo el día.
+        """
+        if not isinstance(date_obj, datetime.date):
+            raise TypeError("date_obj debe ser datetime.date")
+        if not isinstance(name, str) or not name:
+            raise ValueError("name debe ser un string no vacío")
+        if tag not in self.tags:
+            raise ValueError(f"El tag '{tag}' no existe. Debe crearse antes de usarlo.")
+        self._check_times(start, end)
+
+        ev = Event(self._new_id(), name, desc, tag, start=start, end=end)
+        self._insert(date_obj, ev)
+        self._notify((date_obj,))
+        return ev.id
+
+
+    @staticmethod
+    def _check_times(start, end):
+        """Valida la hora de inicio y fin de un evento con hora (o que ambas sean None)."""
+        if start is None and end is None:
+            return
+        if not isinstance(start, datetime.time) or not isinstance(end, datetime.time):
+            raise TypeError("start y end deben ser datetime.time (o ambos None)")
+        if end <= start:
+            raise ValueError("end debe ser posterior a start")
+
+
+    def _new_id(self) -> int:
+        """Reserva el siguiente id de evento/regla."""
+        event_id = self._next_id
+        self._next_id += 1
+        return event_id
+
+
+    def _insert(self, date_obj: datetime.date, ev: Event):
+        """Guarda el registro en su fecha y actualiza todos los índices (fechas, tags e ids)."""
+        day_events = self.events.get(date_obj)
+        if day_events is None:
+            day_events = self.events[date_obj] = {}
+            insort(self._dates, date_obj)
+        day_events[ev.id] = ev
+        self._index_tag(ev.tag, date_obj)
+        self._by_id[ev.id] = (date_obj, ev)
+        self._index_text(ev)
+        if ev.start is not None:
+            intervals = self._day_intervals.get(date_obj)
+            if intervals is None:
+                intervals = self._day_intervals[date_obj] = DayIntervals()
+            intervals.add(to_minutes(ev.start), to_minutes(ev.end), ev.id)
+
+
+    def add_event_range(self, start_date: datetime.date, end_date: datetime.date, name: str, desc: str, tag: str) -> int:
+        """
+        Añade el mismo evento a todas las fechas en el rango [start_date, end_date].
+        Se guarda como una regla diaria (ver `add_recurrence`) y retorna su id.
+        """
+        if not isinstance(start_date, datetime.date) or not isinstance(end_date, datetime.date):
+            raise TypeError("start_date y end_date deben ser datetime.date")
+        if end_date < start_date:
+            raise ValueError("end_date no puede ser anterior a start_date")
+
+        if tag not in self.tags:
+            raise ValueError(f"El tag '{tag}' no existe.")
+
+        return self.add_recurrence(start_date, name, desc, tag, freq="daily", until=end_date)
+
+
+    def add_recurring_event(self, start_date: datetime.date, end_date: datetime.date, interval_days: int, name: str, desc: str, tag: str) -> int:
+        """
+        Crea un evento recurrente cada `interval_days` días entre start_date y end_date (inclusive).
+        Se guarda como una regla diaria (ver `add_recurrence`) y retorna su id.
+
+        Ejemplo:
+            add_recurring_event(2025-11-01, 2025-11-15, 3, "Ir al gimnasio", "", "salud")
+            → creará eventos el 1, 4, 7, 10 y 13
+        """
+        if not all(isinstance(d, datetime.date) for d in (start_date, end_date)):
+            raise TypeError("start_date y end_date deben ser datetime.date")
+        if end_date < start_date:
+            raise ValueError("end_date no puede ser anterior a start_date")
+        if not isinstance(interval_days, int) or interval_days < 1:
+            raise ValueError("interval_days debe ser un entero positivo")
+        if tag not in self.tags:
+            raise ValueError(f"El tag '{tag}' no existe.")
+
+        return self.add_recurrence(start_date, name, desc, tag, freq="daily", interval=interval_days, until=end_date)
+
+
+    def add_events(self, events) -> list[int]:
+        """
+        Inserta en bloque eventos dados como tuplas (fecha, name, desc, tag[, start, end]) o dicts con esas claves
+        ("date", "name", "desc", "tag" y opcionalmente "start", "end"). Repinta cada celda afectada una sola vez. Retorna los ids creados.
+
+        Ejemplo:
+            add_events([(date(2025, 11, 1), "Reunión", "", "trabajo"), {"date": date(2025, 11, 2), "name": "Cine", "tag": "ocio"}])
+        """
+        ids = []
+        with self.batch():
+            for ev in events:
+                if isinstance(ev, dict):
+                    ids.append(self.add_event(ev.get("date"), ev.get("name"), ev.get("desc", ""), ev.get("tag"), ev.get("start"), ev.get("end")))
+                else:
+                    ids.append(self.add_event(*ev))
+        return ids
+
+
+    # --------------------------------------------------
+    # ---------------- [EDICIÓN POR ID] ----------------
+    # --------------------------------------------------
+    def get_event(self, event_id: int, as_dict: bool = True):
+        """Retorna (fecha, evento) del evento con ese id, o None si no existe. Las reglas retornan (None, evento)."""
+        found = self._by_id.get(event_id)
+        if found is None:
+            entry = self.rules.get(event_id)
+            if entry is None:
+                return None
+            found = (None, entry["event"])
+        date_obj, ev = found
+        return date_obj, ev.to_dict() if as_dict else ev
+
+
+    def _check_series(self, event_id: int, series: bool):
+        """
+        Las ocurrencias de una regla llevan el id de la regla: editar o borrar por ese id afectaría a toda la serie,
+        así que se exige `series=True` para hacerlo.
+        """
+        if not series and event_id in self.rules:
+            raise ValueError(f"'{event_id}' es el id de una regla de recurrencia: use series=True para cambiar toda la serie, "
+                             "o remove_event(fecha, nombre) / add_recurrence_exception para quitar una sola ocurrencia.")
+
+
+    def remove_event_by_id(self, event_id: int, series: bool = False) -> bool:
+        """
+        Elimina en O(1) el evento con ese id. El id de una regla (el de cualquiera de sus ocurrencias) lanza
+        ValueError salvo con `series=True`, que elimina la regla entera.
+        """
+        found = self._by_id.get(event_id)
+        if found is None:
+            self._check_series(event_id, series)
+            return self.remove_recurrence(event_id)
+        date_obj, ev = found
+        self._discard(date_obj, ev)
+        self._notify((date_obj,))
+        return True
+
+
+    def update_event(self, event_id: int, *, name: str | None = None, desc: str | None = None, tag: str | None = None,
+                     start: datetime.time | None = None, end: datetime.time | None = None, series: bool = False):
+        """
+        Modifica en O(1) nombre, descripción o tag de un evento, o de todas las ocurrencias de una regla si se pasa
+        su id con `series=True` (sin él, el id de una regla lanza ValueError).
+        `start` y `end` (juntos) cambian la hora de un evento guardado; las reglas son siempre de todo el día.
+        """
+        if name is not None and (not isinstance(name, str) or not name):
+            raise ValueError("name debe ser un string no vacío")
+        if tag is not None and tag not in self.tags:
+            raise ValueError(f"El tag '{tag}' no existe. Debe crearse antes de usarlo.")
+        if start is not None or end is not None:
+            self._check_times(start, end)
+
+        found = self._by_id.get(event_id)
+        if found is None:
+            entry = self.rules.get(event_id)
+            if entry is None:
+                raise KeyError(f"El evento '{event_id}' no existe.")
+            self._check_series(event_id, series)
+            if start is not None:
+                raise ValueError("Las reglas de recurrencia no tienen hora.")
+            self._apply_changes(entry["event"], name, desc, tag)
+            self._rule_cache.clear()
+            self._notify(rules=(entry["rule"],))
+            return
+
+        date_obj, ev = found
+        if tag is not None and tag != ev.tag:
+            self._unindex_tag(ev.tag, date_obj)
+            self._index_tag(tag, date_obj)
+        if name is not None or desc is not None:
+            self._unindex_text(ev)
+            self._apply_changes(ev, name, desc, tag)
+            self._index_text(ev)
+        else:
+            self._apply_changes(ev, name, desc, tag)
+        if start is not None:
+            if ev.start is not None:
+                self._unindex_interval(date_obj, ev)
+            ev.start, ev.end = start, end
+            intervals = self._day_intervals.get(date_obj)
+            if intervals is None:
+                intervals = self._day_intervals[date_obj] = DayIntervals()
+            intervals.add(to_minutes(start), to_minutes(end), ev.id)
+        self._notify((date_obj,))
+
+
+    def move_event(self, event_id: int, new_date: datetime.date):
+        """Mueve un evento a otra fecha sin cambiar su id (las ocurrencias de una regla no se mueven)."""
+        if not isinstance(new_date, datetime.date):
+            raise TypeError("new_date debe ser datetime.date")
+        found = self._by_id.get(event_id)
+        if found is None:
+            if event_id in self.rules:
+                raise ValueError(f"'{event_id}' es el id de una regla de recurrencia: sus ocurrencias no se pueden mover "
+                                 "(quite la ocurrencia con add_recurrence_exception y añada un evento en la nueva fecha).")
+            raise KeyError(f"El evento '{event_id}' no existe.")
+
+        date_obj, ev = found
+        if date_obj == new_date:
+            return
+        with self.batch():
+            self._discard(date_obj, ev)
+            self._insert(new_date, ev)
+            self._notify((date_obj, new_date))
+
+
+    @staticmethod
+    def _apply_changes(ev: Event, name: str | None, desc: str | None, tag: str | None):
+        """Aplica los campos indicados sobre el registro."""
+        if name is not None:
+            ev.name = name
+        if desc is not None:
+            ev.desc = desc
+        if tag is not None:
+            ev.tag = sys.intern(tag)
+
+
+    # --------------------------------------------------
+    # ---------------- [RECURRENCIAS] ------------------
+    # --------------------------------------------------
+    def add_recurrence(self, start_date: datetime.date, name: str, desc: str, tag: str, freq: str = "daily", interval: int = 1,
+                       by_weekday=None, until: datetime.date | None = None, count: int | None = None, exceptions=None) -> int:
+        """
+        Añade un evento recurrente guardado como una única regla (ver `RecurrenceRule`) y retorna su id.
+        Las ocurrencias no se materializan: se expanden solo para la ventana consultada o visible.
+
+        Ejemplo:
+            add_recurrence(date(2025, 1, 6), "Standup", "", "trabajo", freq="weekly", by_weekday=range(5))
+            → todos los días laborables, sin fecha de fin
+        """
+        if not isinstance(name, str) or not name:
+            raise ValueError("name debe ser un string no vacío")
+        if tag not in self.tags:
+            raise ValueError(f"El tag '{tag}' no existe. Debe crearse antes de usarlo.")
+
+        rule = RecurrenceRule(start_date, freq=freq, interval=interval, by_weekday=by_weekday, until=until, count=count, exceptions=exceptions)
+        return self._add_rule(rule, name, desc, tag)
+
+
+    def _add_rule(self, rule: RecurrenceRule, name: str, desc: str, tag: str) -> int:
+        """Guarda una regla ya construida con su plantilla de evento y retorna su id."""
+        rule_id = self._new_id()
+        self.rules[rule_id] = {"rule": rule, "event": Event(rule_id, name, desc, tag, recurring=True)}
+        self._rule_cache.clear()
+        self._notify(rules=(rule,))
+        return rule_id
+
+
+    def remove_recurrence(self, rule_id: int) -> bool:
+        """Elimina una regla de recurrencia con todas sus ocurrencias."""
+        entry = self.rules.pop(rule_id, None)
+        if entry is None:
+            return False
+        self._rule_cache.clear()
+        self._notify(rules=(entry["rule"],))
+        return True
+
+
+    def add_recurrence_exception(self, rule_id: int, date_obj: datetime.date):
+        """Excluye una fecha concreta de una regla de recurrencia."""
+        if rule_id not in self.rules:
+            raise KeyError(f"La regla '{rule_id}' no existe.")
+        if not isinstance(date_obj, datetime.date):
+            raise TypeError("date_obj debe ser datetime.date")
+        self.rules[rule_id]["rule"].exceptions.add(date_obj)
+        self._rule_cache.clear()
+        self._notify((date_obj,))
+
+
+    def get_recurrences(self) -> dict[int, dict]:
+        """Retorna las reglas guardadas como dicts serializables {rule_id: {...}}."""
+        return {
+            rule_id: {"name": entry["event"].name, "desc": entry["event"].desc, "tag": entry["event"].tag, **entry["rule"].to_dict()}
+            for rule_id, entry in self.rules.items()
+        }
+
+
+    def _month_occurrences(self, year: int, month: int) -> dict[datetime.date, list[Event]]:
+        """Expande (y guarda en caché) las ocurrencias de todas las reglas dentro de un mes."""
+        key = (year, month)
+        occurrences = self._rule_cache.get(key)
+        if occurrences is None:
+            if len(self._rule_cache) >= self.RULE_CACHE_MONTHS:
+                del self._rule_cache[next(iter(self._rule_cache))]
+            first = datetime.date(year, month, 1)
+            last = datetime.date(year, month, calendar.monthrange(year, month)[1])
+            occurrences = {}
+            for entry in self.rules.values():
+                for date_obj in entry["rule"].occurrences(first, last):
+                    occurrences.setdefault(date_obj, []).append(entry["event"])
+            self._rule_cache[key] = occurrences
+        return occurrences
+
+
+    def _events_on(self, date_obj: datetime.date) -> list[Event]:
+        """Registros guardados más las ocurrencias de reglas de una fecha."""
+        day_events = self.events.get(date_obj)
+        stored = list(day_events.values()) if day_events else []
+        if not self.rules:
+            return stored
+        occurrences = self._month_occurrences(date_obj.year, date_obj.month).get(date_obj)
+        return stored + occurrences if occurrences else stored
+
+
+    @staticmethod
+    def _rule_pairs(entry: dict, start: datetime.date, end: datetime.date):
+        """Genera tuplas (fecha, evento) de una regla dentro de [start, end]."""
+        for date_obj in entry["rule"].occurrences(start, end):
+            yield date_obj, entry["event"]
+
+
+    # --------------------------------------------------
+    # -------------------- [BATCH] ---------------------
+    # --------------------------------------------------
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa varias modificaciones: dentro del bloque no se notifica nada y al salir se envía una sola
+        notificación con todas las fechas y reglas afectadas. Los batch pueden anidarse.
+
+        Ejemplo:
+            with store.batch():
+                for d in fechas:
+                    store.add_event(d, "Guardia", "", "trabajo")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and (self._dirty_dates or self._dirty_rules):
+                dates, self._dirty_dates = self._dirty_dates, set()
+                rules, self._dirty_rules = self._dirty_rules, []
+                self._notify(dates, rules)
+
+
+    # --------------------------------------------------
+    # ---------------- [NOTIFICACIONES] ----------------
+    # --------------------------------------------------
+    def subscribe(self, callback, window=None):
+        """
+        Registra `callback(change)`, que se llama tras cada modificación (o al cerrar el batch) con un `Change`
+        que indica qué fechas y qué reglas cambiaron. Retorna el callback para poder desuscribirlo.
+
+        `window()` (opcional) retorna los rangos de fechas [(start, end), ...] que muestra ahora el observador:
+        si se indica, solo se le avisa de los cambios que tocan esos rangos. Así, con varios calendarios sobre el
+        mismo store, una modificación llega solo a los que tienen la fecha en pantalla.
+        """
+        self._observers.append((callback, window))
+        return callback
+
+
+    def unsubscribe(self, callback):
+        """Deja de notificar a `callback` (no hace nada si no estaba suscrito)."""
+        self._observers = [(observer, window) for observer, window in self._observers if observer != callback]
+
+
+    def subscribers(self) -> list:
+        """Callbacks suscritos, en orden de suscripción."""
+        return [observer for observer, _ in self._observers]
+
+
+    def _notify(self, dates=(), rules=()):
+        """Avisa a los observadores de un cambio (o lo acumula si hay un batch abierto)."""
+        if not dates and not rules:
+            return
+        if self._batch_depth:
+            self._dirty_dates.update(dates)
+            self._dirty_rules.extend(rules)
+            return
+        change = Change(dates, rules)
+        for callback, window in list(self._observers):
+            if window is None or change.intersects(window()):
+                callback(change)
+
+
+    # --------------------------------------------------
+    # ----------------- [ELIMINACIÓN] ------------------
+    # --------------------------------------------------
+    def remove_event(self, date_obj: datetime.date, name: str) -> bool:
+        """
+        Elimina un evento por nombre de una fecha específica.
+        Si es la ocurrencia de una regla, la fecha se añade a las excepciones de la regla.
+        """
+        removed_occurrence = False
+        for entry in self.rules.values():
+            if entry["event"].name == name and entry["rule"].occurs_on(date_obj):
+                entry["rule"].exceptions.add(date_obj)
+                removed_occurrence = True
+        if removed_occurrence:
+            self._rule_cache.clear()
+            self._notify((date_obj,))
+
+        if date_obj not in self.events:
+            return removed_occurrence
+
+        matches = [ev for ev in self.events[date_obj].values() if ev.name == name]
+        for ev in matches:
+            self._discard(date_obj, ev)
+
+        self._notify((date_obj,))
+        return bool(matches) or removed_occurrence
+
+
+    def clear_day(self, date_obj: datetime.date) -> bool:
+        """
+        Elimina todos los eventos de una fecha específica.
+        Retorna True si había eventos y fueron eliminados, False si no había nada.
+        """
+        if not isinstance(date_obj, datetime.date):
+            raise TypeError("date_obj debe ser datetime.date")
+
+        # Las ocurrencias de reglas del día pasan a ser excepciones
+        removed_occurrence = False
+        for entry in self.rules.values():
+            if entry["rule"].occurs_on(date_obj):
+                entry["rule"].exceptions.add(date_obj)
+                removed_occurrence = True
+        if removed_occurrence:
+            self._rule_cache.clear()
+            self._notify((date_obj,))
+
+        if date_obj not in self.events:
+            return removed_occurrence
+
+        for ev in list(self.events[date_obj].values()):
+            self._discard(date_obj, ev)
+        self._notify((date_obj,))
+        return True
+
+
+    def _discard(self, date_obj: datetime.date, ev: Event):
+        """Quita el registro de su fecha y de todos los índices; borra la fecha si queda vacía."""
+        day_events = self.events[date_obj]
+        del day_events[ev.id]
+        del self._by_id[ev.id]
+        self._unindex_tag(ev.tag, date_obj)
+        self._unindex_text(ev)
+        if ev.start is not None:
+            self._unindex_interval(date_obj, ev)
+        if not day_events:
+            self._delete_date(date_obj)
+
+
+    def _unindex_interval(self, date_obj: datetime.date, ev: Event):
+        """Quita el evento con hora del índice de intervalos de su día."""
+        intervals = self._day_intervals.get(date_obj)
+        if intervals is not None:
+            intervals.remove(to_minutes(ev.start), to_minutes(ev.end), ev.id)
+            if not intervals:
+                del self._day_intervals[date_obj]
+
+
+    def _index_tag(self, tag_name: str, date_obj: datetime.date):
+        """Cuenta un evento de `tag_name` en `date_obj` en el índice de tags y en los totales del mes."""
+        tag_dates = self._tag_dates.setdefault(tag_name, {})
+        tag_dates[date_obj] = tag_dates.get(date_obj, 0) + 1
+        month_counts = self._month_counts.setdefault((date_obj.year, date_obj.month), {})
+        month_counts[tag_name] = month_counts.get(tag_name, 0) + 1
+
+
+    def _unindex_tag(self, tag_name: str | None, date_obj: datetime.date):
+        """Descuenta un evento de `tag_name` en `date_obj` del índice de tags y de los totales del mes."""
+        tag_dates = self._tag_dates.get(tag_name)
+        if tag_dates is None or date_obj not in tag_dates:
+            return
+        tag_dates[date_obj] -= 1
+        if tag_dates[date_obj] <= 0:
+            del tag_dates[date_obj]
+            if not tag_dates:
+                del self._tag_dates[tag_name]
+        key = (date_obj.year, date_obj.month)
+        month_counts = self._month_counts[key]
+        month_counts[tag_name] -= 1
+        if month_counts[tag_name] <= 0:
+            del month_counts[tag_name]
+            if not month_counts:
+                del self._month_counts[key]
+
+
+    def _delete_date(self, date_obj: datetime.date):
+        """Quita la fecha del almacén y de su índice ordenado."""
+        del self.events[date_obj]
+        i = bisect_left(self._dates, date_obj)
+        if i < len(self._dates) and self._dates[i] == date_obj:
+            del self._dates[i]
+
+
+    # --------------------------------------------------
+    # ------------------ [CONSULTAS] -------------------
+    # --------------------------------------------------
+    def get_events(self, date_obj: datetime.date, as_dict: bool = True) -> list:
+        """
+        Retorna una lista de los eventos para la fecha indicada (incluidas las ocurrencias de reglas).
+        Con `as_dict=False` retorna los registros `Event` sin convertirlos.
+        """
+        events = self._events_on(date_obj)
+        return [ev.to_dict() for ev in events] if as_dict else events
+
+
+    def get_events_by_tag(self, tag: str, start: datetime.date | None = None, end: datetime.date | None = None,
+                          as_dict: bool = True) -> dict[datetime.date, list]:
+        """
+        Retorna un dict (en orden cronológico) con todas las fechas que tienen eventos del tag indicado,
+        opcionalmente limitado a [start, end]. Las reglas abiertas solo se expanden si se indica `end`.
+        """
+        tagged = {}
+        for date_obj in self._tag_dates.get(tag, ()):
+            if (start is None or date_obj >= start) and (end is None or date_obj <= end):
+                tagged[date_obj] = [ev for ev in self.events[date_obj].values() if ev.tag == tag]
+
+        for entry in self.rules.values():
+            if entry["event"].tag != tag:
+                continue
+            rule = entry["rule"]
+            rule_end = end if end is not None else rule.last
+            if rule_end is None:
+                continue
+            for date_obj in rule.occurrences(start or rule.start, rule_end):
+                tagged.setdefault(date_obj, []).append(entry["event"])
+
+        if as_dict:
+            return {date_obj: [ev.to_dict() for ev in tagged[date_obj]] for date_obj in sorted(tagged)}
+        return {date_obj: tagged[date_obj] for date_obj in sorted(tagged)}
+
+
+    def get_timed_events(self, date_obj: datetime.date) -> list[Event]:
+        """Eventos con hora de una fecha, ordenados por hora de inicio."""
+        intervals = self._day_intervals.get(date_obj)
+        if intervals is None:
+            return []
+        return [self._by_id[event_id][1] for _, _, event_id in intervals.items]
+
+
+    def get_overlapping(self, date_obj: datetime.date, start: datetime.time, end: datetime.time, as_dict: bool = True) -> list:
+        """
+        Eventos con hora de `date_obj` que se solapan con [start, end) (p. ej. "qué hay de 14:00 a 15:00"),
+        ordenados por inicio. Usa el índice de intervalos del día: O(log n + k).
+        """
+        self._check_times(start, end)
+        intervals = self._day_intervals.get(date_obj)
+        if intervals is None:
+            return []
+        events = [self._by_id[event_id][1] for event_id in intervals.overlapping(to_minutes(start), to_minutes(end))]
+        return [ev.to_dict() for ev in events] if as_dict else events
+
+
+    def day_layout(self, date_obj: datetime.date, visible_only: bool = True, hidden=None) -> list[tuple[Event, int, int]]:
+        """
+        Reparte en columnas los eventos con hora de un día para dibujarlos lado a lado sin solaparse.
+        Retorna tuplas (evento, columna, columnas) en orden de inicio (ver `layout_intervals`).
+        `hidden` son los tags que no se muestran; por defecto, los ocultos del store.
+        """
+        intervals = self._day_intervals.get(date_obj)
+        if intervals is None:
+            return []
+        items = intervals.items
+        if visible_only:
+            hidden = self.hidden_tags() if hidden is None else hidden
+            items = [item for item in items if self._by_id[item[2]][1].tag not in hidden]
+        layout = layout_intervals(items)
+        return [(self._by_id[event_id][1], *layout[event_id]) for _, _, event_id in items]
+
+
+    def hidden_tags(self) -> set[str]:
+        """Nombres de los tags ocultos."""
+        return {name for name, info in self.tags.items() if not info.get("visible", True)}
+
+
+    def day_counts(self, start: datetime.date, end: datetime.date, hidden=None) -> dict[datetime.date, int]:
+        """
+        Número de eventos visibles por fecha en [start, end] (solo las fechas con alguno), incluidas las ocurrencias
+        de reglas. Sale de los contadores por tag y día, sin recorrer las listas de eventos: O(fechas · tags ocultos).
+        `hidden` son los tags que no se cuentan; por defecto, los ocultos del store.
+        """
+        hidden = self.hidden_tags() if hidden is None else hidden
+        hidden_dates = [self._tag_dates[tag] for tag in hidden if tag in self._tag_dates]
+        counts = {}
+        for date_obj in self._dates[bisect_left(self._dates, start):bisect_right(self._dates, end)]:
+            count = len(self.events[date_obj]) - sum(tag_dates.get(date_obj, 0) for tag_dates in hidden_dates)
+            if count:
+                counts[date_obj] = count
+
+        if self.rules:
+            year, month = start.year, start.month
+            while (year, month) <= (end.year, end.month):
+                for date_obj, evs in self._month_occurrences(year, month).items():
+                    count = sum(ev.tag not in hidden for ev in evs)
+                    if count and start <= date_obj <= end:
+                        counts[date_obj] = counts.get(date_obj, 0) + count
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return counts
+
+
+    def month_counts(self, year: int, hidden=None) -> dict[int, int]:
+        """Número de eventos visibles de cada mes del año ({mes: total}, los 12 meses), con los totales por tag y mes."""
+        hidden = self.hidden_tags() if hidden is None else hidden
+        counts = {}
+        for month in range(1, 13):
+            totals = self._month_counts.get((year, month), {})
+            count = sum(n for tag, n in totals.items() if tag not in hidden)
+            if self.rules:
+                count += sum(ev.tag not in hidden for evs in self._month_occurrences(year, month).values() for ev in evs)
+            counts[month] = count
+        return counts
+
+
+    def get_upcoming_events(self, days_ahead: int = 7, from_date: datetime.date | None = None, as_dict: bool = True,
+                            hidden=None) -> list[tuple[datetime.date, dict]]:
+        """
+        Retorna una lista con los eventos que ocurren dentro de los próximos `days_ahead` días.
+        
+        Parámetros:
+            days_ahead (int): cantidad de días hacia adelante desde `from_date` (por defecto, hoy).
+            from_date (datetime.date | None): fecha base desde la cual buscar. Si no se pasa, se usa hoy.
+            hidden (set[str] | None): tags que se omiten; por defecto, los ocultos del store.
+        
+        Retorna:
+            list[tuple[datetime.date, dict]]: lista de tuplas (fecha, evento), ordenadas cronológicamente.
+        """
+        if not isinstance(days_ahead, int) or days_ahead < 1:
+            raise ValueError("days_ahead debe ser un entero positivo.")
+        
+        if from_date is None:
+            from_date = datetime.date.today()
+        elif not isinstance(from_date, datetime.date):
+            raise TypeError("from_date debe ser un objeto datetime.date.")
+        
+        end_date = from_date + datetime.timedelta(days=days_ahead)
+        return self.get_events_between(from_date, end_date, visible_only=True, as_dict=as_dict, hidden=hidden)
+
+
+    def get_events_between(self, start: datetime.date, end: datetime.date, visible_only: bool = False,
+                           as_dict: bool = True, hidden=None) -> list[tuple[datetime.date, dict]]:
+        """
+        Retorna los eventos entre `start` y `end` (ambos inclusive) como tuplas (fecha, evento), ya en orden cronológico.
+
+        Usa el índice ordenado de fechas, por lo que el coste es O(log n + k) sin ordenar en cada llamada.
+        Si `visible_only=True` se omiten los eventos cuyo tag está oculto (los de `hidden` o, por defecto, los ocultos
+        del store); con `as_dict=False` se retornan registros `Event`.
+        """
+        if not isinstance(start, datetime.date) or not isinstance(end, datetime.date):
+            raise TypeError("start y end deben ser datetime.date")
+        if end < start:
+            return []
+
+        lo = bisect_left(self._dates, start)
+        hi = bisect_right(self._dates, end)
+        pairs = ((date_obj, ev) for date_obj in self._dates[lo:hi] for ev in self.events[date_obj].values())
+        if self.rules:
+            # Cada regla genera sus ocurrencias ya ordenadas: basta con mezclarlas
+            streams = [self._rule_pairs(entry, start, end) for entry in self.rules.values()]
+            pairs = heapq.merge(pairs, *streams, key=lambda pair: pair[0])
+
+        if visible_only:
+            hidden = self.hidden_tags() if hidden is None else hidden
+            pairs = ((date_obj, ev) for date_obj, ev in pairs if ev.tag not in hidden)
+        return [(date_obj, ev.to_dict() if as_dict else ev) for date_obj, ev in pairs]
+    
+
+    # --------------------------------------------------
+    # ------------------- [BÚSQUEDA] -------------------
+    # --------------------------------------------------
+    NAME_WEIGHT = 3  # peso de un token del nombre frente a uno de la descripción (1)
+
+    @staticmethod
+    def tokenize(text: str) -> list[str]:
+        """Separa un texto en tokens en minúsculas y sin tildes ("Reunión" → ["reunion"])."""
+        text = unicodedata.normalize("NFKD", text.casefold())
+        text = "".join(c for c in text if not unicodedata.combining(c))
+        return _TOKEN_RE.findall(text)
+
+
+    def _text_weights(self, ev: Event) -> dict[str, int]:
+        """Peso de cada token del evento: NAME_WEIGHT por aparición en el nombre y 1 en la descripción."""
+        weights = {}
+        for token in self.tokenize(ev.name):
+            weights[token] = weights.get(token, 0) + self.NAME_WEIGHT
+        for token in self.tokenize(ev.desc or ""):
+            weights[token] = weights.get(token, 0) + 1
+        return weights
+
+
+    def _index_text(self, ev: Event):
+        for token, weight in self._text_weights(ev).items():
+            postings = self._text_index.get(token)
+            if postings is None:
+                postings = self._text_index[token] = {}
+                insort(self._tokens, token)
+            postings[ev.id] = weight
+
+
+    def _unindex_text(self, ev: Event):
+        for token in self._text_weights(ev):
+            postings = self._text_index.get(token)
+            if postings is None:
+                continue
+            postings.pop(ev.id, None)
+            if not postings:
+                del self._text_index[token]
+                i = bisect_left(self._tokens, token)
+                if i < len(self._tokens) and self._tokens[i] == token:
+                    del self._tokens[i]
+
+
+    def _match_term(self, term: str) -> dict[int, int]:
+        """Puntuación por id de los eventos con algún token que empiece por `term` (coincidencia exacta puntúa doble)."""
+        scores = {}
+        i = bisect_left(self._tokens, term)
+        while i < len(self._tokens) and self._tokens[i].startswith(term):
+            token = self._tokens[i]
+            factor = 2 if token == term else 1
+            for event_id, weight in self._text_index[token].items():
+                scores[event_id] = scores.get(event_id, 0) + weight * factor
+            i += 1
+        return scores
+
+
+    def search_events(self, query: str, tag: str | None = None, start: datetime.date | None = None,
+                      end: datetime.date | None = None, order: str = "date", limit: int | None = None,
+                      as_dict: bool = True) -> list[tuple[datetime.date, dict]]:
+        """
+        Busca eventos cuyo nombre o descripción contengan todos los términos de `query`, cada uno como prefijo
+        de una palabra ("dent" encuentra "Dentista"); no distingue mayúsculas ni tildes.
+
+        Retorna tuplas (fecha, evento) dentro de [start, end] y del tag indicado, en orden cronológico o, con
+        `order="rank"`, de mayor a menor relevancia (las coincidencias en el nombre y las palabras completas pesan
+        más). Usa un índice invertido que se mantiene al añadir, editar y borrar; las reglas de recurrencia se
+        comprueban aparte y, como en `get_events_by_tag`, las abiertas solo se expanden si se indica `end`.
+        """
+        if order not in ("date", "rank"):
+            raise ValueError("order debe ser 'date' o 'rank'.")
+        terms = self.tokenize(query)
+        if not terms:
+            return []
+
+        scores = None
+        for term in sorted(set(terms), key=len, reverse=True):  # los términos largos suelen ser los más selectivos
+            matched = self._match_term(term)
+            if scores is None:
+                scores = matched
+            else:
+                scores = {event_id: score + matched[event_id] for event_id, score in scores.items() if event_id in matched}
+            if not scores:
+                break  # ningún evento guardado coincide, pero las reglas se comprueban igualmente
+
+        results = []
+        for event_id, score in scores.items():
+            date_obj, ev = self._by_id[event_id]
+            if (tag is None or ev.tag == tag) and (start is None or date_obj >= start) and (end is None or date_obj <= end):
+                results.append((date_obj, score, ev))
+
+        for entry in self.rules.values():
+            ev = entry["event"]
+            if tag is not None and ev.tag != tag:
+                continue
+            score = self._rule_score(ev, terms)
+            if not score:
+                continue
+            rule = entry["rule"]
+            rule_end = end if end is not None else rule.last
+            if rule_end is None:
+                continue
+            for date_obj in rule.occurrences(start or rule.start, rule_end):
+                results.append((date_obj, score, ev))
+
+        if order == "rank":
+            results.sort(key=lambda item: (-item[1], item[0]))
+        else:
+            results.sort(key=lambda item: item[0])
+        if limit is not None:
+            results = results[:limit]
+        return [(date_obj, ev.to_dict() if as_dict else ev) for date_obj, _, ev in results]
+
+
+    def _rule_score(self, ev: Event, terms: list[str]) -> int:
+        """Puntuación de la plantilla de una regla con la misma fórmula que el índice (0 si falta algún término)."""
+        weights = self._text_weights(ev)
+        total = 0
+        for term in set(terms):
+            score = sum(weight * (2 if token == term else 1) for token, weight in weights.items() if token.startswith(term))
+            if not score:
+                return 0
+            total += score
+        return total
+
+    # --------------------------------------------------
+    # -------------- [IMPORTAR / EXPORTAR] -------------
+    # --------------------------------------------------
+    def export_events(self, filepath: str, fmt: str | None = None, compact: bool = False) -> None:
+        """
+        Exporta tags, eventos y reglas escribiendo fecha a fecha, sin construir el documento entero en memoria.
+
+        Formatos (`fmt`, por defecto según la extensión: ".jsonl"/".ndjson" → "jsonl", si no "json"):
+            "json": {"tags": {...}, "events": {"AAAA-MM-DD": [evento, ...]}, "rules": [...]},
+                    indentado con 4 espacios o en una sola línea si `compact=True`.
+            "jsonl": una línea por registro: primero {"type": "header", "tags": {...}}, después una línea
+                     {"type": "rule", ...} por regla y una {"type": "event", "date", "name", "desc", "tag"} por evento.
+        """
+        fmt = fmt or self._format_from_path(filepath)
+        with open(filepath, "w", encoding="utf-8") as f:
+            if fmt == "jsonl":
+                self._write_jsonl(f)
+            elif fmt == "json":
+                self._write_json(f, compact)
+            else:
+                raise ValueError("fmt debe ser 'json' o 'jsonl'.")
+
+
+    def import_events(self, filepath: str, fmt: str | None = None, progress=None, progress_every: int = 10_000) -> int:
+        """
+        Importa un archivo generado por `export_events` y retorna cuántos eventos se añadieron (las reglas aparte).
+
+        Todo se inserta dentro de un único `batch()`, así que la vista se repinta una vez al terminar. El formato
+        "jsonl" se lee línea a línea en memoria constante; "json" se carga entero (es un único documento).
+        Los tags del archivo se crean o actualizan y los ids se asignan de nuevo.
+        `progress(eventos, bytes_leídos, bytes_totales)` se llama cada `progress_every` eventos y al final.
+        """
+        fmt = fmt or self._format_from_path(filepath)
+        if fmt not in ("json", "jsonl"):
+            raise ValueError("fmt debe ser 'json' o 'jsonl'.")
+        total_bytes = os.path.getsize(filepath)
+        imported = 0
+        with self.batch(), open(filepath, "rb") as f:
+            if fmt == "json":
+                data = json.load(f)
+                for tag_name, info in data.get("tags", {}).items():
+                    self._import_tag(tag_name, info)
+                for rule in data.get("rules", ()):
+                    self._import_rule(rule)
+                for iso, events in data.get("events", {}).items():
+                    date_obj = datetime.date.fromisoformat(iso)
+                    for ev in events:
+                        self.add_event(date_obj, ev["name"], ev.get("desc", ""), ev["tag"], *self._parse_times(ev))
+                        imported += 1
+                        if progress is not None and imported % progress_every == 0:
+                            progress(imported, total_bytes, total_bytes)
+            else:
+                read = 0
+                for line in f:
+                    read += len(line)
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    kind = record.get("type")
+                    if kind == "event":
+                        self.add_event(datetime.date.fromisoformat(record["date"]), record["name"], record.get("desc", ""), record["tag"],
+                                       *self._parse_times(record))
+                        imported += 1
+                        if progress is not None and imported % progress_every == 0:
+                            progress(imported, read, total_bytes)
+                    elif kind == "header":
+                        for tag_name, info in record.get("tags", {}).items():
+                            self._import_tag(tag_name, info)
+                    elif kind == "rule":
+                        self._import_rule(record)
+                    else:
+                        raise ValueError(f"Registro desconocido en {filepath}: {kind!r}")
+        if progress is not None:
+            progress(imported, total_bytes, total_bytes)
+        return imported
+
+
+    @staticmethod
+    def _format_from_path(filepath: str) -> str:
+        return "jsonl" if os.path.splitext(filepath)[1].lower() in (".jsonl", ".ndjson") else "json"
+
+
+    @staticmethod
+    def _parse_times(record: dict) -> tuple:
+        """(start, end) de un evento exportado, o (None, None) si es de todo el día."""
+        if record.get("start") is None:
+            return None, None
+        return datetime.time.fromisoformat(record["start"]), datetime.time.fromisoformat(record["end"])
+
+
+    def _import_tag(self, tag_name: str, info: dict):
+        self.add_tag(tag_name, color=info.get("color", "#3A7FF6"), desc=info.get("desc", ""), visible=info.get("visible", True))
+
+
+    def _import_rule(self, data: dict):
+        if data["tag"] not in self.tags:
+            raise ValueError(f"El tag '{data['tag']}' no existe.")
+        self._add_rule(RecurrenceRule.from_dict(data), data["name"], data.get("desc", ""), data["tag"])
+
+
+    def _write_jsonl(self, f):
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        f.write(dumps({"type": "header", "version": 1, "tags": self.tags}) + "\n")
+        for rule in self.get_recurrences().values():
+            f.write(dumps({"type": "rule", **rule}) + "\n")
+        for date_obj in self._dates:
+            iso = date_obj.isoformat()
+            for ev in self.events[date_obj].values():
+                record = {"type": "event", "date": iso, "name": ev.name, "desc": ev.desc, "tag": ev.tag}
+                if ev.start is not None:
+                    record["start"] = ev.start.isoformat(timespec="minutes")
+                    record["end"] = ev.end.isoformat(timespec="minutes")
+                f.write(dumps(record) + "\n")
+
+
+    def _write_json(self, f, compact: bool):
+        """Escribe el documento JSON por partes: cada fecha se serializa y se escribe por separado."""
+        if compact:
+            encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+            newline, pad, colon = "", lambda level: "", ":"
+        else:
+            encoder = json.JSONEncoder(ensure_ascii=False, indent=4)
+            newline, pad, colon = "\n", lambda level: "    " * level, ": "
+
+        def dump(obj, level: int) -> str:
+            return encoder.encode(obj).replace("\n", "\n" + pad(level))
+
+        f.write("{" + newline + pad(1) + '"tags"' + colon + dump(self.tags, 1) + "," + newline)
+        f.write(pad(1) + '"events"' + colon + "{")
+        for i, date_obj in enumerate(self._dates):
+            events = [ev.to_dict() for ev in self.events[date_obj].values()]
+            f.write(("," if i else "") + newline + pad(2) + '"' + date_obj.isoformat() + '"' + colon + dump(events, 2))
+        f.write((newline + pad(1) if self._dates else "") + "}," + newline)
+        f.write(pad(1) + '"rules"' + colon + dump(list(self.get_recurrences().values()), 1) + newline + "}")
+
+
+    def visible_events(self, date_obj: datetime.date, hidden=None) -> list[Event]:
+        """
+        Registros de la fecha (incluidas ocurrencias de reglas) cuyo tag está visible.
+        `hidden` son los tags que no se muestran; por defecto, los ocultos del store.
+        """
+        if hidden is not None:
+            return [ev for ev in self._events_on(date_obj) if ev.tag not in hidden]
+        return [ev for ev in self._events_on(date_obj) if self.tags.get(ev.tag, {}).get("visible", True)]
+
+
+    def event_signature(self, events: list[Event]) -> tuple:
+        """Firma de lo que se pinta para una lista de eventos; si no cambia, la celda no necesita repintarse."""
+        return tuple((ev.name, ev.desc, ev.tag, self.tags.get(ev.tag, {}).get("color"), ev.start) for ev in events)
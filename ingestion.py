@@ -0,0 +1,127 @@
+import queue
+import time
+
+
+class EventIngestor:
+    """
+    Cola thread-safe para cargar eventos desde hilos de trabajo.
+
+    Los hilos solo encolan operaciones (`add_event`, `remove_event_by_id`, `update_event`, ...); el hilo de Tk
+    vacía la cola con `after()` en porciones de como mucho `slice_ms` milisegundos, cada una dentro de un
+    `batch()` del store, de modo que cada fecha afectada se repinta una sola vez por porción. Si la cola llega
+    a `max_pending` operaciones, `submit` bloquea al productor (contrapresión) hasta que haya hueco.
+
+    Ejemplo:
+        ingestor = calendar.start_ingestion()
+        threading.Thread(target=lambda: [ingestor.add_event(d, n, "", "sync") for d, n in filas]).start()
+    """
+
+    OPERATIONS = ("add_event", "add_events", "remove_event_by_id", "update_event", "move_event",
+                  "remove_event", "clear_day", "add_recurrence", "remove_recurrence")
+
+    def __init__(self, calendar, max_pending: int = 10_000, slice_ms: float = 8, interval_ms: int = 15,
+                 idle_interval_ms: int = 50, on_done=None, on_error=None):
+        if max_pending < 1:
+            raise ValueError("max_pending debe ser un entero positivo.")
+        self.calendar = calendar
+        self.queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self.slice_ms = slice_ms  # tiempo máximo de cada porción en el hilo de Tk
+        self.interval_ms = interval_ms  # espera entre porciones mientras quedan operaciones
+        self.idle_interval_ms = idle_interval_ms  # espera entre sondeos con la cola vacía
+        self.on_done = on_done  # on_done(operación, resultado), en el hilo de Tk
+        self.on_error = on_error  # on_error(operación, excepción), en el hilo de Tk
+        self.errors: list[tuple[tuple, Exception]] = []  # errores si no hay on_error
+        self.applied = 0  # operaciones aplicadas
+        self._job = None
+
+    # --------------------------------------------------
+    # ------------- [HILOS PRODUCTORES] ----------------
+    # --------------------------------------------------
+    def submit(self, method: str, *args, timeout: float | None = None, **kwargs):
+        """
+        Encola una llamada al store (se puede usar desde cualquier hilo).
+        Bloquea si la cola está llena; con `timeout` lanza `queue.Full` si no hay hueco a tiempo.
+        """
+        if method not in self.OPERATIONS:
+            raise ValueError(f"Operación no soportada: '{method}'.")
+        self.queue.put((method, args, kwargs), timeout=timeout)
+
+
+    def add_event(self, date_obj, name: str, desc: str, tag: str, start=None, end=None, timeout: float | None = None):
+        self.submit("add_event", date_obj, name, desc, tag, start, end, timeout=timeout)
+
+
+    def remove_event_by_id(self, event_id: int, series: bool = False, timeout: float | None = None):
+        self.submit("remove_event_by_id", event_id, series, timeout=timeout)
+
+
+    def update_event(self, event_id: int, timeout: float | None = None, **changes):
+        self.submit("update_event", event_id, timeout=timeout, **changes)
+
+
+    def move_event(self, event_id: int, new_date, timeout: float | None = None):
+        self.submit("move_event", event_id, new_date, timeout=timeout)
+
+
+    @property
+    def pending(self) -> int:
+        """Operaciones encoladas aún sin aplicar (aproximado si hay hilos encolando)."""
+        return self.queue.qsize()
+
+    # --------------------------------------------------
+    # ---------------- [HILO DE TK] --------------------
+    # --------------------------------------------------
+    def start(self):
+        """Empieza a vaciar la cola periódicamente (llamar desde el hilo de Tk)."""
+        if self._job is None:
+            self._job = self.calendar.after(self.idle_interval_ms, self._drain)
+
+
+    def stop(self, drain: bool = False):
+        """Deja de vaciar la cola; con `drain=True` aplica antes todo lo pendiente de una vez."""
+        if self._job is not None:
+            self.calendar.after_cancel(self._job)
+            self._job = None
+        if drain:
+            self._apply(None)
+
+
+    def _drain(self):
+        """Aplica operaciones durante una porción de tiempo y se vuelve a programar."""
+        self._job = None
+        applied = self._apply(self.slice_ms / 1000)
+        delay = self.interval_ms if applied and not self.queue.empty() else self.idle_interval_ms
+        self._job = self.calendar.after(delay, self._drain)
+
+
+    def _apply(self, budget: float | None) -> int:
+        """Aplica operaciones dentro de un batch hasta vaciar la cola o agotar `budget` segundos."""
+        metrics = self.calendar.metrics
+        started = metrics.start()
+        store = self.calendar.event_store
+        deadline = None if budget is None else time.perf_counter() + budget
+        applied = 0
+        with store.batch():
+            while deadline is None or time.perf_counter() < deadline:
+                try:
+                    operation = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                method, args, kwargs = operation
+                try:
+                    result = getattr(store, method)(*args, **kwargs)
+                except Exception as exc:
+                    if self.on_error is not None:
+                        self.on_error(operation, exc)
+                    else:
+                        self.errors.append((operation, exc))
+                else:
+                    if self.on_done is not None:
+                        self.on_done(operation, result)
+                applied += 1
+
+        self.applied += applied
+        if started is not None and applied:
+            metrics.count("ingested_operations", applied)
+            metrics.stop("ingestion_slice", started)
+        return applied
@@ -0,0 +1,108 @@
+import time
+
+
+class Histogram:
+    """Histograma de duraciones en milisegundos con cubetas fijas, más conteo, total y máximo."""
+
+    BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)  # la última cubeta es "más de 1000 ms"
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+    def observe(self, ms: float):
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if ms <= bound:
+                break
+        else:
+            i = len(self.BUCKETS_MS)
+        self.counts[i] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+
+    def to_dict(self) -> dict:
+        labels = [f"<={bound}" for bound in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}"]
+        return {
+            "count": self.count,
+            "total_ms": self.total,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "max_ms": self.max,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class Instrumentation:
+    """
+    Contadores e histogramas de tiempos de un calendario (desactivados por defecto).
+
+    Los puntos instrumentados comprueban `enabled` antes de medir nada, así que desactivado el coste es
+    una lectura de atributo por llamada. `callback(kind, name, value)` recibe cada medida en el momento
+    (kind es "count" o "timing", value las unidades o los milisegundos) para reenviarla a otro sistema.
+
+    Ejemplo:
+        calendar.enable_instrumentation(lambda kind, name, value: statsd.send(name, value))
+        ...
+        print(calendar.get_metrics()["histograms"]["fill_calendar"]["mean_ms"])
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.callback = None
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, Histogram] = {}
+
+
+    def enable(self, callback=None):
+        self.enabled = True
+        self.callback = callback
+
+
+    def disable(self):
+        self.enabled = False
+        self.callback = None
+
+
+    def reset(self):
+        self.counters.clear()
+        self.histograms.clear()
+
+
+    def count(self, name: str, n: int = 1):
+        """Suma `n` al contador `name` (llamar solo si `enabled`)."""
+        self.counters[name] = self.counters.get(name, 0) + n
+        if self.callback is not None:
+            self.callback("count", name, n)
+
+
+    def start(self) -> float | None:
+        """Retorna el instante actual si está activada, o None; se pasa después a `stop`."""
+        return time.perf_counter() if self.enabled else None
+
+
+    def stop(self, name: str, started: float | None):
+        """Registra en el histograma `name` el tiempo transcurrido desde `start()` (no hace nada si fue None)."""
+        if started is None:
+            return
+        ms = (time.perf_counter() - started) * 1000
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.observe(ms)
+        if self.callback is not None:
+            self.callback("timing", name, ms)
+
+
+    def snapshot(self) -> dict:
+        """Retorna una copia de contadores e histogramas como dicts."""
+        return {
+            "counters": dict(self.counters),
+            "histograms": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+        }
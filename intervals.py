@@ -0,0 +1,187 @@
+import datetime
+import heapq
+from bisect import bisect_left, bisect_right
+
+ONE_DAY = datetime.timedelta(days=1)
+
+
+def to_minutes(value: datetime.time) -> int:
+    """Minutos desde medianoche de una hora."""
+    return value.hour * 60 + value.minute
+
+
+class DayIntervals:
+    """
+    Índice de los eventos con hora de un día: intervalos [inicio, fin) en minutos ordenados por inicio.
+
+    Para las consultas de solape guarda además el máximo acumulado de los finales (se recalcula solo tras un
+    cambio). Como ese máximo es creciente, una búsqueda binaria descarta de golpe todos los intervalos que
+    terminan antes de la ventana, y otra los que empiezan después.
+    """
+
+    __slots__ = ("items", "starts", "_max_end")
+
+    def __init__(self):
+        self.items: list[tuple[int, int, int]] = []  # (inicio, fin, event_id) ordenados
+        self.starts: list[int] = []  # inicios, paralelos a items (para bisect)
+        self._max_end: list[int] | None = None  # máximo acumulado de los finales; None si hay que recalcularlo
+
+
+    def add(self, start: int, end: int, event_id: int):
+        item = (start, end, event_id)
+        i = bisect_left(self.items, item)
+        self.items.insert(i, item)
+        self.starts.insert(i, start)
+        self._max_end = None
+
+
+    def remove(self, start: int, end: int, event_id: int):
+        i = bisect_left(self.items, (start, end, event_id))
+        if i < len(self.items) and self.items[i] == (start, end, event_id):
+            del self.items[i]
+            del self.starts[i]
+            self._max_end = None
+
+
+    def overlapping(self, start: int, end: int) -> list[int]:
+        """Ids de los intervalos que se solapan con [start, end), en orden de inicio."""
+        if self._max_end is None:
+            self._max_end = []
+            running = -1
+            for _, item_end, _ in self.items:
+                running = max(running, item_end)
+                self._max_end.append(running)
+        lo = bisect_right(self._max_end, start)  # antes de lo, todos terminan a tiempo
+        hi = bisect_left(self.starts, end)  # desde hi, todos empiezan después
+        return [event_id for _, item_end, event_id in self.items[lo:hi] if item_end > start]
+
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def layout_intervals(items) -> dict[int, tuple[int, int]]:
+    """
+    Reparte en columnas intervalos que se solapan (partición de intervalos por barrido, O(n log n)).
+
+    `items` son tuplas (inicio, fin, id) ordenadas por inicio. Retorna {id: (columna, columnas)}, donde
+    `columnas` es el número de columnas del grupo de solapes al que pertenece el intervalo, de modo que se
+    dibuja con ancho 1/columnas en la posición `columna`. Cada intervalo ocupa la columna libre más baja.
+    """
+    layout = {}
+    active: list[tuple[int, int]] = []  # (fin, columna) de los intervalos abiertos
+    free: list[int] = []  # columnas liberadas dentro del grupo actual
+    group: list[tuple[int, int]] = []  # (id, columna) del grupo actual
+    columns = 0
+
+    for start, end, item_id in items:
+        while active and active[0][0] <= start:
+            heapq.heappush(free, heapq.heappop(active)[1])
+        if not active and group:
+            # No queda nada abierto: el grupo se cierra y el siguiente empieza desde la columna 0
+            for group_id, column in group:
+                layout[group_id] = (column, columns)
+            group, free, columns = [], [], 0
+        if free:
+            column = heapq.heappop(free)
+        else:
+            column = columns
+            columns += 1
+        heapq.heappush(active, (end, column))
+        group.append((item_id, column))
+
+    for group_id, column in group:
+        layout[group_id] = (column, columns)
+    return layout
+
+
+class DateRanges:
+    """
+    Conjunto de fechas guardado como intervalos [inicio, fin] disjuntos, no contiguos y ordenados.
+
+    Un rango de un trimestre ocupa una sola entrada, así que el tamaño no depende de cuántos días abarque.
+    La pertenencia es una búsqueda binaria, O(log n) en número de intervalos; añadir o quitar un rango
+    fusiona o recorta solo los intervalos que toca.
+    """
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, ranges=()):
+        self.starts: list[datetime.date] = []
+        self.ends: list[datetime.date] = []  # también ordenados, porque los intervalos son disjuntos
+        for start, end in ranges:
+            self.add(start, end)
+
+
+    def __contains__(self, date_obj: datetime.date) -> bool:
+        i = bisect_right(self.starts, date_obj) - 1
+        return i >= 0 and date_obj <= self.ends[i]
+
+
+    def add(self, start: datetime.date, end: datetime.date):
+        """Añade [start, end] (en cualquier orden), fusionándolo con los intervalos que solapa o toca."""
+        if end < start:
+            start, end = end, start
+        lo = bisect_left(self.ends, start - ONE_DAY)  # primer intervalo que termina el día anterior o después
+        hi = bisect_right(self.starts, end + ONE_DAY)  # intervalos que empiezan como mucho el día siguiente
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+        self.starts[lo:hi] = [start]
+        self.ends[lo:hi] = [end]
+
+
+    def remove(self, start: datetime.date, end: datetime.date):
+        """Quita [start, end] (en cualquier orden), recortando los intervalos de los extremos."""
+        if end < start:
+            start, end = end, start
+        lo = bisect_left(self.ends, start)
+        hi = bisect_right(self.starts, end)
+        if lo >= hi:
+            return
+        starts, ends = [], []
+        if self.starts[lo] < start:
+            starts.append(self.starts[lo])
+            ends.append(start - ONE_DAY)
+        if self.ends[hi - 1] > end:
+            starts.append(end + ONE_DAY)
+            ends.append(self.ends[hi - 1])
+        self.starts[lo:hi] = starts
+        self.ends[lo:hi] = ends
+
+
+    def ranges(self) -> list[tuple[datetime.date, datetime.date]]:
+        return list(zip(self.starts, self.ends))
+
+
+    def dates(self):
+        """Genera todas las fechas del conjunto, en orden."""
+        for start, end in zip(self.starts, self.ends):
+            date_obj = start
+            while date_obj <= end:
+                yield date_obj
+                date_obj += ONE_DAY
+
+
+    def copy(self) -> "DateRanges":
+        other = DateRanges()
+        other.starts = list(self.starts)
+        other.ends = list(self.ends)
+        return other
+
+
+    def __len__(self) -> int:
+        """Número de fechas (no de intervalos)."""
+        return sum((end - start).days + 1 for start, end in zip(self.starts, self.ends))
+
+
+    def __bool__(self) -> bool:
+        return bool(self.starts)
+
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DateRanges) and self.starts == other.starts and self.ends == other.ends
+
+
+    def __repr__(self) -> str:
+        return f"DateRanges({self.ranges()})"
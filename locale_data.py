@@ -0,0 +1,55 @@
+class LocaleData:
+    """
+    Tabla con los textos de un locale que usa el calendario.
+
+    month_names: 13 elementos, índice 1-12 (el 0 vacío) con los nombres completos de los meses.
+    day_names_abbr: 7 nombres abreviados empezando en lunes (convención de `datetime.weekday()`).
+    first_weekday: primer día de la semana del locale (0=lunes ... 6=domingo).
+    """
+
+    __slots__ = ("month_names", "day_names_abbr", "first_weekday")
+
+    def __init__(self, month_names, day_names_abbr, first_weekday: int = 6):
+        if len(month_names) != 13:
+            raise ValueError("month_names debe tener 13 elementos (el índice 0 se ignora)")
+        if len(day_names_abbr) != 7:
+            raise ValueError("day_names_abbr debe tener 7 elementos, empezando en lunes")
+        if not isinstance(first_weekday, int) or not 0 <= first_weekday <= 6:
+            raise ValueError("first_weekday debe ser un entero entre 0 (lunes) y 6 (domingo)")
+        self.month_names = tuple(month_names)
+        self.day_names_abbr = tuple(day_names_abbr)
+        self.first_weekday = first_weekday
+
+
+# Caché de todo el proceso: cada locale se construye una sola vez
+_CACHE: dict[str, LocaleData] = {}
+
+
+def register_locale(locale: str, month_names, day_names_abbr, first_weekday: int = 6) -> LocaleData:
+    """
+    Registra a mano la tabla de un locale. Si todos los locales usados se registran así, babel no llega a importarse.
+
+    Ejemplo:
+        register_locale("es", [""] + ["enero", ..., "diciembre"], ["lun", "mar", "mié", "jue", "vie", "sáb", "dom"], 0)
+    """
+    data = LocaleData(month_names, day_names_abbr, first_weekday)
+    _CACHE[locale] = data
+    return data
+
+
+def get_locale_data(locale: str) -> LocaleData:
+    """Retorna la tabla del locale; la primera vez la construye con babel (importado solo en ese momento)."""
+    data = _CACHE.get(locale)
+    if data is None:
+        from babel import Locale
+        from babel.dates import get_day_names, get_month_names
+
+        months = get_month_names('wide', locale=locale)
+        days = get_day_names('abbreviated', locale=locale)
+        data = LocaleData(
+            month_names=[""] + [months[i] for i in range(1, 13)],
+            day_names_abbr=[days[i] for i in range(7)],
+            first_weekday=Locale.parse(locale).first_week_day,
+        )
+        _CACHE[locale] = data
+    return data
@@ -0,0 +1,177 @@
+import datetime
+import calendar
+from datetime import timedelta
+
+
+class RecurrenceRule:
+    """
+    Regla de recurrencia que se guarda una sola vez y se expande bajo demanda para una ventana de fechas.
+
+    Frecuencias: "daily", "weekly", "monthly" y "yearly", cada `interval` unidades a partir de `start`.
+    `by_weekday` (0=lunes ... 6=domingo) filtra los días en "daily" y elige los días de la semana en "weekly".
+    La regla termina en `until` (inclusive) o tras `count` ocurrencias (las excepciones también cuentan);
+    si no se indica ninguno es abierta. `exceptions` son fechas excluidas.
+
+    Ejemplo:
+        RecurrenceRule(date(2025, 1, 6), "weekly", by_weekday={0, 2, 4})  → lunes, miércoles y viernes
+    """
+
+    FREQUENCIES = ("daily", "weekly", "monthly", "yearly")
+
+    def __init__(self, start: datetime.date, freq: str = "daily", interval: int = 1, by_weekday=None,
+                 until: datetime.date | None = None, count: int | None = None, exceptions=None):
+        if not isinstance(start, datetime.date):
+            raise TypeError("start debe ser datetime.date")
+        if freq not in self.FREQUENCIES:
+            raise ValueError(f"freq debe ser una de {self.FREQUENCIES}")
+        if not isinstance(interval, int) or interval < 1:
+            raise ValueError("interval debe ser un entero positivo")
+        if until is not None and not isinstance(until, datetime.date):
+            raise TypeError("until debe ser datetime.date")
+        if until is not None and until < start:
+            raise ValueError("until no puede ser anterior a start")
+        if count is not None and (not isinstance(count, int) or count < 1):
+            raise ValueError("count debe ser un entero positivo")
+
+        if by_weekday is not None:
+            by_weekday = frozenset(by_weekday)
+            if not by_weekday or not all(isinstance(wd, int) and 0 <= wd <= 6 for wd in by_weekday):
+                raise ValueError("by_weekday debe contener enteros entre 0 (lunes) y 6 (domingo)")
+            if freq not in ("daily", "weekly"):
+                raise ValueError("by_weekday solo se admite con freq 'daily' o 'weekly'")
+            # Con un intervalo múltiplo de 7 una regla diaria cae siempre en el mismo día de la semana
+            if freq == "daily" and interval % 7 == 0 and start.weekday() not in by_weekday:
+                raise ValueError("La regla nunca produciría ocurrencias con ese by_weekday")
+        elif freq == "weekly":
+            by_weekday = frozenset((start.weekday(),))
+
+        self.start = start
+        self.freq = freq
+        self.interval = interval
+        self.by_weekday = by_weekday
+        self.until = until
+        self.count = count
+        self.exceptions: set[datetime.date] = set(exceptions or ())
+        self._last = None  # última ocurrencia cuando la regla está limitada por count (se calcula una vez)
+
+
+    # --------------------------------------------------
+    # ------------------ [EXPANSIÓN] -------------------
+    # --------------------------------------------------
+    @property
+    def last(self) -> datetime.date | None:
+        """Última fecha posible de la regla, o None si es abierta."""
+        if self.count is None:
+            return self.until
+        if self._last is None:
+            for i, date_obj in enumerate(self._iter_from(self.start), start=1):
+                if (self.until is not None and date_obj > self.until) or i == self.count:
+                    self._last = min(date_obj, self.until) if self.until is not None else date_obj
+                    break
+        return self._last
+
+
+    def occurrences(self, start: datetime.date, end: datetime.date):
+        """Genera, en orden, las fechas de la regla dentro de [start, end] (sin excepciones)."""
+        last = self.last
+        if last is not None and last < end:
+            end = last
+        if end < start or end < self.start:
+            return
+        for date_obj in self._iter_from(start):
+            if date_obj > end:
+                return
+            if date_obj not in self.exceptions:
+                yield date_obj
+
+
+    def occurs_on(self, date_obj: datetime.date) -> bool:
+        """Indica si la regla tiene una ocurrencia en la fecha indicada."""
+        return next(self.occurrences(date_obj, date_obj), None) is not None
+
+
+    def _iter_from(self, date_from: datetime.date):
+        """Genera sin límite las fechas de la regla a partir de `date_from` (incluida)."""
+        date_from = max(date_from, self.start)
+        start, interval = self.start, self.interval
+
+        if self.freq == "daily":
+            k = -(-(date_from - start).days // interval)
+            date_obj = start + timedelta(days=k * interval)
+            step = timedelta(days=interval)
+            while True:
+                if self.by_weekday is None or date_obj.weekday() in self.by_weekday:
+                    yield date_obj
+                date_obj += step
+
+        elif self.freq == "weekly":
+            first_monday = start - timedelta(days=start.weekday())
+            weeks = (date_from - first_monday).days // 7
+            k = -(-weeks // interval) * interval
+            weekdays = sorted(self.by_weekday)
+            while True:
+                monday = first_monday + timedelta(weeks=k)
+                for wd in weekdays:
+                    date_obj = monday + timedelta(days=wd)
+                    if date_obj >= date_from:
+                        yield date_obj
+                k += interval
+
+        elif self.freq == "monthly":
+            first = start.year * 12 + start.month - 1
+            months = date_from.year * 12 + date_from.month - 1 - first
+            k = max(0, -(-months // interval))
+            while True:
+                year, month = divmod(first + k * interval, 12)
+                if year > datetime.MAXYEAR:
+                    return
+                # Los meses sin ese día (p. ej. 31) se saltan
+                if start.day <= calendar.monthrange(year, month + 1)[1]:
+                    date_obj = datetime.date(year, month + 1, start.day)
+                    if date_obj >= date_from:
+                        yield date_obj
+                k += 1
+
+        else:  # yearly
+            k = max(0, -(-(date_from.year - start.year) // interval))
+            while True:
+                year = start.year + k * interval
+                if year > datetime.MAXYEAR:
+                    return
+                # El 29 de febrero solo aparece en años bisiestos
+                if start.month != 2 or start.day != 29 or calendar.isleap(year):
+                    date_obj = datetime.date(year, start.month, start.day)
+                    if date_obj >= date_from:
+                        yield date_obj
+                k += 1
+
+
+    # --------------------------------------------------
+    # ---------------- [SERIALIZACIÓN] -----------------
+    # --------------------------------------------------
+    def to_dict(self) -> dict:
+        """Representación serializable a JSON de la regla."""
+        return {
+            "start": self.start.isoformat(),
+            "freq": self.freq,
+            "interval": self.interval,
+            "by_weekday": sorted(self.by_weekday) if self.by_weekday is not None else None,
+            "until": self.until.isoformat() if self.until else None,
+            "count": self.count,
+            "exceptions": sorted(d.isoformat() for d in self.exceptions),
+        }
+
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RecurrenceRule":
+        """Reconstruye una regla a partir de `to_dict`."""
+        until = data.get("until")
+        return cls(
+            start=datetime.date.fromisoformat(data["start"]),
+            freq=data.get("freq", "daily"),
+            interval=data.get("interval", 1),
+            by_weekday=data.get("by_weekday"),
+            until=datetime.date.fromisoformat(until) if until else None,
+            count=data.get("count"),
+            exceptions=[datetime.date.fromisoformat(d) for d in data.get("exceptions", ())],
+        )
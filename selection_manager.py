@@ -1,45 +1,198 @@
-import customtkinter as ctk
+import datetime
+from datetime import timedelta
+from intervals import DateRanges
 
 class SelectionManager:
+    """
+    Selección de fechas del calendario: clic, arrastre (rango), shift-clic (rango desde la última fecha pulsada)
+    y ctrl-clic (añadir o quitar fechas sueltas o rangos).
+
+    La selección se guarda como `DateRanges` (intervalos de fechas), así que sobrevive a la navegación entre
+    meses y no crece con la longitud de los rangos. Al arrastrar, cada movimiento solo reconfigura las celdas
+    que entran o salen del rango, no las 42. Los callbacks registrados con `subscribe` reciben la lista de
+    rangos [(inicio, fin), ...] cada vez que la selección cambia (en un arrastre, una sola vez al soltar).
+    """
+
     def __init__(self, calendar):
         self.calendar = calendar
-        self.selected_day_frame = None
+        self.selection = DateRanges()
+        self.anchor: datetime.date | None = None  # última fecha pulsada, origen de los shift-clic
+        self._callbacks: list = []
+        self._before: DateRanges | None = None  # selección al pulsar, para notificar al soltar si cambió
+        self._drag_base: DateRanges | None = None  # selección sobre la que se suma el rango arrastrado
+        self._drag_start: datetime.date | None = None
+        self._drag_end: datetime.date | None = None
 
+    # --------------------------------------------------
+    # ------------------ [SELECCIÓN] -------------------
+    # --------------------------------------------------
+    def get_selection(self) -> list[tuple[datetime.date, datetime.date]]:
+        """Rangos seleccionados [(inicio, fin), ...], ordenados y sin solapes."""
+        return self.selection.ranges()
 
-    def select_frame(self, frame: ctk.CTkFrame):
-        self.clear_selection()
-        frame.configure(border_width=3)
-        frame.is_selected = True
-        self.selected_day_frame = frame
 
+    def is_selected(self, date_obj: datetime.date) -> bool:
+        return date_obj in self.selection
 
-    def deselect_frame(self, frame: ctk.CTkFrame):
-        frame.configure(border_width=0)
-        frame.is_selected = False
-        if self.selected_day_frame is frame:
-            self.selected_day_frame = None
+
+    def select_range(self, start: datetime.date, end: datetime.date, add: bool = False):
+        """Selecciona [start, end]; con `add=True` lo suma a la selección actual."""
+        if not isinstance(start, datetime.date) or not isinstance(end, datetime.date):
+            raise TypeError("start y end deben ser datetime.date")
+        selection = self.selection.copy() if add else DateRanges()
+        selection.add(start, end)
+        self._set_selection(selection)
+        self._notify()
 
 
     def clear_selection(self):
-        if self.selected_day_frame is not None:
-            self.deselect_frame(self.selected_day_frame)
-            self.selected_day_frame = None
+        if self.selection:
+            self._set_selection(DateRanges())
+            self._notify()
+
+
+    def subscribe(self, callback):
+        """Registra `callback(rangos)`, llamado cada vez que cambia la selección. Retorna el callback."""
+        self._callbacks.append(callback)
+        return callback
+
+
+    def unsubscribe(self, callback):
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
 
 
-    def handle_click(self, event):
-        widget = event.widget.master
-        clicked_frame = widget if isinstance(widget, ctk.CTkFrame) else getattr(widget, 'master', None)
-        date_obj = getattr(widget, 'date', None) or getattr(widget.master, 'date', None)
+    def _notify(self):
+        ranges = self.selection.ranges()
+        for callback in list(self._callbacks):
+            callback(ranges)
 
-        if not date_obj:
+    # --------------------------------------------------
+    # ----------------- [RESALTADO] --------------------
+    # --------------------------------------------------
+    def _set_selection(self, selection: DateRanges, spans=None):
+        """
+        Reemplaza la selección y resalta las celdas visibles que cambian. `spans` son los rangos donde puede
+        haber diferencias; si no se indican se revisan los rangos de la selección anterior y de la nueva.
+        """
+        previous, self.selection = self.selection, selection
+        if spans is None:
+            spans = previous.ranges() + selection.ranges()
+        self._refresh(spans)
+
+
+    def _refresh(self, spans):
+        """Sincroniza el borde de las celdas visibles cuyas fechas caen en `spans` (solo esas)."""
+        cells = self.calendar.calendar_view.date_to_cell
+        if not cells:
             return
-        if date_obj.month != self.calendar.current_month or date_obj.year != self.calendar.current_year:
+        first, last = next(iter(cells)), next(reversed(cells))
+        for start, end in spans:
+            date_obj, end = max(start, first), min(end, last)
+            while date_obj <= end:
+                self.sync_cell(cells[date_obj])
+                date_obj += timedelta(days=1)
+
+
+    def sync_cell(self, cell) -> bool:
+        """Pone o quita el borde de una celda según su fecha esté seleccionada. Retorna si tuvo que reconfigurarla."""
+        selected = cell.date is not None and cell.date in self.selection
+        if selected == getattr(cell, 'is_selected', False):
+            return False
+        cell.configure(border_width=3 if selected else 0)
+        cell.is_selected = selected
+        if self.calendar.metrics.enabled:
+            self.calendar.metrics.count("configure_calls")
+        return True
+
+    # --------------------------------------------------
+    # ------------------ [PUNTERO] ---------------------
+    # --------------------------------------------------
+    def press(self, date_obj: datetime.date | None, mode: str = "replace"):
+        """
+        Botón pulsado sobre `date_obj`. `mode` es "replace" (clic), "extend" (shift-clic) o "toggle" (ctrl-clic).
+        Solo se empieza a seleccionar en fechas del mes mostrado.
+        """
+        if date_obj is None or (date_obj.year, date_obj.month) != (self.calendar.current_year, self.calendar.current_month):
             return
+        self._before = self.selection
 
-        if getattr(clicked_frame, 'is_selected', False):
-            self.deselect_frame(clicked_frame)
+        if mode == "extend" and self.anchor is not None:
+            self._start_drag(self.anchor, DateRanges())
+        elif mode == "toggle":
+            if date_obj in self.selection:
+                selection = self.selection.copy()
+                selection.remove(date_obj, date_obj)
+                self._set_selection(selection, [(date_obj, date_obj)])
+                self.anchor = date_obj
+                return
+            self._start_drag(date_obj, self.selection)
+        elif self.selection.ranges() == [(date_obj, date_obj)]:
+            # Clic sobre la única fecha seleccionada: se deselecciona
+            self._set_selection(DateRanges(), [(date_obj, date_obj)])
             return
         else:
-            self.select_frame(clicked_frame)
-            print(date_obj)
-            return date_obj
+            self._start_drag(date_obj, DateRanges())
+        if mode != "extend" or self.anchor is None:
+            self.anchor = date_obj
+        self.drag(date_obj)
+
+
+    def _start_drag(self, start: datetime.date, base: DateRanges):
+        self._drag_start = start
+        self._drag_end = None
+        self._drag_base = base
+        if base is not self.selection:
+            self._set_selection(base.copy())
+
+
+    def drag(self, date_obj: datetime.date | None):
+        """
+        Puntero arrastrado hasta `date_obj`: la selección pasa a ser la base más [inicio, date_obj].
+        Los dos rangos comparten el inicio, así que solo pueden cambiar las fechas entre el final anterior y el nuevo.
+        """
+        if self._drag_start is None or date_obj is None or date_obj == self._drag_end:
+            return
+        selection = self._drag_base.copy()
+        selection.add(self._drag_start, date_obj)
+        previous_end = self._drag_end if self._drag_end is not None else self._drag_start
+        self._drag_end = date_obj
+        self._set_selection(selection, [(min(previous_end, date_obj), max(previous_end, date_obj)),
+                                        (self._drag_start, self._drag_start)])
+
+
+    def release(self):
+        """Botón soltado: termina el arrastre y avisa a los callbacks si la selección cambió."""
+        self._drag_start = self._drag_end = self._drag_base = None
+        before, self._before = self._before, None
+        if before is not None and before != self.selection:
+            self._notify()
+
+    # --------------------------------------------------
+    # ---------------- [MODO WIDGETS] ------------------
+    # --------------------------------------------------
+    def bind_cell(self, widget):
+        """Conecta los eventos del ratón de una celda (o de un widget dentro de ella) con la selección."""
+        widget.bind('<Button-1>', lambda event: self.press(self._date_of(event.widget), "replace"))
+        widget.bind('<Shift-Button-1>', lambda event: self.press(self._date_of(event.widget), "extend"))
+        widget.bind('<Control-Button-1>', lambda event: self.press(self._date_of(event.widget), "toggle"))
+        widget.bind('<B1-Motion>', self._on_motion)
+        widget.bind('<ButtonRelease-1>', lambda event: self.release())
+
+
+    def _on_motion(self, event):
+        if self._drag_start is None:
+            return
+        # Durante el arrastre los eventos llegan al widget pulsado: se busca la celda bajo el puntero
+        widget = event.widget.winfo_containing(event.x_root, event.y_root)
+        self.drag(self._date_of(widget))
+
+
+    @staticmethod
+    def _date_of(widget) -> datetime.date | None:
+        """Fecha de la celda que contiene a `widget` (subiendo por sus masters), o None."""
+        while widget is not None:
+            if hasattr(widget, 'in_month'):
+                return widget.date
+            widget = getattr(widget, 'master', None)
+        return None
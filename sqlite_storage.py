@@ -0,0 +1,244 @@
+import datetime
+import sqlite3
+import threading
+
+
+class SQLiteStorage:
+    """
+    Almacenamiento persistente de tags y eventos en SQLite (solo biblioteca estándar).
+
+    Las escrituras son transaccionales (`add_events` inserta cualquier cantidad en una sola transacción) y las
+    lecturas piden solo una ventana de fechas gracias al índice por fecha, así que abrir una base con millones
+    de eventos no carga nada más que los tags. Conectado a un calendario con `CTkCalendar.attach_storage`,
+    se usa como proveedor de eventos: solo los meses en pantalla (y su caché LRU) viven en memoria.
+    La conexión se comparte entre hilos protegida por un lock, porque el proveedor lee desde su pool.
+
+    Ejemplo:
+        storage = SQLiteStorage("eventos.db")
+        storage.add_tag("trabajo", color="#3A7FF6")
+        storage.add_events((date(2025, 1, 1) + timedelta(days=i), f"Turno {i}", "", "trabajo") for i in range(100_000))
+        calendar.attach_storage(storage)
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tags (
+            name TEXT PRIMARY KEY,
+            color TEXT NOT NULL,
+            description TEXT NOT NULL DEFAULT '',
+            visible INTEGER NOT NULL DEFAULT 1
+        );
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT NOT NULL DEFAULT '',
+            tag TEXT NOT NULL REFERENCES tags(name),
+            start_time TEXT,
+            end_time TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_events_date ON events(date);
+        CREATE INDEX IF NOT EXISTS idx_events_tag_date ON events(tag, date);
+    """
+
+    INSERT_EVENT = "INSERT INTO events (date, name, description, tag, start_time, end_time) VALUES (?, ?, ?, ?, ?, ?)"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._observers: list = []  # callbacks(fechas) tras cada escritura confirmada
+        with self._lock, self._conn:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(self.SCHEMA)
+            # Bases creadas antes de los eventos con hora
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(events)")}
+            for column in ("start_time", "end_time"):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE events ADD COLUMN {column} TEXT")
+
+    # --------------------------------------------------
+    # ---------------- [NOTIFICACIONES] ----------------
+    # --------------------------------------------------
+    def subscribe(self, callback):
+        """Registra `callback(fechas)`, llamado tras cada escritura con el conjunto de fechas afectadas."""
+        self._observers.append(callback)
+        return callback
+
+
+    def unsubscribe(self, callback):
+        if callback in self._observers:
+            self._observers.remove(callback)
+
+
+    def _notify(self, dates):
+        if dates:
+            for callback in list(self._observers):
+                callback(dates)
+
+    # --------------------------------------------------
+    # -------------------- [TAGS] ----------------------
+    # --------------------------------------------------
+    def add_tag(self, tag_name: str, color: str = "#3A7FF6", desc: str = "", visible: bool = True):
+        """Crea o reemplaza un tag."""
+        if not isinstance(tag_name, str) or not tag_name:
+            raise ValueError("El nombre del tag debe ser un string no vacío.")
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO tags (name, color, description, visible) VALUES (?, ?, ?, ?)",
+                               (tag_name, color, desc, int(visible)))
+
+
+    def remove_tag(self, tag_name: str) -> bool:
+        """Elimina un tag junto con sus eventos."""
+        with self._lock, self._conn:
+            dates = {row[0] for row in self._conn.execute("SELECT DISTINCT date FROM events WHERE tag = ?", (tag_name,))}
+            self._conn.execute("DELETE FROM events WHERE tag = ?", (tag_name,))
+            removed = self._conn.execute("DELETE FROM tags WHERE name = ?", (tag_name,)).rowcount
+        self._notify({datetime.date.fromisoformat(d) for d in dates})
+        return bool(removed)
+
+
+    def get_tags(self) -> dict[str, dict]:
+        """Retorna {tag_name: {"color", "desc", "visible"}}, con el mismo formato que `EventStore.tags`."""
+        with self._lock:
+            rows = self._conn.execute("SELECT name, color, description, visible FROM tags").fetchall()
+        return {name: {"color": color, "desc": desc, "visible": bool(visible)} for name, color, desc, visible in rows}
+
+    # --------------------------------------------------
+    # ------------------- [EVENTOS] --------------------
+    # --------------------------------------------------
+    def add_event(self, date_obj: datetime.date, name: str, desc: str, tag: str,
+                  start: datetime.time | None = None, end: datetime.time | None = None) -> int:
+        """Inserta un evento (con hora si se dan `start` y `end`) y retorna su id en la base."""
+        row = self._row(date_obj, name, desc, tag, start, end)
+        with self._lock, self._conn:
+            event_id = self._conn.execute(self.INSERT_EVENT, row).lastrowid
+        self._notify({date_obj})
+        return event_id
+
+
+    def add_events(self, events) -> int:
+        """
+        Inserta en una sola transacción eventos dados como tuplas (fecha, name, desc, tag[, start, end]) o dicts con
+        esas claves. Si alguno es inválido no se guarda ninguno. Retorna cuántos se insertaron.
+        """
+        rows = []
+        dates = set()
+        for ev in events:
+            if isinstance(ev, dict):
+                ev = (ev.get("date"), ev.get("name"), ev.get("desc", ""), ev.get("tag"), ev.get("start"), ev.get("end"))
+            rows.append(self._row(*ev))
+            dates.add(ev[0])
+        with self._lock, self._conn:
+            self._conn.executemany(self.INSERT_EVENT, rows)
+        self._notify(dates)
+        return len(rows)
+
+
+    def update_event(self, event_id: int, *, name: str | None = None, desc: str | None = None, tag: str | None = None,
+                     date_obj: datetime.date | None = None, start: datetime.time | None = None, end: datetime.time | None = None):
+        """Modifica los campos indicados de un evento (`start` y `end` juntos cambian su hora)."""
+        if start is not None or end is not None:
+            self._check_times(start, end)
+        changes = {"name": name, "description": desc, "tag": tag, "date": date_obj.isoformat() if date_obj else None,
+                   "start_time": self._time(start), "end_time": self._time(end)}
+        changes = {column: value for column, value in changes.items() if value is not None}
+        if not changes:
+            return
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT date FROM events WHERE id = ?", (event_id,)).fetchone()
+            if row is None:
+                raise KeyError(f"El evento '{event_id}' no existe.")
+            assignments = ", ".join(f"{column} = ?" for column in changes)
+            self._conn.execute(f"UPDATE events SET {assignments} WHERE id = ?", (*changes.values(), event_id))
+        dates = {datetime.date.fromisoformat(row[0])}
+        if date_obj is not None:
+            dates.add(date_obj)
+        self._notify(dates)
+
+
+    def remove_event(self, event_id: int) -> bool:
+        """Elimina un evento por id."""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT date FROM events WHERE id = ?", (event_id,)).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+        self._notify({datetime.date.fromisoformat(row[0])})
+        return True
+
+
+    def save_store(self, store):
+        """
+        Copia tags y eventos (con su hora) de un `EventStore` en una sola transacción. La base no tiene reglas de
+        recurrencia: si el store tiene alguna se lanza ValueError sin guardar nada, en lugar de perderla.
+        """
+        if store.rules:
+            raise ValueError("SQLiteStorage no guarda reglas de recurrencia; el store tiene "
+                             f"{len(store.rules)} (elimínelas o expórtelas con export_events).")
+        tags = [(name, info["color"], info.get("desc", ""), int(info.get("visible", True))) for name, info in store.tags.items()]
+        rows = [(date_obj.isoformat(), ev.name, ev.desc, ev.tag, self._time(ev.start), self._time(ev.end))
+                for date_obj, evs in store.events.items() for ev in evs.values()]
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO tags (name, color, description, visible) VALUES (?, ?, ?, ?)", tags)
+            self._conn.executemany(self.INSERT_EVENT, rows)
+        self._notify(set(store.events))
+
+
+    def _row(self, date_obj, name, desc, tag, start=None, end=None) -> tuple:
+        """Valida un evento y lo retorna como fila de `INSERT_EVENT`."""
+        if not isinstance(date_obj, datetime.date):
+            raise TypeError("date_obj debe ser datetime.date")
+        if not isinstance(name, str) or not name:
+            raise ValueError("name debe ser un string no vacío")
+        self._check_times(start, end)
+        return date_obj.isoformat(), name, desc, tag, self._time(start), self._time(end)
+
+
+    @staticmethod
+    def _check_times(start, end):
+        if start is None and end is None:
+            return
+        if not isinstance(start, datetime.time) or not isinstance(end, datetime.time):
+            raise TypeError("start y end deben ser datetime.time (o ambos None)")
+        if end <= start:
+            raise ValueError("end debe ser posterior a start")
+
+
+    @staticmethod
+    def _time(value: datetime.time | None) -> str | None:
+        return value.isoformat(timespec="minutes") if value is not None else None
+
+    # --------------------------------------------------
+    # ------------------- [CONSULTAS] ------------------
+    # --------------------------------------------------
+    def load_window(self, start: datetime.date, end: datetime.date) -> list[dict]:
+        """
+        Eventos de [start, end] en orden cronológico, como dicts {"id", "date", "name", "desc", "tag", "start", "end"}
+        (`start`/`end` son datetime.time o None). Tiene la firma de un proveedor de eventos (ver `EventProvider`) y
+        puede llamarse desde otro hilo.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, date, name, description, tag, start_time, end_time FROM events WHERE date BETWEEN ? AND ? ORDER BY date, id",
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return [{"id": event_id, "date": datetime.date.fromisoformat(date), "name": name, "desc": desc, "tag": tag,
+                 "start": datetime.time.fromisoformat(start_time) if start_time else None,
+                 "end": datetime.time.fromisoformat(end_time) if end_time else None}
+                for event_id, date, name, desc, tag, start_time, end_time in rows]
+
+
+    def count_events(self, start: datetime.date | None = None, end: datetime.date | None = None) -> int:
+        """Número de eventos guardados (opcionalmente dentro de [start, end])."""
+        with self._lock:
+            if start is None and end is None:
+                return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM events WHERE date BETWEEN ? AND ?",
+                                      ((start or datetime.date.min).isoformat(), (end or datetime.date.max).isoformat())).fetchone()[0]
+
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
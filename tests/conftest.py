@@ -0,0 +1,19 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Los módulos del calendario están en la raíz del repositorio (sin paquete)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from instrumentation import Instrumentation
+
+
+@pytest.fixture
+def fake_calendar():
+    """Lo que el EventManager consulta de un CTkCalendar, sin celdas en pantalla (no se pinta nada)."""
+    view = SimpleNamespace(date_to_cell={}, render_events=lambda frame: None)
+    popup = SimpleNamespace(visible=False, date=None, refresh=lambda: None)
+    return SimpleNamespace(calendar_view=view, event_list_popup=popup, active_view=None, metrics=Instrumentation(),
+                           current_year=2025, current_month=11)
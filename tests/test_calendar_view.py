@@ -0,0 +1,39 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from calendar_view import CalendarView
+
+
+def test_close_cancels_pending_render_and_prefetch():
+    cancelled = []
+    calendar = SimpleNamespace(after_idle=lambda callback: "precarga", after=lambda ms, callback: "pintado",
+                               after_cancel=cancelled.append)
+    view = CalendarView(calendar, prefetch_months=1)
+    view.schedule_prefetch()
+    view._render_job = calendar.after(35, view._render_target)
+    view.close()
+    assert cancelled == ["pintado", "precarga"]
+    assert view._render_job is None and view._prefetch_job is None
+
+    view.close()  # sin nada pendiente no cancela nada
+    assert len(cancelled) == 2
+
+
+def test_goto_and_set_month_stay_in_the_active_view():
+    pytest.importorskip("customtkinter")
+    from CTkCalendar import CTkCalendar
+
+    shown, painted = [], []
+    view = SimpleNamespace(date=date(2025, 1, 31), set_date=lambda d: (shown.append(d), setattr(view, "date", d)))
+    calendar = SimpleNamespace(active_view=view, current_date=date(2025, 1, 10),
+                               calendar_view=SimpleNamespace(goto=painted.append))
+    calendar.goto = lambda d: CTkCalendar.goto(calendar, d)
+    CTkCalendar.goto(calendar, date(2025, 3, 4))
+    CTkCalendar.set_month(calendar, 2025, 2)  # desde el 4 de marzo de la vista, no desde current_date
+    assert shown == [date(2025, 3, 4), date(2025, 2, 4)] and painted == []
+
+    calendar.active_view = None  # vista de mes
+    CTkCalendar.set_month(calendar, 2025, 2)
+    assert painted == [date(2025, 2, 10)]
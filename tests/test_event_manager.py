@@ -0,0 +1,165 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("customtkinter")
+
+from event_manager import EventManager
+from event_store import EventStore
+
+
+@pytest.fixture
+def store():
+    store = EventStore()
+    store.add_tag("trabajo")
+    store.add_tag("ocio")
+    return store
+
+
+def test_changes_repaint_only_visible_cells(store, fake_calendar):
+    cells = {date(2025, 11, day): SimpleNamespace(date=date(2025, 11, day)) for day in range(1, 8)}
+    fake_calendar.calendar_view.date_to_cell = cells
+    rendered = []
+    fake_calendar.calendar_view.render_events = lambda frame: rendered.append(frame.date)
+    em = EventManager(fake_calendar, store)
+
+    em.add_event(date(2025, 11, 2), "A", "", "trabajo")
+    em.add_event(date(2025, 12, 2), "Fuera", "", "trabajo")
+    with em.batch():
+        em.add_event(date(2025, 11, 3), "B", "", "trabajo")
+        em.add_event(date(2025, 11, 3), "C", "", "ocio")
+        em.add_event(date(2025, 11, 5), "D", "", "ocio")
+    assert rendered[0] == date(2025, 11, 2)
+    assert sorted(rendered[1:]) == [date(2025, 11, 3), date(2025, 11, 5)]  # una vez cada celda, al cerrar el batch
+
+    em.close()
+    store.add_event(date(2025, 11, 6), "E", "", "trabajo")
+    assert date(2025, 11, 6) not in rendered
+
+
+def test_model_api_is_delegated_to_the_store(store, fake_calendar):
+    em = EventManager(fake_calendar, store)
+    event_id = em.add_event(date(2025, 11, 2), "A", "", "trabajo")
+    assert store.get_event(event_id)[1]["name"] == "A"
+    assert em.tags is store.tags
+
+
+def test_split_overflow_reserves_a_slot_for_the_more_chip(store, fake_calendar):
+    em = EventManager(fake_calendar, store)
+    events = list(range(5))
+    assert em.split_overflow(events, 5) == (events, 0)
+    assert em.split_overflow(events, 3) == ([0, 1], 3)
+    assert em.split_overflow(events, 1) == ([], 5)
+
+
+def _shared_store(store):
+    store.add_event(date(2025, 11, 3), "Reunión", "", "trabajo")
+    store.add_event(date(2025, 11, 4), "Cine", "", "ocio")
+    store.add_recurrence(date(2025, 11, 3), "Standup", "", "trabajo", freq="daily", count=2)
+    return store
+
+
+def test_hidden_tags_apply_only_to_their_view(store, fake_calendar):
+    _shared_store(store)
+    a, b = EventManager(fake_calendar, store), EventManager(SimpleNamespace(**vars(fake_calendar)), store)
+    a.hide_tag("trabajo")
+
+    assert [ev.name for ev in a.visible_events(date(2025, 11, 3))] == []
+    assert a.day_counts(date(2025, 11, 1), date(2025, 11, 30)) == {date(2025, 11, 4): 1}
+    assert a.month_counts(2025)[11] == 1
+    assert not a.is_tag_visible("trabajo")
+    assert [ev.name for ev in b.visible_events(date(2025, 11, 3))] == ["Reunión", "Standup"]
+    assert b.month_counts(2025)[11] == 4
+    assert store.tags["trabajo"]["visible"]
+
+    names = lambda events: [ev["name"] for _, ev in events]
+    assert names(a.get_upcoming_events(from_date=date(2025, 11, 1))) == ["Cine"]
+    assert names(a.get_events_between(date(2025, 11, 1), date(2025, 11, 30), visible_only=True)) == ["Cine"]
+    assert len(a.get_events_between(date(2025, 11, 1), date(2025, 11, 30))) == 4
+    assert len(b.get_upcoming_events(from_date=date(2025, 11, 1))) == 4
+
+    a.toggle_tag("trabajo")
+    assert a.month_counts(2025)[11] == 4
+    assert len(a.get_upcoming_events(from_date=date(2025, 11, 1))) == 4
+
+
+def test_store_hidden_tags_apply_to_every_view(store, fake_calendar):
+    _shared_store(store)
+    a = EventManager(fake_calendar, store)
+    store.hide_tag("ocio")
+    assert [ev["name"] for _, ev in a.get_upcoming_events(from_date=date(2025, 11, 1))] == ["Reunión", "Standup", "Standup"]
+    assert a.hidden_tags() == {"ocio"}
+
+
+def test_changes_reach_only_views_showing_the_date(store, fake_calendar):
+    november = {date(2025, 11, day): SimpleNamespace(date=date(2025, 11, day)) for day in range(1, 31)}
+    december = {date(2025, 12, day): SimpleNamespace(date=date(2025, 12, day)) for day in range(1, 32)}
+    views = []
+    for cells in (november, december):
+        rendered = []
+        calendar = SimpleNamespace(**vars(fake_calendar))
+        calendar.calendar_view = SimpleNamespace(date_to_cell=cells, render_events=lambda frame, out=rendered: out.append(frame.date))
+        EventManager(calendar, store)
+        views.append(rendered)
+
+    store.add_event(date(2025, 11, 3), "Reunión", "", "trabajo")
+    store.add_event(date(2025, 12, 24), "Cena", "", "ocio")
+    assert views == [[date(2025, 11, 3)], [date(2025, 12, 24)]]
+
+
+def test_single_view_controls_store_visibility(fake_calendar):
+    em = EventManager(fake_calendar)
+    em.add_tag("x", visible=False)
+    em.add_event(date(2025, 11, 3), "Oculto", "", "x")
+    assert em.get_upcoming_events(from_date=date(2025, 11, 1)) == []
+
+    em.show_tag("x")
+    assert em.tags["x"]["visible"]
+    assert [ev["name"] for _, ev in em.get_upcoming_events(from_date=date(2025, 11, 1))] == ["Oculto"]
+
+    em.toggle_tag("x")
+    assert not em.tags["x"]["visible"] and em.get_upcoming_events(from_date=date(2025, 11, 1)) == []
+    em.toggle_tag("x")
+    assert em.tags["x"]["visible"] and em.is_tag_visible("x")
+
+    em.store.hide_tag("x")
+    em.toggle_tag("x")  # se decide por lo que se muestra, no por el filtro propio
+    assert em.is_tag_visible("x")
+
+
+def test_shared_store_keeps_hiding_per_view(store, fake_calendar):
+    store.add_tag("x", visible=False)
+    a, b = EventManager(fake_calendar, store), EventManager(SimpleNamespace(**vars(fake_calendar)), store)
+    assert not a.is_only_view()
+    a.show_tag("x")  # oculto en el store para todos: solo store.show_tag lo muestra
+    assert not a.is_tag_visible("x") and not store.tags["x"]["visible"]
+
+    store.show_tag("x")
+    a.toggle_tag("x")
+    assert not a.is_tag_visible("x") and b.is_tag_visible("x")
+    a.toggle_tag("x")
+    assert a.is_tag_visible("x")
+
+    b.close()
+    assert a.is_only_view()
+
+
+def test_unchanged_cells_still_point_at_the_current_events(store, fake_calendar):
+    """Una celda que se ve igual (misma firma) tras navegar debe apuntar a los registros y la fecha nuevos."""
+    from widget_pool import WidgetPool
+    fake_calendar.widget_pool = WidgetPool(fake_calendar)
+    em = EventManager(fake_calendar, store)
+    em.add_recurrence(date(2025, 10, 6), "Standup", "", "trabajo", freq="weekly")
+    stale = em.add_event(date(2025, 10, 7), "Comida", "", "ocio")
+    em.remove_event_by_id(stale)
+    fresh = em.add_event(date(2025, 11, 4), "Comida", "", "ocio")
+
+    for old, new in ((date(2025, 10, 6), date(2025, 11, 3)), (date(2025, 10, 7), date(2025, 11, 4))):
+        events = em.visible_events(new)
+        btn = SimpleNamespace(event_ref=(object(), old))
+        frame = SimpleNamespace(date=new, in_month=True, event_rows=[btn],
+                                events_signature=(em.event_signature(events), 0))
+        em.render_events_in_frame(frame)
+        assert btn.event_ref == (events[0], new)
+    assert btn.event_ref[0].id == fresh
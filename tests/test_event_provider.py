@@ -0,0 +1,146 @@
+import os
+import subprocess
+import sys
+from concurrent.futures import Future
+from datetime import date
+
+import pytest
+
+from event_provider import EventProvider, month_bounds
+from event_store import EventStore
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class StubProvider:
+    """Proveedor local: un evento el día 1 de cada mes pedido. Las peticiones quedan pendientes hasta `resolve`."""
+
+    def __init__(self):
+        self.futures: dict[tuple[int, int], Future] = {}
+
+    def __call__(self, start, end):
+        return [(start, f"Evento {start.year}-{start.month}", "", "remoto")]
+
+    def submit(self, start, end):
+        future = self.futures[(start.year, start.month)] = Future()
+        return future
+
+    def resolve(self, year, month):
+        self.futures[(year, month)].set_result(self(*month_bounds(year, month)))
+
+
+class FakeCalendar:
+    """Lo que usa EventProvider de un CTkCalendar: `after`, `after_cancel`, el mes actual y el store."""
+
+    def __init__(self):
+        self.event_store = EventStore()
+        self.event_store.add_tag("remoto")
+        self.current_year, self.current_month = 2025, 1
+        self.jobs = []
+
+    def after(self, ms, callback):
+        self.jobs.append(callback)
+        return len(self.jobs)
+
+    def after_cancel(self, job):
+        pass
+
+    def show(self, provider, year, month):
+        """Como la cuadrícula: muestra un mes (solo ese, para simplificar las cuentas)."""
+        self.current_year, self.current_month = year, month
+        provider.show(*month_bounds(year, month))
+
+
+def _provider(cache_months=3, prefetch_months=0):
+    calendar, stub = FakeCalendar(), StubProvider()
+    provider = EventProvider(calendar, stub, cache_months=cache_months, prefetch_months=prefetch_months)
+    provider._submit = stub.submit
+    return calendar, stub, provider
+
+
+def _loaded_months(calendar):
+    return sorted((d.year, d.month) for d, _ in calendar.event_store.get_events_between(date(2000, 1, 1), date(2100, 1, 1)))
+
+
+def test_calendar_import_does_not_load_optional_features():
+    pytest.importorskip("customtkinter")
+    # En un proceso aparte: en este, otras pruebas ya han importado el proveedor
+    code = ("import sys, CTkCalendar\n"
+            "loaded = {'asyncio', 'concurrent.futures', 'sqlite3', 'event_provider', 'sqlite_storage'} & set(sys.modules)\n"
+            "assert not loaded, loaded\n")
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+def test_results_are_inserted_from_the_poll():
+    calendar, stub, provider = _provider()
+    calendar.show(provider, 2025, 1)
+    assert list(stub.futures) == [(2025, 1)]
+    assert _loaded_months(calendar) == []
+
+    stub.resolve(2025, 1)
+    provider._poll()
+    assert _loaded_months(calendar) == [(2025, 1)]
+    assert provider.pending == {}
+    assert list(provider.cache) == [(2025, 1)]
+
+
+def test_lru_evicts_least_recently_shown_month():
+    calendar, stub, provider = _provider(cache_months=3)
+    for month in (1, 2, 3):
+        calendar.show(provider, 2025, month)
+        stub.resolve(2025, month)
+        provider._poll()
+    calendar.show(provider, 2025, 1)  # enero pasa a ser el más reciente
+    calendar.show(provider, 2025, 4)
+    stub.resolve(2025, 4)
+    provider._poll()
+
+    assert list(provider.cache) == [(2025, 3), (2025, 1), (2025, 4)]
+    assert _loaded_months(calendar) == [(2025, 1), (2025, 3), (2025, 4)]
+
+
+def test_visible_months_are_never_evicted():
+    calendar, stub, provider = _provider(cache_months=3)
+    calendar.current_year, calendar.current_month = 2025, 2
+    provider.show(date(2025, 1, 1), date(2025, 4, 30))  # cuatro meses visibles con caché de tres
+    for month in (1, 2, 3, 4):
+        stub.resolve(2025, month)
+    provider._poll()
+    assert _loaded_months(calendar) == [(2025, 1), (2025, 2), (2025, 3), (2025, 4)]
+
+
+def test_navigation_cancels_pending_months():
+    calendar, stub, provider = _provider(prefetch_months=1)
+    calendar.show(provider, 2025, 1)
+    assert set(provider.pending) == {(2024, 12), (2025, 1), (2025, 2)}
+
+    calendar.show(provider, 2025, 6)
+    assert stub.futures[(2024, 12)].cancelled() and stub.futures[(2025, 1)].cancelled()
+    assert set(provider.pending) == {(2025, 5), (2025, 6), (2025, 7)}
+
+
+def test_late_results_are_discarded():
+    calendar, stub, provider = _provider()
+    calendar.show(provider, 2025, 1)
+    future = stub.futures[(2025, 1)]
+    future.set_running_or_notify_cancel()  # ya en marcha: cancel() no puede detenerla
+    calendar.show(provider, 2025, 6)
+    assert not future.cancelled()
+
+    future.set_result(stub(*month_bounds(2025, 1)))
+    stub.resolve(2025, 6)
+    provider._poll()
+    assert _loaded_months(calendar) == [(2025, 6)]
+    assert list(provider.cache) == [(2025, 6)]
+
+
+def test_clear_and_close():
+    calendar, stub, provider = _provider()
+    calendar.show(provider, 2025, 1)
+    stub.resolve(2025, 1)
+    provider._poll()
+    calendar.show(provider, 2025, 2)
+    provider.close()
+    assert stub.futures[(2025, 2)].cancelled()
+    provider.clear()
+    assert _loaded_months(calendar) == []
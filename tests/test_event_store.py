@@ -0,0 +1,237 @@
+import random
+from datetime import date, time, timedelta
+
+import pytest
+
+from event_store import EventStore
+
+
+@pytest.fixture
+def store():
+    store = EventStore()
+    store.add_tag("trabajo", color="#3A7FF6")
+    store.add_tag("ocio", color="#F63A7F")
+    return store
+
+
+# --------------------------------------------------
+# ------------------- [ÍNDICES] --------------------
+# --------------------------------------------------
+def test_dates_index_stays_sorted(store):
+    for day in (20, 3, 11, 3):
+        store.add_event(date(2025, 11, day), f"Evento {day}", "", "trabajo")
+    assert store._dates == [date(2025, 11, 3), date(2025, 11, 11), date(2025, 11, 20)]
+
+    store.clear_day(date(2025, 11, 11))
+    store.remove_event(date(2025, 11, 20), "Evento 20")
+    assert store._dates == [date(2025, 11, 3)]
+
+
+def test_events_between_is_chronological(store):
+    store.add_event(date(2025, 11, 5), "B", "", "trabajo")
+    store.add_event(date(2025, 11, 1), "A", "", "ocio")
+    store.add_event(date(2025, 12, 1), "Fuera", "", "ocio")
+    found = store.get_events_between(date(2025, 11, 1), date(2025, 11, 30))
+    assert [(d, ev["name"]) for d, ev in found] == [(date(2025, 11, 1), "A"), (date(2025, 11, 5), "B")]
+    assert store.get_events_between(date(2025, 11, 30), date(2025, 11, 1)) == []
+
+
+def test_upcoming_events_skip_hidden_tags(store):
+    store.add_event(date(2025, 11, 1), "A", "", "trabajo")
+    store.add_event(date(2025, 11, 3), "B", "", "ocio")
+    store.add_event(date(2025, 11, 9), "Fuera", "", "trabajo")
+    store.hide_tag("ocio")
+    assert [ev["name"] for _, ev in store.get_upcoming_events(7, date(2025, 11, 1))] == ["A"]
+    assert [ev.name for ev in store.visible_events(date(2025, 11, 3))] == []
+    with pytest.raises(ValueError):
+        store.get_upcoming_events(0)
+
+
+def test_tag_index_follows_removals(store):
+    store.add_event(date(2025, 11, 1), "A", "", "trabajo")
+    store.add_event(date(2025, 11, 1), "B", "", "trabajo")
+    store.add_event(date(2025, 11, 2), "C", "", "ocio")
+    store.add_event(date(2025, 11, 4), "D", "", "ocio")
+    assert store._tag_dates["trabajo"] == {date(2025, 11, 1): 2}
+
+    store.remove_event(date(2025, 11, 1), "A")
+    store.clear_day(date(2025, 11, 2))
+    assert store._tag_dates["trabajo"] == {date(2025, 11, 1): 1}
+    assert store._tag_dates["ocio"] == {date(2025, 11, 4): 1}
+    assert [ev["name"] for evs in store.get_events_by_tag("ocio").values() for ev in evs] == ["D"]
+
+    store.remove_tag("ocio", remove_events=True)
+    assert "ocio" not in store._tag_dates
+    assert store._dates == [date(2025, 11, 1)]
+
+
+def test_tag_index_follows_edits(store):
+    first = store.add_event(date(2025, 11, 1), "A", "", "trabajo")
+    store.add_event(date(2025, 11, 1), "B", "", "trabajo")
+    store.add_event(date(2025, 11, 2), "C", "", "ocio")
+
+    store.update_event(first, tag="ocio")
+    assert store._tag_dates["trabajo"] == {date(2025, 11, 1): 1}
+    assert store._tag_dates["ocio"] == {date(2025, 11, 1): 1, date(2025, 11, 2): 1}
+
+    store.move_event(first, date(2025, 11, 9))
+    assert store._tag_dates["ocio"] == {date(2025, 11, 2): 1, date(2025, 11, 9): 1}
+    assert list(store.get_events_by_tag("ocio")) == [date(2025, 11, 2), date(2025, 11, 9)]
+    with pytest.raises(ValueError):
+        store.update_event(first, tag="inexistente")
+
+
+def test_ids_are_stable_across_moves(store):
+    event_id = store.add_event(date(2025, 11, 1), "Reunión", "", "trabajo")
+    store.move_event(event_id, date(2025, 11, 8))
+    assert store.get_event(event_id) == (date(2025, 11, 8), {"id": event_id, "name": "Reunión", "desc": "", "tag": "trabajo"})
+    assert store.get_events(date(2025, 11, 1)) == []
+    assert store.remove_event_by_id(event_id)
+    assert not store.remove_event_by_id(event_id)
+    assert store.get_event(event_id) is None
+
+
+def test_add_events_accepts_tuples_and_dicts(store):
+    ids = store.add_events([(date(2025, 11, 1), "A", "", "trabajo"), {"date": date(2025, 11, 2), "name": "B", "tag": "ocio"}])
+    assert len(set(ids)) == 2
+    assert [ev["name"] for _, ev in store.get_events_between(date(2025, 11, 1), date(2025, 11, 2))] == ["A", "B"]
+
+def test_day_and_month_counts_include_rules(store):
+    store.add_event(date(2025, 3, 1), "A", "", "trabajo")
+    store.add_event(date(2025, 3, 1), "B", "", "ocio")
+    store.add_recurrence(date(2025, 3, 1), "Standup", "", "trabajo", freq="daily", until=date(2025, 3, 3))
+    counts = store.day_counts(date(2025, 3, 1), date(2025, 3, 31))
+    assert counts == {date(2025, 3, 1): 3, date(2025, 3, 2): 1, date(2025, 3, 3): 1}
+    assert store.month_counts(2025)[3] == 5
+    assert store.month_counts(2025, hidden={"trabajo"})[3] == 1
+
+    store.hide_tag("ocio")
+    assert store.day_counts(date(2025, 3, 1), date(2025, 3, 1)) == {date(2025, 3, 1): 2}
+
+
+def test_counts_match_brute_force(store):
+    rng = random.Random(5)
+    ids = [store.add_event(date(2025, 1, 1) + timedelta(days=rng.randrange(365)), "E", "", rng.choice(["trabajo", "ocio"]))
+           for _ in range(500)]
+    for event_id in ids[::4]:
+        store.remove_event_by_id(event_id)
+    for event_id in ids[1::4]:
+        store.move_event(event_id, date(2025, 1, 1) + timedelta(days=rng.randrange(365)))
+    for event_id in ids[2::4]:
+        store.update_event(event_id, tag="ocio")
+
+    for hidden in (set(), {"ocio"}, {"trabajo", "ocio"}):
+        expected = {}
+        for d, ev in store.get_events_between(date(2025, 1, 1), date(2025, 12, 31)):
+            if ev["tag"] not in hidden:
+                expected[d] = expected.get(d, 0) + 1
+        assert store.day_counts(date(2025, 1, 1), date(2025, 12, 31), hidden) == expected
+        months = store.month_counts(2025, hidden)
+        assert all(months[m] == sum(n for d, n in expected.items() if d.month == m) for m in range(1, 13))
+
+# --------------------------------------------------
+# ---------------- [NOTIFICACIONES] ----------------
+# --------------------------------------------------
+def test_batch_notifies_once(store):
+    changes = []
+    store.subscribe(changes.append)
+    with store.batch():
+        with store.batch():
+            store.add_event(date(2025, 11, 1), "A", "", "trabajo")
+        for day in range(1, 11):
+            store.add_event(date(2025, 11, day), "Evento", "", "trabajo")
+        assert changes == []
+    assert len(changes) == 1
+    assert len(changes[0].dates) == 10
+
+
+def test_changes_carry_dates_and_rules(store):
+    changes = []
+    store.subscribe(changes.append)
+    event_id = store.add_event(date(2025, 11, 1), "A", "", "trabajo")
+    store.move_event(event_id, date(2025, 11, 3))
+    rule_id = store.add_recurrence(date(2025, 11, 1), "Standup", "", "trabajo", freq="daily", count=3)
+    assert changes[0].dates == {date(2025, 11, 1)}
+    assert changes[1].dates == {date(2025, 11, 1), date(2025, 11, 3)}
+    assert changes[2].touches(date(2025, 11, 2)) and not changes[2].touches(date(2025, 11, 4))
+
+    store.unsubscribe(changes.append)
+    store.remove_recurrence(rule_id)
+    assert len(changes) == 3
+
+# --------------------------------------------------
+# --------------- [EVENTOS CON HORA] ---------------
+# --------------------------------------------------
+def test_overlapping_and_layout(store):
+    day = date(2025, 11, 3)
+    a = store.add_event(day, "A", "", "trabajo", start=time(9), end=time(11))
+    b = store.add_event(day, "B", "", "trabajo", start=time(10), end=time(12))
+    c = store.add_event(day, "C", "", "trabajo", start=time(13), end=time(14))
+    store.add_event(day, "Todo el día", "", "trabajo")
+
+    assert [ev["id"] for ev in store.get_overlapping(day, time(10, 30), time(13, 30))] == [a, b, c]
+    assert store.get_overlapping(day, time(12), time(13)) == []
+    layout = {ev.id: (column, columns) for ev, column, columns in store.day_layout(day)}
+    assert layout == {a: (0, 2), b: (1, 2), c: (0, 1)}
+
+    store.update_event(b, start=time(11), end=time(12))
+    layout = {ev.id: (column, columns) for ev, column, columns in store.day_layout(day)}
+    assert layout == {a: (0, 1), b: (0, 1), c: (0, 1)}
+
+
+def test_invalid_times_are_rejected(store):
+    with pytest.raises(ValueError):
+        store.add_event(date(2025, 11, 3), "A", "", "trabajo", start=time(12), end=time(11))
+    with pytest.raises(TypeError):
+        store.add_event(date(2025, 11, 3), "A", "", "trabajo", start=time(12))
+
+# --------------------------------------------------
+# ------------------- [BÚSQUEDA] -------------------
+# --------------------------------------------------
+def test_search_matches_prefixes_without_accents(store):
+    store.add_event(date(2025, 11, 1), "Dentista", "revisión anual", "ocio")
+    store.add_event(date(2025, 11, 2), "Reunión", "", "trabajo")
+    assert [ev["name"] for _, ev in store.search_events("dent")] == ["Dentista"]
+    assert [ev["name"] for _, ev in store.search_events("REVISION")] == ["Dentista"]
+    assert [ev["name"] for _, ev in store.search_events("reunion", tag="trabajo")] == ["Reunión"]
+    assert store.search_events("dent reunion") == []
+
+
+def test_search_index_follows_edits(store):
+    event_id = store.add_event(date(2025, 11, 1), "Dentista", "", "ocio")
+    store.update_event(event_id, name="Peluquería")
+    assert store.search_events("dentista") == []
+    assert len(store.search_events("pelu")) == 1
+    store.remove_event_by_id(event_id)
+    assert store.search_events("pelu") == []
+
+
+def test_search_rank_prefers_name_matches(store):
+    store.add_event(date(2025, 11, 1), "Llamar", "sobre el informe", "trabajo")
+    store.add_event(date(2025, 11, 2), "Informe", "", "trabajo")
+    assert [ev["name"] for _, ev in store.search_events("informe", order="rank")] == ["Informe", "Llamar"]
+
+
+def test_search_includes_rule_occurrences(store):
+    store.add_recurrence(date(2025, 11, 3), "Standup", "", "trabajo", freq="daily", count=3)
+    store.add_event(date(2025, 11, 4), "Standup retro", "", "trabajo")
+    found = store.search_events("standup", end=date(2025, 11, 30))
+    assert [(d.day, ev["name"]) for d, ev in found] == [(3, "Standup"), (4, "Standup retro"), (4, "Standup"), (5, "Standup")]
+
+
+def test_search_finds_rules_without_stored_matches(store):
+    store.add_recurrence(date(2025, 11, 3), "Standup", "", "trabajo", freq="weekly", by_weekday=range(5))
+    store.add_event_range(date(2025, 11, 10), date(2025, 11, 12), "Congreso", "", "trabajo")
+    store.add_event(date(2025, 11, 4), "Dentista", "", "ocio")
+
+    found = store.search_events("standup", end=date(2025, 11, 9))
+    assert [d.day for d, _ in found] == [3, 4, 5, 6, 7]
+    assert [d.day for d, _ in store.search_events("congreso")] == [10, 11, 12]
+    assert store.search_events("standup dentista", end=date(2025, 11, 9)) == []
+
+def test_subscription_window_filters_changes(store):
+    changes = []
+    store.subscribe(changes.append, window=lambda: [(date(2025, 11, 1), date(2025, 11, 30))])
+    store.add_event(date(2025, 12, 5), "Fuera", "", "trabajo")
+    store.add_event(date(2025, 11, 5), "Dentro", "", "trabajo")
+    assert [change.dates for change in changes] == [{date(2025, 11, 5)}]
@@ -0,0 +1,50 @@
+from datetime import date, time
+
+import pytest
+
+from event_store import EventStore
+
+
+def _snapshot(store):
+    """Eventos (sin ids, que se reasignan al importar), tags y reglas de un store."""
+    events = sorted((d.isoformat(), ev["name"], ev["desc"], ev["tag"], ev.get("start"), ev.get("end"))
+                    for d, ev in store.get_events_between(date(2000, 1, 1), date(2030, 12, 31)) if "rule" not in ev)
+    rules = sorted((r["name"], r["tag"], r["freq"], r["start"]) for r in store.get_recurrences().values())
+    return events, store.tags, rules
+
+
+@pytest.fixture
+def store():
+    store = EventStore()
+    store.add_tag("trabajo", color="#3A7FF6", desc="Oficina")
+    store.add_tag("ocio", color="#F63A7F", visible=False)
+    store.add_event(date(2025, 11, 1), "Reunión", "con \"comillas\" y ñ", "trabajo")
+    store.add_event(date(2025, 11, 1), "Cine", "", "ocio", start=time(20), end=time(22, 30))
+    store.add_event(date(2024, 2, 29), "Bisiesto", "línea\nnueva", "ocio")
+    store.add_recurrence(date(2025, 1, 6), "Standup", "", "trabajo", freq="weekly", by_weekday=range(5), until=date(2025, 3, 1))
+    return store
+
+
+@pytest.mark.parametrize("filename, compact", [("eventos.json", False), ("eventos.json", True), ("eventos.jsonl", False)])
+def test_round_trip(store, tmp_path, filename, compact):
+    path = str(tmp_path / filename)
+    store.export_events(path, compact=compact)
+
+    copy = EventStore()
+    assert copy.import_events(path) == 3
+    assert _snapshot(copy) == _snapshot(store)
+    assert copy.get_overlapping(date(2025, 11, 1), time(21), time(21, 30), as_dict=False)[0].name == "Cine"
+
+
+def test_import_reports_progress(store, tmp_path):
+    path = str(tmp_path / "eventos.jsonl")
+    store.export_events(path)
+    calls = []
+    EventStore().import_events(path, progress=lambda *args: calls.append(args), progress_every=2)
+    assert [call[0] for call in calls] == [2, 3]
+    assert calls[-1][1] == calls[-1][2]
+
+
+def test_unknown_format_is_rejected(store, tmp_path):
+    with pytest.raises(ValueError):
+        store.export_events(str(tmp_path / "eventos.csv"), fmt="csv")
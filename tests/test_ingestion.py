@@ -0,0 +1,115 @@
+import queue
+import threading
+from datetime import date
+
+import pytest
+
+import ingestion
+from event_store import EventStore
+from ingestion import EventIngestor
+from instrumentation import Instrumentation
+
+
+class FakeCalendar:
+    """Lo que usa EventIngestor de un CTkCalendar: `after` (que solo anota la llamada), el store y las métricas."""
+
+    def __init__(self):
+        self.event_store = EventStore()
+        self.event_store.add_tag("sync")
+        self.metrics = Instrumentation()
+        self.jobs = []  # [(ms, callback)]
+        self.cancelled = []
+
+    def after(self, ms, callback):
+        self.jobs.append((ms, callback))
+        return len(self.jobs)
+
+    def after_cancel(self, job):
+        self.cancelled.append(job)
+
+    def run_next(self):
+        ms, callback = self.jobs[-1]
+        callback()
+        return ms
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Reloj falso: cada lectura avanza 1 ms, así que una porción de 3 ms aplica dos operaciones."""
+    now = [0.0]
+
+    def perf_counter():
+        now[0] += 0.001
+        return now[0]
+    monkeypatch.setattr(ingestion.time, "perf_counter", perf_counter)
+    return now
+
+
+def test_queue_is_drained_in_slices(clock):
+    calendar = FakeCalendar()
+    changes = []
+    calendar.event_store.subscribe(changes.append)
+    ingestor = EventIngestor(calendar, slice_ms=3, interval_ms=15, idle_interval_ms=50)
+    for day in range(1, 6):
+        ingestor.add_event(date(2025, 11, day), f"Evento {day}", "", "sync")
+    ingestor.start()
+    assert calendar.jobs[0][0] == 50 and ingestor.pending == 5
+
+    delays = [calendar.run_next() for _ in range(3)]
+    assert ingestor.applied == 5 and ingestor.pending == 0
+    assert [len(change.dates) for change in changes] == [2, 2, 1]  # un batch (un repintado) por porción
+    assert [ms for ms, _ in calendar.jobs[1:]] == [15, 15, 50]  # con la cola vacía vuelve al sondeo lento
+    assert delays == [50, 15, 15]
+
+    ingestor.stop()
+    assert calendar.cancelled == [len(calendar.jobs)]
+
+
+def test_submit_blocks_when_the_queue_is_full():
+    calendar = FakeCalendar()
+    ingestor = EventIngestor(calendar, max_pending=2)
+    ingestor.add_event(date(2025, 11, 1), "A", "", "sync")
+    ingestor.add_event(date(2025, 11, 2), "B", "", "sync")
+    with pytest.raises(queue.Full):
+        ingestor.add_event(date(2025, 11, 3), "C", "", "sync", timeout=0.01)
+
+    producer = threading.Thread(target=ingestor.add_event, args=(date(2025, 11, 3), "C", "", "sync"))
+    producer.start()
+    producer.join(0.05)
+    assert producer.is_alive()  # esperando hueco en la cola
+    ingestor.stop(drain=True)  # vacía la cola: el productor encola "C"
+    producer.join(1)
+    assert not producer.is_alive()
+    ingestor.stop(drain=True)
+    assert len(calendar.event_store.get_events_between(date(2025, 11, 1), date(2025, 11, 3))) == 3
+
+
+def test_errors_are_routed_and_do_not_stop_the_queue():
+    calendar = FakeCalendar()
+    done, failed = [], []
+    ingestor = EventIngestor(calendar, on_done=lambda op, result: done.append(op[0]),
+                             on_error=lambda op, exc: failed.append((op[0], type(exc))))
+    ingestor.add_event(date(2025, 11, 1), "A", "", "inexistente")
+    ingestor.update_event(999, name="B")
+    ingestor.add_event(date(2025, 11, 2), "C", "", "sync")
+    ingestor.stop(drain=True)
+    assert failed == [("add_event", ValueError), ("update_event", KeyError)]
+    assert done == ["add_event"]
+    assert ingestor.applied == 3
+
+
+def test_errors_are_kept_without_on_error():
+    calendar = FakeCalendar()
+    ingestor = EventIngestor(calendar)
+    ingestor.remove_event_by_id(1)
+    ingestor.move_event(1, date(2025, 11, 2))
+    ingestor.stop(drain=True)
+    assert [(op[0], type(exc)) for op, exc in ingestor.errors] == [("move_event", KeyError)]
+
+
+def test_unknown_operations_and_sizes_are_rejected():
+    ingestor = EventIngestor(FakeCalendar())
+    with pytest.raises(ValueError):
+        ingestor.submit("export_events", "eventos.json")
+    with pytest.raises(ValueError):
+        EventIngestor(FakeCalendar(), max_pending=0)
@@ -0,0 +1,38 @@
+from instrumentation import Histogram, Instrumentation
+
+
+def test_disabled_instrumentation_measures_nothing():
+    metrics = Instrumentation()
+    started = metrics.start()
+    assert started is None
+    metrics.stop("fill_calendar", started)
+    assert metrics.snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_counters_timings_and_callback():
+    seen = []
+    metrics = Instrumentation()
+    metrics.enable(lambda kind, name, value: seen.append((kind, name)))
+    metrics.count("configure_calls", 3)
+    metrics.count("configure_calls")
+    metrics.stop("fill_calendar", metrics.start())
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"] == {"configure_calls": 4}
+    assert snapshot["histograms"]["fill_calendar"]["count"] == 1
+    assert seen == [("count", "configure_calls"), ("count", "configure_calls"), ("timing", "fill_calendar")]
+
+    metrics.reset()
+    metrics.disable()
+    assert metrics.snapshot() == {"counters": {}, "histograms": {}} and metrics.start() is None
+
+
+def test_histogram_buckets():
+    histogram = Histogram()
+    for ms in (0.05, 0.1, 3, 2000):
+        histogram.observe(ms)
+    data = histogram.to_dict()
+    assert data["buckets"]["<=0.1"] == 2
+    assert data["buckets"]["<=5"] == 1
+    assert data["buckets"][">1000"] == 1
+    assert data["max_ms"] == 2000 and data["count"] == 4
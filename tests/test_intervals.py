@@ -0,0 +1,74 @@
+import random
+from datetime import date, timedelta
+
+from intervals import DateRanges, DayIntervals, layout_intervals
+
+
+def _overlaps(a, b):
+    return a[0] < b[1] and b[0] < a[1]
+
+
+def test_day_intervals_overlapping_matches_brute_force():
+    rng = random.Random(7)
+    intervals = DayIntervals()
+    items = []
+    for event_id in range(300):
+        start = rng.randrange(0, 1380)
+        end = start + rng.randrange(5, 240)
+        intervals.add(start, end, event_id)
+        items.append((start, end, event_id))
+    for event_id in range(0, 300, 3):
+        start, end, _ = items[event_id]
+        intervals.remove(start, end, event_id)
+    items = [item for item in items if item[2] % 3]
+
+    for _ in range(200):
+        start = rng.randrange(0, 1440)
+        end = start + rng.randrange(1, 180)
+        expected = {event_id for s, e, event_id in items if _overlaps((s, e), (start, end))}
+        assert set(intervals.overlapping(start, end)) == expected
+
+
+def test_layout_never_shares_a_column_between_overlapping_intervals():
+    rng = random.Random(11)
+    items = sorted((s, s + rng.randrange(15, 180), i) for i, s in enumerate(rng.randrange(0, 1300) for _ in range(200)))
+    layout = layout_intervals(items)
+    for a in items:
+        column, columns = layout[a[2]]
+        assert 0 <= column < columns
+        for b in items:
+            if a[2] != b[2] and _overlaps(a, b):
+                assert layout[b[2]][0] != column
+
+
+def test_layout_groups_are_independent():
+    layout = layout_intervals([(0, 60, 1), (30, 90, 2), (120, 180, 3)])
+    assert layout == {1: (0, 2), 2: (1, 2), 3: (0, 1)}
+
+
+def test_date_ranges_matches_a_set():
+    rng = random.Random(3)
+    for _ in range(100):
+        ranges, expected = DateRanges(), set()
+        for _ in range(30):
+            a = date(2025, 1, 1) + timedelta(days=rng.randrange(60))
+            b = a + timedelta(days=rng.randrange(-10, 10))
+            days = {min(a, b) + timedelta(days=i) for i in range(abs((b - a).days) + 1)}
+            if rng.random() < 0.6:
+                ranges.add(a, b)
+                expected |= days
+            else:
+                ranges.remove(a, b)
+                expected -= days
+            assert set(ranges.dates()) == expected
+            assert len(ranges) == len(expected)
+        for start, next_start, end in zip(ranges.starts, ranges.starts[1:], ranges.ends):
+            assert next_start > end + timedelta(days=1)  # sin intervalos contiguos ni solapados
+
+
+def test_date_ranges_merges_adjacent_ranges():
+    ranges = DateRanges([(date(2025, 3, 1), date(2025, 3, 5)), (date(2025, 3, 6), date(2025, 3, 9))])
+    assert ranges.ranges() == [(date(2025, 3, 1), date(2025, 3, 9))]
+    ranges.remove(date(2025, 3, 4), date(2025, 3, 4))
+    assert ranges.ranges() == [(date(2025, 3, 1), date(2025, 3, 3)), (date(2025, 3, 5), date(2025, 3, 9))]
+    assert date(2025, 3, 5) in ranges and date(2025, 3, 4) not in ranges
@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+from datetime import date
+
+import pytest
+
+from calendar_view import add_months
+from locale_data import LocaleData, get_locale_data, register_locale
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MONTHS = [""] + ["enero", "febrero", "marzo", "abril", "mayo", "junio", "julio", "agosto", "septiembre", "octubre",
+                 "noviembre", "diciembre"]
+DAYS = ["lun", "mar", "mié", "jue", "vie", "sáb", "dom"]
+
+
+def test_registered_locale_does_not_import_babel():
+    # En un proceso aparte: en este, otra prueba puede haber importado ya babel
+    code = ("import sys, locale_data\n"
+            f"locale_data.register_locale('es_test', {MONTHS!r}, {DAYS!r}, 0)\n"
+            "assert locale_data.get_locale_data('es_test').month_names[3] == 'marzo'\n"
+            "assert 'babel' not in sys.modules\n")
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+
+
+def test_locale_tables_are_cached():
+    data = register_locale("xx_test", MONTHS, DAYS, 0)
+    assert get_locale_data("xx_test") is data
+    assert data.day_names_abbr[6] == "dom" and data.first_weekday == 0
+
+
+def test_babel_tables_are_built_once():
+    pytest.importorskip("babel")
+    data = get_locale_data("es")
+    assert get_locale_data("es") is data
+    assert len(data.month_names) == 13 and len(data.day_names_abbr) == 7
+
+
+def test_invalid_tables_are_rejected():
+    with pytest.raises(ValueError):
+        LocaleData(MONTHS[1:], DAYS)
+    with pytest.raises(ValueError):
+        LocaleData(MONTHS, DAYS, first_weekday=7)
+
+
+@pytest.mark.parametrize("start, months, expected", [
+    (date(2025, 1, 31), 1, date(2025, 2, 28)),
+    (date(2024, 1, 31), 1, date(2024, 2, 29)),
+    (date(2025, 3, 31), -1, date(2025, 2, 28)),
+    (date(2025, 12, 15), 1, date(2026, 1, 15)),
+    (date(2025, 1, 15), -1, date(2024, 12, 15)),
+    (date(2024, 2, 29), 12, date(2025, 2, 28)),
+    (date(2025, 5, 31), -27, date(2023, 2, 28)),
+])
+def test_add_months_clamps_the_day(start, months, expected):
+    assert add_months(start, months) == expected
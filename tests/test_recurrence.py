@@ -0,0 +1,86 @@
+from datetime import date
+
+import pytest
+
+from event_store import EventStore
+from recurrence import RecurrenceRule
+
+
+def test_weekly_rule_by_weekday():
+    rule = RecurrenceRule(date(2025, 1, 6), "weekly", by_weekday={0, 2, 4})
+    assert list(rule.occurrences(date(2025, 1, 6), date(2025, 1, 12))) == [date(2025, 1, 6), date(2025, 1, 8), date(2025, 1, 10)]
+    assert rule.last is None
+
+
+def test_count_and_exceptions():
+    rule = RecurrenceRule(date(2025, 1, 1), "daily", interval=2, count=4, exceptions={date(2025, 1, 3)})
+    assert list(rule.occurrences(date(2025, 1, 1), date(2025, 12, 31))) == [date(2025, 1, 1), date(2025, 1, 5), date(2025, 1, 7)]
+    assert rule.last == date(2025, 1, 7)
+    assert not rule.occurs_on(date(2025, 1, 3))
+
+
+def test_monthly_rule_skips_short_months():
+    rule = RecurrenceRule(date(2025, 1, 31), "monthly", until=date(2025, 6, 30))
+    assert [d.month for d in rule.occurrences(date(2025, 1, 1), date(2025, 6, 30))] == [1, 3, 5]
+
+
+def test_rule_round_trips_through_dict():
+    rule = RecurrenceRule(date(2025, 1, 6), "weekly", interval=2, by_weekday={1, 3}, until=date(2025, 3, 1), exceptions={date(2025, 1, 7)})
+    copy = RecurrenceRule.from_dict(rule.to_dict())
+    window = (date(2025, 1, 1), date(2025, 3, 31))
+    assert list(copy.occurrences(*window)) == list(rule.occurrences(*window))
+
+
+def test_invalid_rules_are_rejected():
+    with pytest.raises(ValueError):
+        RecurrenceRule(date(2025, 1, 1), "hourly")
+    with pytest.raises(ValueError):
+        RecurrenceRule(date(2025, 1, 1), "monthly", by_weekday={0})
+    with pytest.raises(ValueError):
+        RecurrenceRule(date(2025, 1, 6), "daily", interval=7, by_weekday={1})
+
+
+def test_store_expands_rules_only_in_the_window():
+    store = EventStore()
+    store.add_tag("trabajo")
+    rule_id = store.add_recurrence(date(2025, 1, 6), "Standup", "", "trabajo", freq="weekly", by_weekday=range(5))
+    assert len(store.get_events_between(date(2025, 1, 6), date(2025, 1, 12))) == 5
+    assert store.get_events(date(2025, 1, 11)) == []
+
+    store.remove_event(date(2025, 1, 7), "Standup")
+    assert store.get_events(date(2025, 1, 7)) == []
+    assert store.get_events(date(2025, 1, 8))[0]["rule"] == rule_id
+
+    store.update_event(rule_id, name="Daily", series=True)
+    assert store.get_events(date(2025, 1, 8))[0]["name"] == "Daily"
+    assert store.remove_recurrence(rule_id)
+    assert store.get_events(date(2025, 1, 8)) == []
+
+
+def test_occurrence_ids_do_not_edit_the_whole_series_by_accident():
+    store = EventStore()
+    store.add_tag("trabajo")
+    store.add_recurrence(date(2025, 1, 6), "Standup", "", "trabajo", freq="weekly")
+    occurrence = store.get_events(date(2025, 1, 13))[0]
+    with pytest.raises(ValueError):
+        store.remove_event_by_id(occurrence["id"])
+    with pytest.raises(ValueError):
+        store.update_event(occurrence["id"], name="Daily")
+    with pytest.raises(ValueError):
+        store.move_event(occurrence["id"], date(2025, 1, 14))
+    assert [ev["name"] for _, ev in store.get_events_between(date(2025, 1, 6), date(2025, 1, 20))] == ["Standup"] * 3
+
+    assert store.remove_event_by_id(occurrence["rule"], series=True)
+    assert not store.rules and not store.remove_event_by_id(occurrence["rule"])
+
+
+def test_range_helpers_are_stored_as_rules():
+    store = EventStore()
+    store.add_tag("salud")
+    store.add_tag("trabajo")
+    store.add_recurring_event(date(2025, 11, 1), date(2025, 11, 15), 3, "Ir al gimnasio", "", "salud")
+    store.add_event_range(date(2025, 11, 20), date(2025, 11, 21), "Congreso", "", "trabajo")
+    days = [d.day for d, _ in store.get_events_between(date(2025, 11, 1), date(2025, 11, 30))]
+    assert days == [1, 4, 7, 10, 13, 20, 21]
+    assert store.events == {}
+    assert list(store.get_events_by_tag("trabajo", end=date(2025, 12, 31))) == [date(2025, 11, 20), date(2025, 11, 21)]
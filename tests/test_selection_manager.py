@@ -0,0 +1,67 @@
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from instrumentation import Instrumentation
+from selection_manager import SelectionManager
+
+
+class FakeCell:
+    def __init__(self, date_obj):
+        self.date = date_obj
+        self.configured = 0
+
+    def configure(self, **options):
+        self.configured += 1
+
+
+def _manager():
+    first = date(2025, 2, 23)  # cuadrícula de marzo de 2025, empezando en domingo
+    cells = {first + timedelta(days=i): FakeCell(first + timedelta(days=i)) for i in range(42)}
+    calendar = SimpleNamespace(calendar_view=SimpleNamespace(date_to_cell=cells), metrics=Instrumentation(),
+                               current_year=2025, current_month=3)
+    return SelectionManager(calendar), cells
+
+
+def _selected(cells):
+    return sorted(d for d, cell in cells.items() if getattr(cell, "is_selected", False))
+
+
+def test_drag_reconfigures_only_the_cells_that_change():
+    selection, cells = _manager()
+    seen = []
+    selection.subscribe(seen.append)
+    selection.press(date(2025, 3, 3))
+    for day in range(4, 15):
+        selection.drag(date(2025, 3, day))
+    selection.drag(date(2025, 3, 10))  # volver atrás solo deselecciona del 11 al 14
+    selection.release()
+
+    assert _selected(cells) == [date(2025, 3, day) for day in range(3, 11)]
+    assert sum(cell.configured for cell in cells.values()) == 12 + 4
+    assert seen == [[(date(2025, 3, 3), date(2025, 3, 10))]]  # una sola notificación, al soltar
+
+
+def test_shift_and_ctrl_clicks():
+    selection, cells = _manager()
+    selection.press(date(2025, 3, 3))
+    selection.release()
+    selection.press(date(2025, 3, 6), "extend")
+    selection.release()
+    selection.press(date(2025, 3, 20), "toggle")
+    selection.release()
+    selection.press(date(2025, 3, 4), "toggle")
+    selection.release()
+    assert selection.get_selection() == [(date(2025, 3, 3), date(2025, 3, 3)), (date(2025, 3, 5), date(2025, 3, 6)),
+                                         (date(2025, 3, 20), date(2025, 3, 20))]
+    assert _selected(cells) == [date(2025, 3, 3), date(2025, 3, 5), date(2025, 3, 6), date(2025, 3, 20)]
+
+
+def test_selection_outlives_the_visible_month():
+    selection, cells = _manager()
+    selection.select_range(date(2025, 3, 25), date(2025, 5, 2))
+    assert selection.is_selected(date(2025, 4, 15))
+    assert _selected(cells) == [date(2025, 3, 25) + timedelta(days=i) for i in range(12)]  # la cuadrícula acaba el 5 de abril
+    selection.press(date(2025, 4, 2))  # fuera del mes mostrado: no cambia nada
+    assert selection.get_selection() == [(date(2025, 3, 25), date(2025, 5, 2))]
+    selection.clear_selection()
+    assert _selected(cells) == [] and selection.get_selection() == []
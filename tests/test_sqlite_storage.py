@@ -0,0 +1,191 @@
+import sqlite3
+import threading
+from concurrent.futures import Future
+from datetime import date, time, timedelta
+
+import pytest
+
+from event_provider import EventProvider, month_bounds
+from event_store import EventStore
+from sqlite_storage import SQLiteStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = SQLiteStorage(str(tmp_path / "eventos.db"))
+    storage.add_tag("trabajo", color="#3A7FF6", desc="Oficina")
+    storage.add_tag("ocio", visible=False)
+    yield storage
+    storage.close()
+
+
+def test_windowed_loads(storage):
+    storage.add_events((date(2025, 1, 1) + timedelta(days=i), f"Turno {i}", "", "trabajo") for i in range(365))
+    window = storage.load_window(date(2025, 3, 1), date(2025, 3, 31))
+    assert [ev["date"] for ev in window] == [date(2025, 3, day) for day in range(1, 32)]
+    assert window[0]["name"] == "Turno 59" and window[0]["tag"] == "trabajo"
+    assert storage.count_events() == 365
+    assert storage.count_events(date(2025, 12, 1)) == 31
+    assert storage.load_window(date(2026, 1, 1), date(2026, 1, 31)) == []
+
+
+def test_data_survives_reopening(storage):
+    storage.add_event(date(2025, 11, 3), "Reunión", "sala 2", "trabajo")
+    reopened = SQLiteStorage(storage.path)
+    assert reopened.get_tags() == {"trabajo": {"color": "#3A7FF6", "desc": "Oficina", "visible": True},
+                                   "ocio": {"color": "#3A7FF6", "desc": "", "visible": False}}
+    assert [ev["desc"] for ev in reopened.load_window(date(2025, 11, 1), date(2025, 11, 30))] == ["sala 2"]
+    reopened.close()
+
+
+def test_bulk_insert_is_rolled_back_on_an_invalid_row(storage):
+    rows = [(date(2025, 1, 1), "A", "", "trabajo"), (date(2025, 1, 2), "B", "", "inexistente")]
+    with pytest.raises(sqlite3.IntegrityError):  # tag desconocido: lo rechaza la clave foránea a mitad del lote
+        storage.add_events(rows)
+    with pytest.raises(ValueError):
+        storage.add_events([(date(2025, 1, 1), "A", "", "trabajo"), (date(2025, 1, 2), "", "", "trabajo")])
+    assert storage.count_events() == 0
+
+
+def test_writes_notify_the_affected_dates(storage):
+    changes = []
+    storage.subscribe(changes.append)
+    event_id = storage.add_event(date(2025, 11, 3), "Reunión", "", "trabajo")
+    storage.add_events([(date(2025, 11, 4), "A", "", "ocio"), {"date": date(2025, 11, 5), "name": "B", "tag": "ocio"}])
+    storage.update_event(event_id, name="Comité", date_obj=date(2025, 11, 10))
+    assert storage.remove_event(event_id)
+    assert not storage.remove_event(event_id)
+    storage.remove_tag("ocio")
+    assert changes == [{date(2025, 11, 3)}, {date(2025, 11, 4), date(2025, 11, 5)}, {date(2025, 11, 3), date(2025, 11, 10)},
+                       {date(2025, 11, 10)}, {date(2025, 11, 4), date(2025, 11, 5)}]
+
+    storage.unsubscribe(changes.append)
+    storage.add_event(date(2025, 11, 3), "Otra", "", "trabajo")
+    assert len(changes) == 5
+    with pytest.raises(KeyError):
+        storage.update_event(999, name="X")
+
+
+def test_loads_from_another_thread(storage):
+    storage.add_events((date(2025, 1, 1) + timedelta(days=i), "Turno", "", "trabajo") for i in range(100))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(len(storage.load_window(date(2025, 1, 1), date(2025, 1, 31)))))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [31] * 4
+
+
+def test_timed_events_round_trip(storage):
+    event_id = storage.add_event(date(2025, 11, 3), "Reunión", "", "trabajo", time(9, 0), time(10, 30))
+    storage.add_events([{"date": date(2025, 11, 3), "name": "Todo el día", "tag": "trabajo"}])
+    storage.update_event(event_id, start=time(11, 0), end=time(12, 0))
+    window = storage.load_window(date(2025, 11, 3), date(2025, 11, 3))
+    assert [(ev["start"], ev["end"]) for ev in window] == [(time(11, 0), time(12, 0)), (None, None)]
+    with pytest.raises(ValueError):
+        storage.add_event(date(2025, 11, 3), "Al revés", "", "trabajo", time(10, 0), time(9, 0))
+
+
+def test_old_databases_get_the_time_columns(tmp_path):
+    path = str(tmp_path / "antigua.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("CREATE TABLE tags (name TEXT PRIMARY KEY, color TEXT NOT NULL, description TEXT NOT NULL DEFAULT '',"
+                       " visible INTEGER NOT NULL DEFAULT 1);"
+                       "CREATE TABLE events (id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT NOT NULL, name TEXT NOT NULL,"
+                       " description TEXT NOT NULL DEFAULT '', tag TEXT NOT NULL REFERENCES tags(name));"
+                       "INSERT INTO tags (name, color) VALUES ('trabajo', '#3A7FF6');"
+                       "INSERT INTO events (date, name, tag) VALUES ('2025-11-03', 'Reunión', 'trabajo');")
+    conn.close()
+    storage = SQLiteStorage(path)
+    assert storage.load_window(date(2025, 11, 3), date(2025, 11, 3))[0]["start"] is None
+    storage.close()
+
+
+def test_save_store_keeps_times_and_refuses_rules(storage):
+    store = EventStore()
+    store.add_tag("trabajo")
+    store.add_event(date(2025, 11, 3), "Reunión", "", "trabajo", time(9, 0), time(10, 0))
+    storage.save_store(store)
+    assert storage.load_window(date(2025, 11, 3), date(2025, 11, 3))[0]["end"] == time(10, 0)
+
+    store.add_recurrence(date(2025, 11, 3), "Standup", "", "trabajo", freq="weekly")
+    with pytest.raises(ValueError):
+        storage.save_store(store)
+    assert storage.count_events() == 1
+
+
+class AttachedCalendar:
+    """Lo que usan EventManager y EventProvider de un CTkCalendar con un storage conectado (sin Tk)."""
+
+    def __init__(self, storage, fake_calendar):
+        from event_manager import EventManager
+        self.__dict__.update(vars(fake_calendar))
+        self.event_store = EventStore()
+        for name, info in storage.get_tags().items():
+            self.event_store.add_tag(name, color=info["color"], visible=info["visible"])
+        self.event_manager = EventManager(self, self.event_store)
+        self.storage = storage
+        self.jobs = []
+        self.event_provider = EventProvider(self, storage.load_window, prefetch_months=0)
+        self.event_provider._submit = self._load_now
+        storage.subscribe(self.event_provider.invalidate_dates)
+
+    def _load_now(self, start, end):
+        future = Future()
+        future.set_result(self.storage.load_window(start, end))
+        return future
+
+    def after(self, ms, callback):
+        self.jobs.append(callback)
+        return len(self.jobs)
+
+    def after_cancel(self, job):
+        pass
+
+    def show(self, year, month):
+        self.event_provider.show(*month_bounds(year, month))
+        while self.jobs:
+            self.jobs.pop(0)()
+
+    def names(self, date_obj):
+        return [ev["name"] for ev in self.event_manager.get_events(date_obj)]
+
+
+def test_manager_edits_of_loaded_events_reach_the_storage(storage, fake_calendar):
+    storage.add_events([(date(2025, 11, 3), "Reunión", "", "trabajo"), (date(2025, 11, 3), "Comida", "", "trabajo"),
+                        (date(2025, 11, 4), "Revisión", "", "trabajo")])
+    calendar = AttachedCalendar(storage, fake_calendar)
+    manager = calendar.event_manager
+
+    def loaded_id(name):
+        # Cada escritura recarga el mes, así que los ids del store se vuelven a leer tras recargarlo
+        calendar.show(2025, 11)
+        return next(ev["id"] for _, ev in manager.get_events_between(date(2025, 11, 1), date(2025, 11, 30)) if ev["name"] == name)
+
+    assert manager.remove_event_by_id(loaded_id("Reunión"))
+    manager.update_event(loaded_id("Comida"), name="Almuerzo", start=time(13, 0), end=time(14, 0))
+    manager.move_event(loaded_id("Revisión"), date(2025, 11, 5))
+    calendar.show(2025, 11)
+    assert calendar.names(date(2025, 11, 3)) == ["Almuerzo"] and calendar.names(date(2025, 11, 5)) == ["Revisión"]
+
+    # Tras descartar la caché y recargar todo, los cambios siguen ahí: se guardaron en la base
+    calendar.event_provider.invalidate()
+    calendar.show(2025, 11)
+    assert calendar.names(date(2025, 11, 3)) == ["Almuerzo"] and calendar.names(date(2025, 11, 4)) == []
+    assert storage.load_window(date(2025, 11, 3), date(2025, 11, 3))[0]["start"] == time(13, 0)
+
+    assert manager.remove_event(date(2025, 11, 3), "Almuerzo")
+    calendar.show(2025, 11)
+    assert manager.clear_day(date(2025, 11, 5))
+    assert storage.count_events() == 0
+
+
+def test_manager_refuses_adds_while_storage_is_attached(storage, fake_calendar):
+    calendar = AttachedCalendar(storage, fake_calendar)
+    with pytest.raises(ValueError):
+        calendar.event_manager.add_event(date(2025, 11, 3), "Reunión", "", "trabajo")
+    with pytest.raises(ValueError):
+        calendar.event_manager.add_recurrence(date(2025, 11, 3), "Standup", "", "trabajo")
+    assert storage.count_events() == 0 and not calendar.event_store.rules
@@ -0,0 +1,231 @@
+import datetime
+import tkinter as tk
+import customtkinter as ctk
+from datetime import timedelta
+from calendar_view import add_months
+
+
+class TimelineView:
+    """
+    Vista de semana o de día con los eventos con hora colocados sobre una escala de 24 horas.
+
+    Se dibuja en un tk.Canvas con scroll vertical; los eventos que se solapan se muestran lado a lado según
+    `EventStore.day_layout`. Cada día tiene su propio tag de items en el canvas, así que un cambio en el store
+    solo borra y vuelve a colocar los días afectados. Los eventos de todo el día se cuentan en la cabecera.
+    """
+
+    HOUR_HEIGHT = 40
+    GUTTER = 48  # ancho de la columna de horas
+    HEADER_HEIGHT = 34
+    FIRST_HOUR = 8  # hora que se muestra arriba al abrir la vista
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self.mode = "week"
+        self.date = calendar.current_date
+        self.days: list[datetime.date] = []
+        self.day_width = 100.0
+        self.visible = False
+        self.item_events: dict[int, tuple] = {}  # item del canvas -> (evento, fecha)
+        self.day_items: list[list[int]] = []  # items de eventos de cada día mostrado
+        self.hover_item = None
+        self._build()
+
+    # --------------------------------------------------
+    # ---------------- [CONSTRUCCIÓN] ------------------
+    # --------------------------------------------------
+    def _build(self):
+        cal = self.calendar
+        self.frame = ctk.CTkFrame(master=cal, fg_color=cal.fg_color, corner_radius=0)
+        self.frame.grid_rowconfigure(1, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+
+        background = self._color(cal.days_fg_color or "white")
+        self.text_color = self._color(cal.days_label_text_color or ctk.ThemeManager.theme["CTkLabel"]["text_color"])
+        self.line_color = self._color(cal.disabled_days_fg_color or "gray70")
+        self.font = ctk.CTkFont(size=11)
+
+        self.header = tk.Canvas(master=self.frame, height=self.HEADER_HEIGHT, highlightthickness=0, borderwidth=0, bg=background)
+        self.header.grid(row=0, column=0, sticky="ew")
+        self.body = tk.Canvas(master=self.frame, highlightthickness=0, borderwidth=0, bg=background,
+                              scrollregion=(0, 0, 0, 24 * self.HOUR_HEIGHT))
+        self.body.grid(row=1, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(master=self.frame, command=self.body.yview)
+        self.scrollbar.grid(row=1, column=1, sticky="ns")
+        self.body.configure(yscrollcommand=self.scrollbar.set)
+
+        self.body.bind("<Configure>", self._on_resize)
+        self.body.bind("<Button-1>", self._on_click)
+        self.body.bind("<Motion>", self._on_motion)
+        self.body.bind("<Leave>", self._on_leave)
+        self.body.bind("<MouseWheel>", self._on_wheel)
+        self.body.bind("<Button-4>", self._on_wheel)
+        self.body.bind("<Button-5>", self._on_wheel)
+
+
+    def _color(self, color) -> str:
+        return self.calendar._apply_appearance_mode(color)
+
+    # --------------------------------------------------
+    # ----------------- [NAVEGACIÓN] -------------------
+    # --------------------------------------------------
+    def show(self, mode: str, date_obj: datetime.date):
+        """Muestra la semana (empezando en domingo, como la cuadrícula del mes) o el día de `date_obj`."""
+        self.mode = mode
+        self.frame.grid(row=1, column=0, sticky="nsew")
+        if not self.visible:
+            self.body.yview_moveto(self.FIRST_HOUR / 24)
+        self.visible = True
+        self.set_date(date_obj)
+
+
+    def hide(self):
+        self.frame.grid_remove()
+        self.visible = False
+        self.calendar.tooltip_manager.hide()
+
+
+    def set_date(self, date_obj: datetime.date):
+        self.date = date_obj
+        if self.mode == "week":
+            first = date_obj - timedelta(days=(date_obj.weekday() + 1) % 7)
+            self.days = [first + timedelta(days=i) for i in range(7)]
+        else:
+            self.days = [date_obj]
+        self.calendar.month_label.configure(text=self.calendar.locale_data.month_names[date_obj.month].title())
+        self.calendar.year_label.configure(text=str(date_obj.year))
+        self.redraw()
+
+
+    def shift(self, delta: int):
+        """Avanza o retrocede `delta` semanas (o días en la vista de día)."""
+        self.set_date(self.date + timedelta(days=delta * (7 if self.mode == "week" else 1)))
+
+
+    def shift_years(self, delta: int):
+        self.set_date(add_months(self.date, 12 * delta))
+
+    # --------------------------------------------------
+    # ------------------- [PINTADO] --------------------
+    # --------------------------------------------------
+    def _on_resize(self, event):
+        self.redraw()
+
+
+    def redraw(self):
+        """Redibuja la escala, la cabecera y todos los días."""
+        width = max(self.body.winfo_width(), self.GUTTER + 50)
+        self.day_width = (width - self.GUTTER) / len(self.days)
+
+        self.body.delete("all")
+        self.item_events.clear()
+        self.hover_item = None
+        for hour in range(24):
+            y = hour * self.HOUR_HEIGHT
+            self.body.create_line(self.GUTTER, y, width, y, fill=self.line_color)
+            self.body.create_text(self.GUTTER - 6, y + 2, anchor="ne", text=f"{hour:02d}:00", font=self.font, fill=self.text_color)
+        for i in range(len(self.days) + 1):
+            x = self.GUTTER + i * self.day_width
+            self.body.create_line(x, 0, x, 24 * self.HOUR_HEIGHT, fill=self.line_color)
+
+        self.day_items = [[] for _ in self.days]
+        for i in range(len(self.days)):
+            self._draw_day(i)
+        self._draw_header()
+
+
+    def _draw_header(self):
+        self.header.delete("all")
+        names = self.calendar.locale_data.day_names_abbr
+        em = self.calendar.event_manager
+        for i, date_obj in enumerate(self.days):
+            x = self.GUTTER + (i + 0.5) * self.day_width
+            text = f"{names[date_obj.weekday()].title()} {date_obj.day}"
+            all_day = sum(ev.start is None for ev in em.visible_events(date_obj))
+            if all_day:
+                text += f"\n{all_day} todo el día"
+            self.header.create_text(x, self.HEADER_HEIGHT / 2, text=text, font=self.font, fill=self.text_color, justify="center")
+
+
+    def _draw_day(self, i: int):
+        """Borra y vuelve a colocar los eventos con hora del día i (solo ese día)."""
+        metrics = self.calendar.metrics
+        started = metrics.start()
+        for item in self.day_items[i]:
+            self.body.delete(item)
+            self.item_events.pop(item, None)
+        items = self.day_items[i] = []
+
+        date_obj = self.days[i]
+        em = self.calendar.event_manager
+        left = self.GUTTER + i * self.day_width
+        scale = self.HOUR_HEIGHT / 60
+        for ev, column, columns in em.day_layout(date_obj):
+            width = self.day_width / columns
+            x0 = left + column * width + 1
+            x1 = x0 + width - 2
+            y0 = (ev.start.hour * 60 + ev.start.minute) * scale + 1
+            y1 = (ev.end.hour * 60 + ev.end.minute) * scale - 1
+            color = em.tags.get(ev.tag, {"color": "gray"})["color"]
+            rect = self.body.create_rectangle(x0, y0, x1, y1, fill=color, outline="white")
+            text = self.body.create_text(x0 + 3, y0 + 2, anchor="nw", text=em.event_label(ev), width=max(x1 - x0 - 6, 1),
+                                         font=self.font, fill="white" if color != "white" else "black")
+            items += (rect, text)
+            self.item_events[rect] = self.item_events[text] = (ev, date_obj)
+        metrics.stop("timeline_day_layout", started)
+
+
+    def displayed_range(self) -> tuple[datetime.date, datetime.date]:
+        return self.days[0], self.days[-1]
+
+
+    def on_change(self, change):
+        """Re-coloca solo los días mostrados a los que afecta un cambio del store."""
+        if not self.days:
+            return
+        changed = change.dates_between(self.days[0], self.days[-1])
+        if not changed:
+            return
+        for i, date_obj in enumerate(self.days):
+            if date_obj in changed:
+                self._draw_day(i)
+        self._draw_header()
+
+    # --------------------------------------------------
+    # ------------------- [EVENTOS] --------------------
+    # --------------------------------------------------
+    def _event_at_pointer(self):
+        items = self.body.find_withtag("current")
+        return self.item_events.get(items[0]) if items else None
+
+
+    def _on_click(self, event):
+        found = self._event_at_pointer()
+        if found is not None:
+            self.calendar._event_clicked(*found)
+
+
+    def _on_motion(self, event):
+        items = self.body.find_withtag("current")
+        item = items[0] if items and items[0] in self.item_events else None
+        tooltips = self.calendar.tooltip_manager
+        if item == self.hover_item:
+            tooltips.move(event)
+            return
+        self.hover_item = item
+        tooltips.hide()
+        if item is not None:
+            ev, date_obj = self.item_events[item]
+            tooltips.schedule(self.body, lambda: self.calendar.event_manager.tooltip_text(ev, date_obj))
+
+
+    def _on_leave(self, event):
+        self.hover_item = None
+        self.calendar.tooltip_manager.hide()
+
+
+    def _on_wheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.body.yview_scroll(-1, "units")
+        else:
+            self.body.yview_scroll(1, "units")
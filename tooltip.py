@@ -67,3 +67,91 @@ class ToolTip:
         if self.tooltip_window:
             self.tooltip_window.destroy()
             self.tooltip_window = None
+
+
+class TooltipManager:
+    """
+    Tooltip compartido por todos los widgets de un calendario.
+
+    Mantiene una única ventana flotante que se construye la primera vez y después solo se oculta,
+    se mueve y se re-etiqueta; el texto se pide a un callback al mostrarse, así que no se construye
+    para los widgets sobre los que nunca se pasa el ratón.
+
+    Ejemplo:
+        tooltips = TooltipManager(calendar)
+        tooltips.attach(btn, lambda: f"Detalles de {ev.name}")
+    """
+
+    def __init__(self, master, delay: int = 500, wraplength: int = 250):
+        self.master = master
+        self.delay = delay  # en milisegundos
+        self.wraplength = wraplength
+        self.tooltip_window = None
+        self.label = None
+        self.text = None  # texto mostrado actualmente en la etiqueta
+        self.visible = False
+        self.after_id = None
+
+    def attach(self, widget, text_callback):
+        """Asocia el tooltip a `widget`; `text_callback()` se llama al mostrarlo y debe retornar el texto."""
+        widget.bind("<Enter>", lambda event: self.schedule(widget, text_callback))
+        widget.bind("<Leave>", self.hide)
+        widget.bind("<Motion>", self.move)
+
+    def schedule(self, widget, text_callback):
+        """Programa la aparición del tooltip junto al puntero (útil también para items de un canvas)."""
+        self._cancel()
+        self.after_id = self.master.after(self.delay, lambda: self._show(widget, text_callback))
+
+    def _cancel(self):
+        """Cancela el tooltip pendiente."""
+        if self.after_id:
+            self.master.after_cancel(self.after_id)
+            self.after_id = None
+
+    def _build(self):
+        """Construye (una sola vez) la ventana flotante, oculta."""
+        self.tooltip_window = tw = tk.Toplevel(self.master)
+        tw.withdraw()
+        tw.wm_overrideredirect(True)
+        tw.wm_attributes("-topmost", True)
+
+        frame = ctk.CTkFrame(master=tw, corner_radius=6, fg_color="#2b2b2b")
+        frame.pack(ipadx=8, ipady=4)
+
+        self.label = ctk.CTkLabel(master=frame, text="", justify="left", wraplength=self.wraplength, text_color="white", anchor="center")
+        self.label.pack(expand=True, fill='both')
+
+    def _show(self, widget, text_callback):
+        """Muestra el tooltip con el texto que devuelva el callback."""
+        self.after_id = None
+        text = text_callback()
+        if not text:
+            return
+        if self.tooltip_window is None:
+            self._build()
+        if text != self.text:
+            self.label.configure(text=text)
+            self.text = text
+
+        x, y = widget.winfo_pointerxy()
+        self.tooltip_window.wm_geometry(f"+{x + 12}+{y + 12}")
+        self.tooltip_window.deiconify()
+        self.tooltip_window.lift()
+        self.visible = True
+        metrics = getattr(self.master, "metrics", None)
+        if metrics is not None and metrics.enabled:
+            metrics.count("tooltips_shown")
+
+    def move(self, event):
+        """Recoloca el tooltip si el mouse se mueve mientras está visible."""
+        if self.visible:
+            x, y = event.widget.winfo_pointerxy()
+            self.tooltip_window.wm_geometry(f"+{x + 12}+{y + 12}")
+
+    def hide(self, event=None):
+        """Oculta el tooltip sin destruirlo."""
+        self._cancel()
+        if self.visible:
+            self.tooltip_window.withdraw()
+            self.visible = False
@@ -0,0 +1,113 @@
+import customtkinter as ctk
+
+
+class WidgetPool:
+    """
+    Pool de widgets de eventos de un calendario.
+
+    Cada celda conserva su contenedor de eventos y sus filas (botones) entre meses: al navegar
+    solo se reconfiguran texto y colores y se muestran u ocultan, y únicamente se crean widgets nuevos
+    cuando una celda necesita más filas de las que ha tenido nunca. Tk no permite cambiar el master de un
+    widget, por eso el pool se reparte por celda en lugar de ser una lista global.
+    """
+
+    EVENT_HEIGHT = 22
+    MAX_ROWS = 3  # filas que caben en la celda; si hay más eventos la última se cambia por el chip "+N más"
+    MORE_TEXT = "+{} más"
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self.created = 0  # widgets creados por el pool (para diagnóstico)
+
+
+    def _created(self):
+        self.created += 1
+        if self.calendar.metrics.enabled:
+            self.calendar.metrics.count("widgets_created")
+
+
+    def get_container(self, frame: ctk.CTkFrame) -> ctk.CTkScrollableFrame:
+        """Retorna (y muestra) el contenedor de eventos de la celda, creándolo solo la primera vez."""
+        container = getattr(frame, "events_container", None)
+        if container is None:
+            container = ctk.CTkScrollableFrame(master=frame, corner_radius=6, height=0, fg_color="transparent")
+            container._scrollbar.grid_forget()
+            container._parent_frame.grid_propagate(False)
+            frame.grid_propagate(False)
+            frame.events_container = container
+            frame.event_rows = []
+            frame.rows_shown = 0
+            frame.more_button = None
+            frame.more_shown = 0
+            frame.events_height = None
+            frame.events_shown = False
+            self._created()
+
+        if not frame.events_shown:
+            container.grid(row=1, column=0, sticky="nsew", padx=(3, 4), pady=(0, 3))
+            frame.events_shown = True
+        return container
+
+
+    def get_rows(self, frame: ctk.CTkFrame, count: int, more: int = 0) -> list[ctk.CTkButton]:
+        """
+        Retorna las `count` primeras filas de la celda empaquetadas y oculta el resto.
+        Si `more` > 0 muestra debajo el chip "+N más", que abre la lista completa del día.
+        """
+        container = self.get_container(frame)
+        rows = frame.event_rows
+
+        height = min((count + bool(more)) * self.EVENT_HEIGHT, self.MAX_ROWS * self.EVENT_HEIGHT + 8)
+        if frame.events_height != height:
+            container.configure(height=height)
+            frame.events_height = height
+            if self.calendar.metrics.enabled:
+                self.calendar.metrics.count("configure_calls")
+
+        while len(rows) < count:
+            btn = ctk.CTkButton(master=container, text="", corner_radius=4, height=20, anchor="w")
+            btn.configure(command=lambda b=btn: self.calendar._event_clicked(*b.event_ref))
+            self.calendar.tooltip_manager.attach(btn, lambda b=btn: self.calendar.event_manager.tooltip_text(*b.event_ref))
+            btn.event_state = None
+            btn.event_ref = None
+            rows.append(btn)
+            self._created()
+
+        # Las filas ocultas son siempre un sufijo, así que volver a empaquetarlas conserva el orden;
+        # el chip "+N más" se desempaqueta antes para que quede siempre el último
+        if frame.more_shown and (count > frame.rows_shown or not more):
+            frame.more_button.pack_forget()
+            frame.more_shown = 0
+        for btn in rows[frame.rows_shown:count]:
+            btn.pack(fill="x", pady=1, padx=(0, 5))
+        for btn in rows[count:frame.rows_shown]:
+            btn.pack_forget()
+        frame.rows_shown = count
+
+        if more:
+            self._show_more(frame, container, more)
+        return rows[:count]
+
+
+    def _show_more(self, frame: ctk.CTkFrame, container: ctk.CTkScrollableFrame, more: int):
+        """Muestra el chip "+N más" de la celda, creándolo solo la primera vez."""
+        btn = frame.more_button
+        if btn is None:
+            btn = ctk.CTkButton(master=container, text="", corner_radius=4, height=20, anchor="w",
+                                fg_color="transparent", text_color="gray40", hover_color="gray85")
+            btn.configure(command=lambda f=frame: self.calendar.event_list_popup.open(f.date))
+            frame.more_button = btn
+            self._created()
+
+        if frame.more_shown != more:
+            btn.configure(text=self.MORE_TEXT.format(more))
+            if not frame.more_shown:
+                btn.pack(fill="x", pady=1, padx=(0, 5))
+            frame.more_shown = more
+
+
+    def release(self, frame: ctk.CTkFrame):
+        """Oculta el contenedor de eventos de la celda sin destruirlo."""
+        if getattr(frame, "events_shown", False):
+            frame.events_container.grid_remove()
+            frame.events_shown = False
@@ -0,0 +1,202 @@
+import calendar
+import datetime
+import tkinter as tk
+import customtkinter as ctk
+from bisect import bisect_right
+from datetime import timedelta
+
+
+class YearView:
+    """
+    Vista del año como mapa de calor: los 365 días en un único tk.Canvas, coloreados según su número de eventos visibles.
+
+    Los números salen de los contadores por día y por mes que mantiene el store (`day_counts` / `month_counts`),
+    así que pintar el año no recorre ninguna lista de eventos. Tras un cambio solo se recolorean los días afectados
+    y los totales de sus meses. Un clic en un día abre ese mes en la cuadrícula.
+    """
+
+    COLUMNS = 4  # meses por fila (3 filas)
+    TITLE_HEIGHT = 18
+    NAMES_HEIGHT = 14
+    PAD = 8
+    LEVELS = (1, 3, 6, 10)  # desde cuántos eventos se usa cada color de HEAT_COLORS
+    HEAT_COLORS = ("#c9dcfc", "#8fb5fa", "#5890f7", "#2a5fc0")
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+        self.year = calendar.current_year
+        self.date = calendar.current_date
+        self.visible = False
+        self.counts: dict[datetime.date, int] = {}
+        self.day_items: dict[datetime.date, int] = {}  # fecha -> rectángulo del día
+        self.item_dates: dict[int, datetime.date] = {}  # rectángulo -> fecha
+        self.month_items: dict[int, int] = {}  # mes -> texto del título
+        self.hover_date = None
+        self._build()
+
+    # --------------------------------------------------
+    # ---------------- [CONSTRUCCIÓN] ------------------
+    # --------------------------------------------------
+    def _build(self):
+        cal = self.calendar
+        self.frame = ctk.CTkFrame(master=cal, fg_color=cal.fg_color, corner_radius=0)
+        self.empty_color = self._color(cal.days_fg_color or "white")
+        self.text_color = self._color(cal.days_label_text_color or ctk.ThemeManager.theme["CTkLabel"]["text_color"])
+        self.line_color = self._color(cal.disabled_days_fg_color or "gray70")
+        self.title_font = ctk.CTkFont(size=12, weight="bold")
+        self.font = ctk.CTkFont(size=9)
+
+        self.canvas = tk.Canvas(master=self.frame, highlightthickness=0, borderwidth=0, bg=self._color(cal.fg_color or ctk.ThemeManager.theme["CTkFrame"]["fg_color"]))
+        self.canvas.pack(fill="both", expand=True)
+        self.canvas.bind("<Configure>", self._on_resize)
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", self._on_leave)
+
+
+    def _color(self, color) -> str:
+        return self.calendar._apply_appearance_mode(color)
+
+    # --------------------------------------------------
+    # ----------------- [NAVEGACIÓN] -------------------
+    # --------------------------------------------------
+    def show(self, date_obj: datetime.date):
+        self.frame.grid(row=1, column=0, sticky="nsew")
+        self.visible = True
+        self.set_date(date_obj)
+
+
+    def hide(self):
+        self.frame.grid_remove()
+        self.visible = False
+        self.calendar.tooltip_manager.hide()
+
+
+    def set_date(self, date_obj: datetime.date):
+        self.date = date_obj
+        self.year = date_obj.year
+        self.calendar.month_label.configure(text="")
+        self.calendar.year_label.configure(text=str(self.year))
+        self.redraw()
+
+
+    def shift(self, delta: int):
+        """Avanza o retrocede `delta` años (las flechas de mes y de año hacen lo mismo en esta vista)."""
+        year = self.year + delta
+        self.set_date(self.date.replace(year=year, day=min(self.date.day, calendar.monthrange(year, self.date.month)[1])))
+
+
+    def shift_years(self, delta: int):
+        self.shift(delta)
+
+    # --------------------------------------------------
+    # ------------------- [PINTADO] --------------------
+    # --------------------------------------------------
+    def _on_resize(self, event):
+        self.redraw()
+
+
+    def heat_color(self, count: int) -> str:
+        level = bisect_right(self.LEVELS, count)
+        return self.HEAT_COLORS[level - 1] if level else self.empty_color
+
+
+    def redraw(self):
+        """Crea los items de los 12 meses del año con el tamaño actual del canvas."""
+        metrics = self.calendar.metrics
+        started = metrics.start()
+        em = self.calendar.event_manager
+        self.counts = em.day_counts(datetime.date(self.year, 1, 1), datetime.date(self.year, 12, 31))
+
+        self.canvas.delete("all")
+        self.day_items.clear()
+        self.item_dates.clear()
+        self.month_items.clear()
+        self.hover_date = None
+
+        rows = 12 // self.COLUMNS
+        block_width = max(self.canvas.winfo_width(), 7 * self.COLUMNS * 4) / self.COLUMNS
+        block_height = max(self.canvas.winfo_height(), 6 * rows * 4) / rows
+        size = max(min((block_width - 2 * self.PAD) / 7,
+                       (block_height - 2 * self.PAD - self.TITLE_HEIGHT - self.NAMES_HEIGHT) / 6), 3)
+        names = self.calendar.days_name_abbr
+
+        for month in range(1, 13):
+            row, col = divmod(month - 1, self.COLUMNS)
+            left = col * block_width + (block_width - 7 * size) / 2
+            top = row * block_height + self.PAD
+            self.month_items[month] = self.canvas.create_text(left, top, anchor="nw", font=self.title_font, fill=self.text_color)
+            for j in range(7):
+                self.canvas.create_text(left + (j + 0.5) * size, top + self.TITLE_HEIGHT + self.NAMES_HEIGHT / 2,
+                                        text=names[j][:1].upper(), font=self.font, fill=self.text_color)
+
+            first = datetime.date(self.year, month, 1)
+            offset = (first.weekday() + 1) % 7  # la semana empieza en domingo, como la cuadrícula del mes
+            top += self.TITLE_HEIGHT + self.NAMES_HEIGHT
+            for day in range(calendar.monthrange(self.year, month)[1]):
+                date_obj = first + timedelta(days=day)
+                week, weekday = divmod(offset + day, 7)
+                x0 = left + weekday * size
+                y0 = top + week * size
+                item = self.canvas.create_rectangle(x0 + 1, y0 + 1, x0 + size - 1, y0 + size - 1, outline=self.line_color,
+                                                    fill=self.heat_color(self.counts.get(date_obj, 0)))
+                self.day_items[date_obj] = item
+                self.item_dates[item] = date_obj
+
+        self._update_titles(range(1, 13))
+        metrics.stop("year_view", started)
+
+
+    def _update_titles(self, months):
+        totals = self.calendar.event_manager.month_counts(self.year)
+        month_names = self.calendar.locale_data.month_names
+        for month in months:
+            self.canvas.itemconfigure(self.month_items[month], text=f"{month_names[month].title()} · {totals[month]}")
+
+
+    def displayed_range(self) -> tuple[datetime.date, datetime.date]:
+        return datetime.date(self.year, 1, 1), datetime.date(self.year, 12, 31)
+
+
+    def on_change(self, change):
+        """Recolorea solo los días del año afectados por un cambio y los totales de sus meses."""
+        changed = change.dates_between(datetime.date(self.year, 1, 1), datetime.date(self.year, 12, 31))
+        if not changed:
+            return
+        counts = self.calendar.event_manager.day_counts(min(changed), max(changed))
+        for date_obj in changed:
+            count = counts.get(date_obj, 0)
+            if count != self.counts.get(date_obj, 0):
+                self.counts[date_obj] = count
+                self.canvas.itemconfigure(self.day_items[date_obj], fill=self.heat_color(count))
+        self._update_titles({date_obj.month for date_obj in changed})
+
+    # --------------------------------------------------
+    # ------------------- [EVENTOS] --------------------
+    # --------------------------------------------------
+    def _date_at_pointer(self):
+        items = self.canvas.find_withtag("current")
+        return self.item_dates.get(items[0]) if items else None
+
+
+    def _on_click(self, event):
+        date_obj = self._date_at_pointer()
+        if date_obj is not None:
+            self.calendar.set_view("month", date_obj)
+
+
+    def _on_motion(self, event):
+        date_obj = self._date_at_pointer()
+        tooltips = self.calendar.tooltip_manager
+        if date_obj == self.hover_date:
+            tooltips.move(event)
+            return
+        self.hover_date = date_obj
+        tooltips.hide()
+        if date_obj is not None:
+            tooltips.schedule(self.canvas, lambda: f"{date_obj.isoformat()}: {self.counts.get(date_obj, 0)} eventos")
+
+
+    def _on_leave(self, event):
+        self.hover_date = None
+        self.calendar.tooltip_manager.hide()